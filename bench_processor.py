@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark: HTML → Markdown conversion time and output size
+
+Runs the legacy `descendants` + `+=` converter and the current single-pass
+emitter over a corpus of large pages:
+- synthetic pages of ~100KB / ~1MB / ~5MB with headings, paragraphs,
+  inline code, blockquotes and 3-level nested lists
+- any *.html files in --corpus DIR (e.g. saved Simplenote pages)
+
+Usage:
+    python bench_processor.py [--sizes 100 1000 5000] [--corpus DIR] [--repeat 3]
+
+♠️🌿🎸🧵 G.Music Assembly - Extraction Performance
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from simexp.processor import parse_html, clean_html, CONTENT_SELECTOR, HTML_PARSER
+
+
+def legacy_clean_html(soup):
+    """Original converter (descendants walk + string +=), kept for comparison"""
+    for script in soup(['script', 'style']):
+        script.decompose()
+    target_div = soup.select_one(CONTENT_SELECTOR)
+    if not target_div:
+        return "No content found."
+
+    markdown_content = ""
+    for element in target_div.descendants:
+        if element.name == "h1":
+            markdown_content += f"\n# {element.get_text().strip()}\n\n"
+        elif element.name == "h2":
+            markdown_content += f"\n## {element.get_text().strip()}\n\n\n"
+        elif element.name == "h3":
+            markdown_content += f"\n### {element.get_text().strip()}\n\n\n"
+        elif element.name in ["ul", "ol"]:
+            for li in element.find_all("li"):
+                markdown_content += f"- {li.get_text().strip()}\n"
+            markdown_content += "\n"
+        elif element.name == "blockquote":
+            markdown_content += f"\n> {element.get_text().strip()}\n\n"
+        elif element.name == "p":
+            markdown_content += f"{element.get_text().strip()}\n\n"
+        elif element.name == "code":
+            markdown_content += f"`{element.get_text().strip()}`"
+
+    markdown_content = re.sub(r'\n+', '\n', markdown_content)
+    markdown_content = re.sub(r'(^|\n)(#+)', r'\1\n\2', markdown_content)
+    return markdown_content.strip()
+
+
+def nested_list(depth: int, width: int, label: str) -> str:
+    """<ul> `depth` levels deep with `width` items per level"""
+    items = []
+    for i in range(width):
+        inner = nested_list(depth - 1, width, f"{label}.{i}") if depth > 1 else ""
+        items.append(f"<li><p>Item {label}.{i} with <code>code_{i}</code></p>{inner}</li>")
+    return f"<ul>{''.join(items)}</ul>"
+
+
+def synthetic_page(target_kb: int) -> str:
+    """Page shaped like a Simplenote public note, about target_kb in size"""
+    sections = []
+    size = 0
+    n = 0
+    while size < target_kb * 1024:
+        section = (
+            f"<h2>Section {n}</h2>"
+            "<p>" + f"Paragraph {n} about the session, with <code>inline_{n}</code> and "
+            "enough prose to look like a real note. " * 3 + "</p>"
+            f"<blockquote><p>Quote {n}: keep the rhythm.</p></blockquote>"
+            f"{nested_list(3, 3, str(n))}"
+            f"<h3>Details {n}</h3><p>Closing thoughts for section {n}.</p>"
+        )
+        sections.append(section)
+        size += len(section)
+        n += 1
+    return (
+        "<html><head><title>Benchmark Note</title></head><body>"
+        f"<div><div><div><div><h1>Benchmark</h1>{''.join(sections)}</div></div></div></div>"
+        "</body></html>"
+    )
+
+
+def best_of(repeat: int, html: str, convert) -> float:
+    """Best conversion time of `repeat` runs on a freshly parsed tree, in milliseconds"""
+    best = None
+    for _ in range(repeat):
+        soup = parse_html(html)
+        start = time.perf_counter()
+        convert(soup)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(corpus, repeat):
+    print("♠️🌿🎸🧵 HTML → Markdown Benchmark")
+    print(f"   parser: {HTML_PARSER}")
+    print()
+    print(f"{'page':<24} {'HTML KB':>8} {'legacy ms':>10} {'emitter ms':>11} {'legacy KB':>10} {'emitter KB':>11}")
+    print("-" * 80)
+
+    for name, html in corpus:
+        legacy_out = legacy_clean_html(parse_html(html))
+        new_out = clean_html(parse_html(html))
+        legacy_ms = best_of(repeat, html, legacy_clean_html)
+        new_ms = best_of(repeat, html, clean_html)
+        print(f"{name:<24} {len(html) / 1024:>8.0f} {legacy_ms:>10.1f} {new_ms:>11.1f} "
+              f"{len(legacy_out) / 1024:>10.0f} {len(new_out) / 1024:>11.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark HTML to Markdown conversion')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 5000], help='Synthetic page sizes in KB')
+    parser.add_argument('--corpus', default=None, help='Directory of .html pages to include')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = [(f"synthetic-{kb}KB", synthetic_page(kb)) for kb in args.sizes]
+    if args.corpus:
+        for path in sorted(glob.glob(os.path.join(args.corpus, '*.html'))):
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                corpus.append((os.path.basename(path)[:24], f.read()))
+    run(corpus, args.repeat)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SessionState load/save time by storage format
+
+Measures load, save and single-action append for sessions holding
+1k / 10k / 100k tracked events across:
+- json (pretty)   original indent=2 session.json
+- json (compact)  compact session.json (orjson when installed)
+- sqlite          session.db backend
+
+Usage:
+    python bench_session_state.py [--sizes 1000 10000 100000] [--repeat 3]
+
+♠️🌿🎸🧵 G.Music Assembly - Session State Performance
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from simexp import session_storage
+from simexp.session_manager import initialize_four_directions_session
+from simexp.session_storage import JSONSessionStorage, SQLiteSessionStorage
+
+
+def build_session(events: int) -> dict:
+    """Session with `events` tracked actions spread over South and North"""
+    session = initialize_four_directions_session({
+        'session_id': 'bench-session',
+        'search_key': 'bench-session',
+        'created_at': datetime.now().isoformat(),
+        'ai_assistant': 'claude'
+    })
+    start = datetime.now() - timedelta(days=30)
+    for i in range(events):
+        timestamp = (start + timedelta(seconds=i)).isoformat()
+        if i % 4 == 3:
+            session['north']['reflection_notes'].append({
+                'timestamp': timestamp,
+                'prompt': None,
+                'reflection': f'Reflection number {i} about the session so far'
+            })
+        else:
+            session['south']['content_written'].append({
+                'timestamp': timestamp,
+                'content_length': i % 5000,
+                'mode': 'append',
+                'prepend': False,
+                'has_timestamp': True
+            })
+    return session
+
+
+def best_of(repeat: int, func) -> float:
+    """Best wall-clock time of `repeat` runs, in milliseconds"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(sizes, repeat):
+    backend_factories = [
+        ('json (pretty)', lambda d: JSONSessionStorage(d, json_format='pretty')),
+        ('json (compact)', lambda d: JSONSessionStorage(d, json_format='compact')),
+        ('sqlite', lambda d: SQLiteSessionStorage(d)),
+    ]
+
+    print("♠️🌿🎸🧵 SessionState Benchmark")
+    print(f"   orjson: {'installed' if session_storage.orjson else 'not installed'}")
+    print()
+    print(f"{'events':>8}  {'backend':<16} {'save ms':>10} {'load ms':>10} {'append ms':>10} {'size KB':>10}")
+    print("-" * 70)
+
+    for events in sizes:
+        session = build_session(events)
+        for name, factory in backend_factories:
+            with tempfile.TemporaryDirectory() as tmp:
+                storage = factory(tmp)
+                save_ms = best_of(repeat, lambda: storage.save(session))
+                load_ms = best_of(repeat, storage.load)
+                append_ms = best_of(repeat, lambda: storage.append_action(
+                    'south', 'content_written',
+                    {'timestamp': datetime.now().isoformat(), 'content_length': 1}
+                ))
+                size_kb = sum(
+                    os.path.getsize(os.path.join(tmp, f)) for f in os.listdir(tmp)
+                ) / 1024
+            print(f"{events:>8}  {name:<16} {save_ms:>10.1f} {load_ms:>10.1f} {append_ms:>10.1f} {size_kb:>10.0f}")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark session state storage formats')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
@@ -10,6 +10,7 @@ This server enables Claude and other AI agents to:
 - Write and read notes
 - Collaborate and publish content
 - Reflect and extract wisdom
+- Search insights across past sessions
 """
 
 import asyncio
@@ -464,6 +464,61 @@ async def session_complete(seeds: Optional[str] = None) -> Dict[str, Any]:
     }
 
 
+@tool(
+    name="simexp_session_search",
+    description="Search reflections, patterns, wisdom, seeds and written notes across all past sessions",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Search terms; supports \"exact phrase\", AND/OR/NOT and prefix*"
+            },
+            "kind": {
+                "type": "string",
+                "enum": ["reflection", "pattern", "wisdom", "seed", "write"],
+                "description": "Only this kind of entry"
+            },
+            "session": {
+                "type": "string",
+                "description": "Only this session ID"
+            },
+            "since": {
+                "type": "string",
+                "description": "Only entries tracked on or after this date (YYYY-MM-DD)"
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of hits (default 20)"
+            }
+        },
+        "required": ["query"]
+    }
+)
+async def session_search(query: str, kind: Optional[str] = None, session: Optional[str] = None,
+                         since: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+    """Search across session history"""
+    cmd = ["simexp", "session", "search", query, "--json"]
+    if kind:
+        cmd.extend(["--kind", kind])
+    if session:
+        cmd.extend(["--session", session])
+    if since:
+        cmd.extend(["--since", since])
+    if limit:
+        cmd.extend(["--limit", str(limit)])
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    try:
+        hits = json.loads(result.stdout) if result.returncode == 0 else []
+    except json.JSONDecodeError:
+        hits = []
+    return {
+        "status": "success" if result.returncode == 0 else "error",
+        "hits": hits,
+        "error": result.stderr,
+    }
+
+
 # ============================================================================
 # Core Extraction Tools
 # ============================================================================
@@ -597,7 +652,7 @@ async def read(note_id: str) -> Dict[str, Any]:
 )
 async def archive(content: str, title: Optional[str] = None) -> Dict[str, Any]:
     """Archive content"""
-    cmd = ["simexp", "archive"]
+    cmd = ["simexp", "archive", "save"]
     if title:
         cmd.extend(["--title", title])
     # Pass content via stdin
@@ -1,39 +1,496 @@
+import io
 import os
+import gzip
+import json
+import shutil
+import hashlib
+import threading
 from datetime import datetime
 
-def save_as_markdown(title, content, base_path, daily_folder, source_name):
+from .search_index import index_document
+
+# Optional zstd support (pip install zstandard)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Content-addressed store: BASE_PATH/.objects/<sha256>; daily files link into it
+OBJECTS_DIR = '.objects'
+MANIFEST_FILE = 'manifest.json'
+CHECKPOINT_FILE = '.checkpoint.jsonl'
+
+# ARCHIVE_COMPRESSION values and the suffix each adds to .md files and objects
+COMPRESSION_SUFFIXES = {'none': '', 'gzip': '.gz', 'zstd': '.zst'}
+WRITE_BUFFER_SIZE = 64 * 1024
+
+_manifest_lock = threading.Lock()
+_manifest_cache = {}
+
+def resolve_compression(compression):
+    """
+    Normalize an ARCHIVE_COMPRESSION value
+
+    Args:
+        compression: 'none', 'gzip', 'zstd' (or None / False for none)
+
+    Returns:
+        str: A key of COMPRESSION_SUFFIXES; zstd falls back to gzip when
+             the zstandard package is not installed
+    """
+    compression = str(compression or 'none').lower()
+    if compression in ('gz',):
+        compression = 'gzip'
+    elif compression in ('zst',):
+        compression = 'zstd'
+    if compression not in COMPRESSION_SUFFIXES:
+        print(f"⚠️ Warning: Unknown ARCHIVE_COMPRESSION '{compression}', writing plain Markdown")
+        return 'none'
+    if compression == 'zstd' and zstandard is None:
+        print("⚠️ Warning: zstandard not installed (pip install zstandard), using gzip")
+        return 'gzip'
+    return compression
+
+def get_markdown_path(daily_folder, source_name, compression=None):
+    """Path of today's markdown file for a source (.md, .md.gz or .md.zst)"""
+    current_date = datetime.now().strftime('%Y%m%d')
+    suffix = COMPRESSION_SUFFIXES[resolve_compression(compression)]
+    return os.path.join(daily_folder, f"{current_date}_{source_name}.md{suffix}")
+
+def find_markdown_path(daily_folder, source_name):
+    """Today's existing markdown file for a source in any format (or snapshot diff), or None"""
+    for suffix in list(COMPRESSION_SUFFIXES.values()) + ['.diff']:
+        path = get_markdown_path(daily_folder, source_name) + suffix
+        if os.path.exists(path):
+            return path
+    return None
+
+def _open_compressed(path, mode, compression):
+    """Binary file object for path, (de)compressing as requested"""
+    if compression == 'none':
+        return open(path, mode, buffering=WRITE_BUFFER_SIZE)
+    if compression == 'gzip':
+        # Fixed mtime keeps identical documents byte-identical
+        stream = gzip.GzipFile(path, mode, mtime=0)
+    elif zstandard is None:
+        raise RuntimeError("zstandard is required for .zst archives (pip install zstandard)")
+    else:
+        stream = zstandard.open(path, mode)
+    # Batch small writes before they reach the compressor
+    return io.BufferedWriter(stream, WRITE_BUFFER_SIZE) if 'w' in mode else stream
+
+def open_markdown(path):
+    """
+    Open an archived document for reading as text
+
+    Handles plain .md files as well as .md.gz and .md.zst, so callers never
+    need to care how an archive was written.
+
+    Args:
+        path: Path of a .md, .md.gz or .md.zst file
+
+    Returns:
+        Text file object (UTF-8)
+    """
+    compression = 'none'
+    if path.endswith('.gz'):
+        compression = 'gzip'
+    elif path.endswith('.zst'):
+        compression = 'zstd'
+    return io.TextIOWrapper(_open_compressed(path, 'rb', compression), encoding='utf-8')
+
+def read_markdown(path):
+    """Full text of an archived document (.md, .md.gz, .md.zst or snapshot .md.diff)"""
+    if path.endswith('.md.diff'):
+        from .snapshots import reconstruct
+        daily_folder = os.path.dirname(os.path.abspath(path))
+        date = os.path.basename(daily_folder)
+        source_name = os.path.basename(path)[len(date) + 1:-len('.md.diff')]
+        text = reconstruct(os.path.dirname(daily_folder), source_name, date)
+        if text is None:
+            raise FileNotFoundError(f"No snapshot index entry for {path}")
+        return text
+    with open_markdown(path) as f:
+        return f.read()
+
+def get_objects_dir(base_path):
+    """Directory of the content-addressed object store"""
+    return os.path.join(base_path, OBJECTS_DIR)
+
+def _temp_path(path):
+    """Unique sibling temp name (safe across threads and processes)"""
+    return f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+
+def _link_into_place(object_path, file_path):
+    """
+    Point file_path at object_path atomically
+
+    Uses a hardlink, falling back to a symlink and finally a copy on
+    filesystems without link support. Already-linked files are left alone.
+
+    Returns:
+        bool: True if the file was already linked to the object
+    """
+    try:
+        if os.path.samefile(object_path, file_path):
+            return True
+    except OSError:
+        pass
+
+    temp_path = _temp_path(file_path)
+    try:
+        os.link(object_path, temp_path)
+    except OSError:
+        try:
+            os.symlink(os.path.abspath(object_path), temp_path)
+        except OSError:
+            shutil.copyfile(object_path, temp_path)
+    os.replace(temp_path, file_path)
+    return False
+
+def _remove_other_formats(file_path):
+    """Drop today's copies of the same source saved with another compression"""
+    base = file_path[:file_path.rindex('.md') + 3]
+    for suffix in COMPRESSION_SUFFIXES.values():
+        if base + suffix != file_path and os.path.exists(base + suffix):
+            os.remove(base + suffix)
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def read_manifest(daily_folder):
+    """
+    Load a daily folder's manifest
+
+    Parsed manifests are cached until the file changes, so per-source
+    lookups during a large run do not re-read it. Treat the result as
+    read-only.
+
+    Returns:
+        dict: {source_name: {'file', 'hash', 'bytes', 'reused', 'saved_at'}}
+    """
+    manifest_path = os.path.join(daily_folder, MANIFEST_FILE)
+    signature = _file_signature(manifest_path)
+    if signature is None:
+        return {}
+    cached = _manifest_cache.get(manifest_path)
+    if cached and cached[0] == signature:
+        return cached[1]
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    _manifest_cache[manifest_path] = (signature, manifest)
+    return manifest
+
+def _record_manifest(daily_folder, source_name, file_path, digest, size, reused):
+    """Add or update one source in the daily manifest"""
+    with _manifest_lock:
+        manifest = dict(read_manifest(daily_folder))
+        manifest[source_name] = {
+            'file': os.path.basename(file_path),
+            'hash': digest,
+            'bytes': size,
+            'reused': reused,
+            'saved_at': datetime.now().isoformat(timespec='seconds')
+        }
+        manifest_path = os.path.join(daily_folder, MANIFEST_FILE)
+        temp_path = _temp_path(manifest_path)
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(temp_path, manifest_path)
+        _manifest_cache[manifest_path] = (_file_signature(manifest_path), manifest)
+
+def _object_path(base_path, digest, compression):
+    """Store path of a document hash in the given format"""
+    return os.path.join(get_objects_dir(base_path), digest + COMPRESSION_SUFFIXES[compression])
+
+def _commit_object(base_path, digest, temp_path, compression):
+    """
+    Move a finished temp file into the store under its hash
+
+    The temp file is renamed into place atomically, so a killed run never
+    leaves a partial object or daily file behind.
+
+    Returns:
+        tuple: (object_path, reused) - reused is True if the object already existed
+    """
+    object_path = _object_path(base_path, digest, compression)
+    if os.path.exists(object_path):
+        os.remove(temp_path)
+        return (object_path, True)
+    os.replace(temp_path, object_path)
+    return (object_path, False)
+
+def _index_for_search(base_path, daily_folder, source_name, file_path, digest, text=None):
+    """Keep the archive search index current; indexing problems never fail a save"""
+    try:
+        date = os.path.basename(os.path.normpath(daily_folder))
+        open_text = (lambda: io.StringIO(text)) if text is not None else (lambda: open_markdown(file_path))
+        index_document(base_path, date, source_name, file_path, digest, open_text)
+    except Exception as e:
+        print(f"⚠️ Warning: Could not update the search index: {e}")
+
+def save_as_markdown(title, content, base_path, daily_folder, source_name, compression=None):
     """
     Save content as markdown file in the specified daily folder
 
+    The document is hashed in memory first: when BASE_PATH/.objects/<sha256>
+    already holds it, the daily file is only linked to that object (nothing
+    is written if it already is). New content is streamed paragraph by
+    paragraph through a buffered (optionally compressed) temp file that
+    becomes the object. Each save is recorded in the daily folder's
+    manifest.json.
+
     Args:
         title: Content title (currently unused, could be added to file)
         content: The content to save
-        base_path: Base path from config (for reference)
+        base_path: Base path from config (holds the object store)
         daily_folder: Full path to the daily folder (YYYYMMDD)
         source_name: Source filename (without extension)
+        compression: 'none' (default), 'gzip' (.md.gz) or 'zstd' (.md.zst)
 
     Returns:
         tuple: (success: bool, file_path: str)
     """
     try:
-        # Ensure daily folder exists
+        compression = resolve_compression(compression)
+        if _save_stored(content, base_path, daily_folder, source_name, compression):
+            return (True, get_markdown_path(daily_folder, source_name, compression))
+        with MarkdownStreamWriter(daily_folder, source_name, base_path, compression) as writer:
+            writer.write_paragraphs(content)
+        return (True, writer.file_path)
+    except Exception as e:
+        return (False, str(e))
+
+def _save_stored(content, base_path, daily_folder, source_name, compression):
+    """
+    Link today's file to an existing object holding this content
+
+    Returns:
+        bool: False if the store does not have the content yet (nothing done)
+    """
+    text = content + '\n\n'  # What MarkdownStreamWriter.write_paragraphs() produces
+    data = text.encode('utf-8')
+    digest = hashlib.sha256(data).hexdigest()
+    object_path = _object_path(base_path, digest, compression)
+    if not os.path.exists(object_path):
+        return False
+
+    os.makedirs(daily_folder, exist_ok=True)
+    file_path = get_markdown_path(daily_folder, source_name, compression)
+    already_linked = _link_into_place(object_path, file_path)
+    _remove_other_formats(file_path)
+    entry = read_manifest(daily_folder).get(source_name)
+    if not (already_linked and entry and entry['hash'] == digest and entry['file'] == os.path.basename(file_path)):
+        _record_manifest(daily_folder, source_name, file_path, digest, len(data), True)
+    _index_for_search(base_path, daily_folder, source_name, file_path, digest, text)
+    return True
+
+class MarkdownStreamWriter:
+    """
+    Write Markdown lines to today's file as they are produced
+
+    Produces the same layout as save_as_markdown() for the same content,
+    without holding the document in memory. Output goes to a buffered temp
+    file in the object store and is hashed on the way; on exit the file
+    becomes .objects/<sha256> (or is dropped if that object exists) and
+    today's file is linked to it. The hash is only known once the stream
+    ends, so unchanged content is still written to the temp file; callers
+    holding the whole document should use save_as_markdown(), which skips
+    the write. Use as a context manager.
+
+    Args:
+        daily_folder: Full path to the daily folder (YYYYMMDD)
+        source_name: Source filename (without extension)
+        base_path: Archive base path (default: parent of daily_folder)
+        compression: 'none' (default), 'gzip' or 'zstd'
+    """
+
+    def __init__(self, daily_folder, source_name, base_path=None, compression=None):
         os.makedirs(daily_folder, exist_ok=True)
+        self.daily_folder = daily_folder
+        self.source_name = source_name
+        self.base_path = base_path or os.path.dirname(os.path.abspath(daily_folder))
+        self.compression = resolve_compression(compression)
+        self.file_path = get_markdown_path(daily_folder, source_name, self.compression)
+        self.characters = 0
+        self.reused = False
+        self._file = None
+        self._temp_path = None
+        self._hash = hashlib.sha256()
+        self._bytes = 0
+        self._started = False
+        self._discarded = False
+        self._closing = '\n\n'
 
-        # Define the filename based on the source name
-        current_date = datetime.now().strftime('%Y%m%d')
-        filename = f"{current_date}_{source_name}.md"
-        file_path = os.path.join(daily_folder, filename)
+    def __enter__(self):
+        objects_dir = get_objects_dir(self.base_path)
+        os.makedirs(objects_dir, exist_ok=True)
+        self._temp_path = _temp_path(os.path.join(objects_dir, 'incoming'))
+        self._file = _open_compressed(self._temp_path, 'wb', self.compression)
+        return self
 
-        # Format the content with title and paragraphs
-        formatted_content = f""
-        paragraphs = content.split('\n\n')  # Split content into paragraphs based on double newlines
-        for paragraph in paragraphs:
-            formatted_content += f"{paragraph}\n\n"  # Add each paragraph followed by two newlines
+    def _write(self, text):
+        data = text.encode('utf-8')
+        self._file.write(data)
+        self._hash.update(data)
+        self._bytes += len(data)
 
-        # Save the content to the Markdown file
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(formatted_content)
+    def write_line(self, line):
+        if self._started:
+            self._write('\n')
+            self.characters += 1
+        elif not line.strip():
+            return  # Leading blank lines are stripped, as in clean_html()
+        self._write(line)
+        self.characters += len(line)
+        self._started = True
 
-        return (True, file_path)
-    except Exception as e:
-        return (False, str(e))
\ No newline at end of file
+    def write_paragraphs(self, content):
+        """Write a whole document verbatim, one paragraph at a time"""
+        start = 0
+        while start <= len(content):
+            end = content.find('\n\n', start)
+            if end == -1:
+                end = len(content)
+            self._write(content[start:end] + '\n\n')
+            start = end + 2
+        self.characters += len(content)
+        self._started = True
+        self._closing = ''
+
+    def discard(self):
+        """Drop everything written so far; nothing is saved on exit"""
+        self._discarded = True
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None or self._discarded:
+            self._file.close()
+            os.remove(self._temp_path)
+            return False
+
+        self._write(self._closing)
+        self._file.close()
+        digest = self._hash.hexdigest()
+        object_path, self.reused = _commit_object(self.base_path, digest, self._temp_path, self.compression)
+        _link_into_place(object_path, self.file_path)
+        _remove_other_formats(self.file_path)
+        _record_manifest(self.daily_folder, self.source_name, self.file_path, digest, self._bytes, self.reused)
+        _index_for_search(self.base_path, self.daily_folder, self.source_name, self.file_path, digest)
+        return False
+
+class ExtractionCheckpoint:
+    """
+    Record of the sources an extraction run has finished
+
+    Lives in the daily folder as .checkpoint.jsonl: a header line for the
+    run (with the URLs it covers), then one line per completed source (url,
+    filename, content hash, output path) appended and flushed as each source
+    is saved. A resumed run loads it and skips those sources. A fresh run
+    starts a new file only when it covers every source already recorded;
+    a run over fewer sources appends, so an interrupted larger run can
+    still be resumed.
+
+    Args:
+        daily_folder: Full path to the daily folder (YYYYMMDD)
+        resume: Keep the existing checkpoint and its completed sources
+        urls: Every source URL of this run
+    """
+
+    def __init__(self, daily_folder, resume=False, urls=None):
+        self.path = os.path.join(daily_folder, CHECKPOINT_FILE)
+        self.resume = resume
+        self.urls = list(urls or [])
+        self.completed = {}
+        self._append_to_existing = resume
+        self._file = None
+        self._lock = threading.Lock()
+        if resume:
+            self._load()
+        elif os.path.exists(self.path):
+            recorded = self._recorded_urls()
+            if recorded is not None and recorded <= set(self.urls):
+                os.remove(self.path)  # This run redoes everything the old one covered
+            else:
+                self._append_to_existing = True
+
+    def _recorded_urls(self):
+        """URLs covered by the runs in the checkpoint, or None if a run did not record them"""
+        urls = set()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if 'run_started_at' in entry:
+                        if 'urls' not in entry:
+                            return None
+                        urls.update(entry['urls'])
+                    elif entry.get('url'):
+                        urls.add(entry['url'])
+        except OSError:
+            return None
+        return urls
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # Line cut short by the interruption
+                    if entry.get('url') and entry.get('path') and os.path.exists(entry['path']):
+                        self.completed[entry['url']] = entry
+        except OSError:
+            pass
+
+    def is_done(self, url):
+        """Whether a resumed run already finished this source"""
+        return url in self.completed
+
+    def _ends_with_newline(self):
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def _append(self, entry):
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = open(self.path, 'a' if self._append_to_existing else 'w', encoding='utf-8')
+            if self._file.tell() and not self._ends_with_newline():
+                self._file.write('\n')  # Close a line cut short by the interruption
+            self._file.write(json.dumps({
+                'run_started_at': datetime.now().isoformat(timespec='seconds'),
+                'resumed': self.resume,
+                'urls': self.urls
+            }) + '\n')
+        self._file.write(json.dumps(entry) + '\n')
+        self._file.flush()
+
+    def record(self, url, filename, path):
+        """Mark a source as saved (its hash is taken from the daily manifest)"""
+        entry = read_manifest(os.path.dirname(self.path)).get(filename, {})
+        with self._lock:
+            self._append({
+                'url': url,
+                'filename': filename,
+                'hash': entry.get('hash'),
+                'path': path,
+                'completed_at': datetime.now().isoformat(timespec='seconds')
+            })
+            self.completed[url] = {'url': url, 'path': path}
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
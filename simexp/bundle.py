@@ -0,0 +1,183 @@
+"""
+SimExp Daily Bundle
+Every source extracted on a day in one file, for downstream loading
+
+Besides the per-source YYYYMMDD_<source>.md files, run_extraction() can
+write the day's content into a single bundle that consumers load with
+one sequential read:
+
+    YYYYMMDD/YYYYMMDD_bundle.jsonl    one JSON object per line
+    YYYYMMDD/YYYYMMDD_bundle.arrow    Arrow IPC file, memory-mappable (pyarrow)
+    YYYYMMDD/YYYYMMDD_bundle.parquet  Parquet (pyarrow)
+
+Columns: url, source, title, content_hash, size_bytes, fetched_at, markdown.
+Each run merges its sources into the day's bundle; the latest row per
+source wins, except that sources the server reported unchanged (HTTP 304,
+not re-processed, so no title) keep the title already stored.
+
+♠️🌿🎸🧵 G.Music Assembly - Daily Bundle
+"""
+
+import os
+import hashlib
+from typing import Optional, Dict, List
+
+from .archiver import read_markdown, _temp_path
+from .session_storage import json_loads, json_dumps_compact
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:  # Optional: Arrow / Parquet bundles
+    pa = None
+    pq = None
+
+BUNDLE_FORMATS = {'jsonl': '.jsonl', 'arrow': '.arrow', 'parquet': '.parquet'}
+BUNDLE_COLUMNS = ('url', 'source', 'title', 'content_hash', 'size_bytes', 'fetched_at', 'markdown')
+
+
+def _schema():
+    return pa.schema([
+        ('url', pa.string()),
+        ('source', pa.string()),
+        ('title', pa.string()),
+        ('content_hash', pa.string()),
+        ('size_bytes', pa.int64()),
+        ('fetched_at', pa.string()),
+        ('markdown', pa.large_string()),
+    ])
+
+
+def resolve_bundle_format(bundle) -> Optional[str]:
+    """
+    Normalize an EXTRACT_BUNDLE value
+
+    Args:
+        bundle: 'jsonl', 'arrow', 'parquet', 'auto' / True (Arrow when pyarrow
+                is installed, else JSON Lines), or None / False / 'none' for off
+
+    Returns:
+        A key of BUNDLE_FORMATS, or None when no bundle is written
+    """
+    if bundle is None or bundle is False or str(bundle).lower() in ('', 'none', 'off', 'false'):
+        return None
+    bundle = 'auto' if bundle is True else str(bundle).lower()
+    if bundle == 'auto':
+        return 'arrow' if pa is not None else 'jsonl'
+    if bundle not in BUNDLE_FORMATS:
+        print(f"⚠️ Warning: Unknown EXTRACT_BUNDLE '{bundle}', no bundle written")
+        return None
+    if bundle != 'jsonl' and pa is None:
+        print(f"⚠️ Warning: pyarrow is not installed (pip install simexp[bundle]), writing JSON Lines")
+        return 'jsonl'
+    return bundle
+
+
+def get_bundle_path(daily_folder: str, bundle_format: str) -> str:
+    """Path of a day's bundle in the given format"""
+    date = os.path.basename(os.path.normpath(daily_folder))
+    return os.path.join(daily_folder, f"{date}_bundle{BUNDLE_FORMATS[bundle_format]}")
+
+
+def find_bundle_path(daily_folder: str) -> Optional[str]:
+    """A day's existing bundle in any format, or None"""
+    for bundle_format in BUNDLE_FORMATS:
+        path = get_bundle_path(daily_folder, bundle_format)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def open_bundle_table(path: str):
+    """
+    Arrow table of an .arrow bundle, memory-mapped (columns are not copied)
+
+    Raises:
+        RuntimeError: If pyarrow is not installed
+    """
+    if pa is None:
+        raise RuntimeError("pyarrow is required for Arrow bundles (pip install simexp[bundle])")
+    return pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+
+
+def load_bundle(daily_folder: str, bundle_format: Optional[str] = None) -> List[Dict]:
+    """
+    Rows of a day's bundle
+
+    Args:
+        daily_folder: Full path to the daily folder (YYYYMMDD)
+        bundle_format: Format to read (default: whichever bundle exists)
+
+    Returns:
+        List of row dicts (empty if the day has no bundle)
+    """
+    path = get_bundle_path(daily_folder, bundle_format) if bundle_format else find_bundle_path(daily_folder)
+    if not path or not os.path.exists(path):
+        return []
+    if path.endswith('.jsonl'):
+        with open(path, 'rb') as f:
+            return [json_loads(line) for line in f if line.strip()]
+    if path.endswith('.arrow'):
+        return open_bundle_table(path).to_pylist()
+    if pq is None:
+        raise RuntimeError("pyarrow is required for Parquet bundles (pip install simexp[bundle])")
+    return pq.read_table(path).to_pylist()
+
+
+def bundle_row(result: Dict) -> Dict:
+    """Bundle row for a successful run_extraction() result"""
+    markdown = read_markdown(result['path'])
+    data = markdown.encode('utf-8')
+    return {
+        'url': result['url'],
+        'source': result['filename'],
+        'title': result.get('title'),
+        'content_hash': hashlib.sha256(data).hexdigest(),
+        'size_bytes': len(data),
+        'fetched_at': result.get('fetched_at'),
+        'markdown': markdown,
+    }
+
+
+def write_bundle(daily_folder: str, rows: List[Dict], bundle_format: str) -> str:
+    """
+    Merge rows into the day's bundle and write it atomically
+
+    Args:
+        daily_folder: Full path to the daily folder (YYYYMMDD)
+        rows: New rows; they replace existing rows of the same source
+              (a row without a title keeps the stored row's title)
+        bundle_format: A key of BUNDLE_FORMATS
+
+    Returns:
+        Path of the bundle
+    """
+    path = get_bundle_path(daily_folder, bundle_format)
+    merged = {row['source']: row for row in load_bundle(daily_folder, bundle_format)}
+    for row in rows:
+        previous = merged.get(row['source'])
+        merged[row['source']] = {column: row.get(column) for column in BUNDLE_COLUMNS}
+        if row.get('title') is None and previous:
+            merged[row['source']]['title'] = previous.get('title')
+
+    os.makedirs(daily_folder, exist_ok=True)
+    temp_path = _temp_path(path)
+    try:
+        if bundle_format == 'jsonl':
+            with open(temp_path, 'wb') as f:
+                for row in merged.values():
+                    f.write(json_dumps_compact(row) + b'\n')
+        else:
+            table = pa.Table.from_pylist(list(merged.values()), schema=_schema())
+            if bundle_format == 'arrow':
+                with pa.OSFile(temp_path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            else:
+                pq.write_table(table, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return path
@@ -6,7 +6,6 @@ Manages glyph-based collaborator mappings for quick sharing
 """
 
 import os
-import yaml
 from typing import List, Optional, Dict
 
 # Config file location
@@ -28,6 +27,8 @@ def load_collaborators_config() -> Dict:
     Returns:
         Dict with collaborators, aliases, and groups
     """
+    import yaml
+
     # Try user home first
     if os.path.exists(CONFIG_FILE):
         config_path = CONFIG_FILE
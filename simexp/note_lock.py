@@ -0,0 +1,374 @@
+"""
+SimExp Note Lock
+Cross-process, first-come-first-served lock per Simplenote note
+
+Every operation that types into a note (session add/write/title, publish,
+collaborators, `simexp write`) runs inside a NoteLock keyed by the session
+ID. `simexp write <url>` resolves the URL to the session that owns the note
+(note_lock_key), so it queues behind session commands on the same note;
+notes outside any session are keyed by their canonical URL. Two CLI
+invocations, or the MCP server and a human, then queue up instead of
+interleaving keystrokes in the same note.
+
+Layout under ~/.simexp/locks/<key>/:
+    mutex       flock target guarding the counter and stats
+    counter     last ticket number handed out
+    queue/      one file per waiting or holding process, named by ticket
+    stats.json  acquisitions and wait times for `session info`
+
+The lowest live ticket holds the lock, so waiters are served in arrival
+order. Tickets left behind by dead processes are pruned.
+
+♠️🌿🎸🧵 G.Music Assembly - Note Write Serialization
+"""
+
+import os
+import re
+import json
+import time
+import asyncio
+import hashlib
+import functools
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional, Dict
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to an exclusive-create mutex
+    fcntl = None
+
+from .session_storage import _read_config
+
+LOCKS_DIR = os.path.expanduser('~/.simexp/locks')
+DEFAULT_TIMEOUT = 300.0
+POLL_INTERVAL = 0.1
+
+
+class NoteLockTimeout(TimeoutError):
+    """Raised when a note lock is not acquired within the timeout"""
+
+
+def get_lock_timeout() -> float:
+    """
+    Get the note lock timeout in seconds using priority chain
+
+    Priority order:
+    1. SIMEXP_NOTE_LOCK_TIMEOUT environment variable
+    2. NOTE_LOCK_TIMEOUT from ~/.simexp/simexp.yaml
+    3. 300 seconds (fallback default)
+    """
+    for value in (os.environ.get('SIMEXP_NOTE_LOCK_TIMEOUT'), _read_config().get('NOTE_LOCK_TIMEOUT')):
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            print(f"⚠️ Warning: Ignoring invalid note lock timeout: {value}")
+    return DEFAULT_TIMEOUT
+
+
+def get_lock_dir(key: str) -> str:
+    """Directory holding the queue for a lock key (session ID or note URL)"""
+    safe = re.sub(r'[^A-Za-z0-9._-]', '_', key)
+    if safe != key or len(safe) > 64:
+        safe = f"{safe[:48]}-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}"
+    return os.path.join(LOCKS_DIR, safe)
+
+
+def _canonical_note_url(note_url: str) -> str:
+    """Note URL without query, fragment or trailing slash"""
+    return re.split(r'[?#]', note_url.strip(), maxsplit=1)[0].rstrip('/')
+
+
+def _owns_note(session: Dict, note_url: str) -> bool:
+    """Whether a session's note is the one at this URL (public URL or note UUID)"""
+    public_urls = (session.get('public_url'), (session.get('west') or {}).get('public_url'))
+    if any(url and _canonical_note_url(url) == note_url for url in public_urls):
+        return True
+    note_uuid = session.get('note_uuid')
+    return bool(note_uuid) and note_url.rsplit('/', 1)[-1] == note_uuid
+
+
+def note_lock_key(note_url: str) -> str:
+    """
+    Lock key for a note given by URL - the same key session commands use
+
+    The active session is checked first, then every registered workspace.
+
+    Args:
+        note_url: Simplenote note URL (/p/ public or /n/ private)
+
+    Returns:
+        Session ID of the session that owns the note, or the canonical URL
+    """
+    from .session_manager import SessionState, get_active_session, list_registered_workspaces
+
+    canonical = _canonical_note_url(note_url)
+    session = get_active_session()
+    if session and session.get('session_id') and _owns_note(session, canonical):
+        return session['session_id']
+
+    for workspace in list_registered_workspaces():
+        try:
+            session = SessionState(workspace_dir=workspace).storage.load()
+        except Exception:
+            continue
+        if session and session.get('session_id') and _owns_note(session, canonical):
+            return session['session_id']
+    return canonical
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process with this PID is still running"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+@contextmanager
+def _mutex(lock_dir: str):
+    """Short critical section around the counter, queue pruning and stats"""
+    path = os.path.join(lock_dir, 'mutex')
+    if fcntl is not None:
+        with open(path, 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        return
+
+    held = f"{path}.held"
+    while True:
+        try:
+            fd = os.open(held, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            time.sleep(0.01)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        os.remove(held)
+
+
+def _live_tickets(queue_dir: str) -> list:
+    """Sorted ticket numbers in the queue, removing those of dead processes"""
+    tickets = []
+    for name in os.listdir(queue_dir):
+        path = os.path.join(queue_dir, name)
+        try:
+            with open(path) as f:
+                pid = json.load(f)['pid']
+        except (OSError, ValueError, KeyError):
+            continue
+        if _pid_alive(pid):
+            tickets.append(int(name))
+        else:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    return sorted(tickets)
+
+
+def _read_stats(lock_dir: str) -> Dict:
+    try:
+        with open(os.path.join(lock_dir, 'stats.json')) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_stats(lock_dir: str, stats: Dict) -> None:
+    path = os.path.join(lock_dir, 'stats.json')
+    with open(f"{path}.tmp", 'w') as f:
+        json.dump(stats, f)
+    os.replace(f"{path}.tmp", path)
+
+
+class NoteLock:
+    """
+    FIFO lock on one note, usable with `with` or `async with`
+
+    Args:
+        key: Session ID or note URL identifying the note
+        operation: Short label recorded as the current holder (e.g. 'write')
+        timeout: Seconds to wait before NoteLockTimeout (None = configured)
+
+    Raises:
+        NoteLockTimeout: If the lock is not acquired within the timeout
+    """
+
+    def __init__(self, key: str, operation: str = 'edit', timeout: Optional[float] = None):
+        self.key = key
+        self.operation = operation
+        self.timeout = get_lock_timeout() if timeout is None else timeout
+        self.lock_dir = get_lock_dir(key)
+        self.queue_dir = os.path.join(self.lock_dir, 'queue')
+        self.ticket = None
+        self.ahead = 0
+        self.wait_seconds = 0.0
+        self._enqueued_at = None
+        self._acquired_at = None
+
+    def _enqueue(self) -> None:
+        os.makedirs(self.queue_dir, exist_ok=True)
+        with _mutex(self.lock_dir):
+            counter_path = os.path.join(self.lock_dir, 'counter')
+            try:
+                with open(counter_path) as f:
+                    last = int(f.read().strip() or 0)
+            except (OSError, ValueError):
+                last = 0
+            self.ticket = last + 1
+            with open(counter_path, 'w') as f:
+                f.write(str(self.ticket))
+
+            with open(os.path.join(self.queue_dir, f"{self.ticket:012d}"), 'w') as f:
+                json.dump({
+                    'pid': os.getpid(),
+                    'operation': self.operation,
+                    'enqueued_at': datetime.now().isoformat()
+                }, f)
+            self.ahead = len([t for t in _live_tickets(self.queue_dir) if t < self.ticket])
+
+        self._enqueued_at = time.monotonic()
+        if self.ahead:
+            print(f"⏳ Waiting for note lock ({self.ahead} ahead in queue)...")
+
+    def _is_head(self) -> bool:
+        """Whether our ticket is the lowest live one; raises once timed out"""
+        tickets = _live_tickets(self.queue_dir)
+        if not tickets or tickets[0] == self.ticket:
+            return True
+        if time.monotonic() - self._enqueued_at >= self.timeout:
+            depth = len([t for t in tickets if t < self.ticket])
+            self._dequeue()
+            raise NoteLockTimeout(
+                f"Timed out after {self.timeout:.0f}s waiting for note lock "
+                f"'{self.key}' ({depth} ahead in queue)"
+            )
+        return False
+
+    def _on_acquired(self) -> None:
+        self._acquired_at = time.monotonic()
+        self.wait_seconds = self._acquired_at - self._enqueued_at
+        with _mutex(self.lock_dir):
+            stats = _read_stats(self.lock_dir)
+            stats['acquisitions'] = stats.get('acquisitions', 0) + 1
+            stats['total_wait_seconds'] = stats.get('total_wait_seconds', 0.0) + self.wait_seconds
+            stats['max_wait_seconds'] = max(stats.get('max_wait_seconds', 0.0), self.wait_seconds)
+            stats['last_wait_seconds'] = self.wait_seconds
+            stats['max_queue_depth'] = max(stats.get('max_queue_depth', 0), self.ahead)
+            stats['holder'] = {
+                'pid': os.getpid(),
+                'operation': self.operation,
+                'since': datetime.now().isoformat()
+            }
+            _write_stats(self.lock_dir, stats)
+
+    def _dequeue(self) -> None:
+        try:
+            os.remove(os.path.join(self.queue_dir, f"{self.ticket:012d}"))
+        except OSError:
+            pass
+
+    def release(self) -> None:
+        """Leave the queue and record how long the lock was held"""
+        with _mutex(self.lock_dir):
+            self._dequeue()
+            stats = _read_stats(self.lock_dir)
+            stats['holder'] = None
+            if self._acquired_at is not None:
+                stats['last_hold_seconds'] = time.monotonic() - self._acquired_at
+            _write_stats(self.lock_dir, stats)
+
+    def __enter__(self):
+        self._enqueue()
+        while not self._is_head():
+            time.sleep(POLL_INTERVAL)
+        self._on_acquired()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    async def __aenter__(self):
+        self._enqueue()
+        while not self._is_head():
+            await asyncio.sleep(POLL_INTERVAL)
+        self._on_acquired()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+
+def get_lock_stats(key: str) -> Optional[Dict]:
+    """
+    Queue depth and wait-time metrics for a note lock
+
+    Args:
+        key: Session ID or note URL identifying the note
+
+    Returns:
+        Metrics dictionary, or None if the note was never locked
+    """
+    lock_dir = get_lock_dir(key)
+    queue_dir = os.path.join(lock_dir, 'queue')
+    if not os.path.isdir(queue_dir):
+        return None
+
+    with _mutex(lock_dir):
+        depth = len(_live_tickets(queue_dir))
+        stats = _read_stats(lock_dir)
+
+    acquisitions = stats.get('acquisitions', 0)
+    return {
+        'queue_depth': depth,
+        'waiting': max(depth - 1, 0) if stats.get('holder') else depth,
+        'holder': stats.get('holder'),
+        'acquisitions': acquisitions,
+        'avg_wait_seconds': stats.get('total_wait_seconds', 0.0) / acquisitions if acquisitions else 0.0,
+        'max_wait_seconds': stats.get('max_wait_seconds', 0.0),
+        'last_wait_seconds': stats.get('last_wait_seconds', 0.0),
+        'max_queue_depth': stats.get('max_queue_depth', 0),
+    }
+
+
+def session_note_lock(operation: str, on_timeout=None):
+    """
+    Decorator holding the active session's note lock around an async operation
+
+    If there is no active session the operation runs unlocked and reports
+    that itself. On timeout the error is printed and `on_timeout` returned.
+
+    Args:
+        operation: Short label recorded as the lock holder
+        on_timeout: Value returned when the lock times out
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            from .session_manager import get_active_session
+
+            session = get_active_session()
+            if not session:
+                return await func(*args, **kwargs)
+
+            try:
+                async with NoteLock(session['session_id'], operation=operation):
+                    return await func(*args, **kwargs)
+            except NoteLockTimeout as e:
+                print(f"❌ {e}")
+                return on_timeout
+        return wrapper
+    return decorator
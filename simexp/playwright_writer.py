@@ -7,7 +7,6 @@ Chrome browser automation for writing to Simplenote web pages
 
 import asyncio
 import platform
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 from typing import Optional, Literal
 import logging
 
@@ -81,6 +80,8 @@ class SimplenoteWriter:
 
     async def connect(self):
         """Launch Playwright and connect to browser (existing or new)"""
+        from playwright.async_api import async_playwright  # Deferred: keeps CLI startup light
+
         self.playwright = await async_playwright().start()
 
         if self.cdp_url:
@@ -143,6 +144,8 @@ class SimplenoteWriter:
 
     async def navigate(self):
         """Navigate to Simplenote note URL"""
+        from playwright.async_api import TimeoutError as PlaywrightTimeout
+
         logger.info(f"🌐 Navigating to: {self.note_url}")
         response = await self.page.goto(self.note_url, timeout=self.timeout)
 
@@ -175,6 +178,8 @@ class SimplenoteWriter:
         Raises:
             Exception if no editor found
         """
+        from playwright.async_api import TimeoutError as PlaywrightTimeout
+
         logger.info("🔍 Searching for editor element...")
 
         for selector in self.EDITOR_SELECTORS:
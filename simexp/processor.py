@@ -1,55 +1,550 @@
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, UnicodeDammit
+from bs4.dammit import EncodingDetector
+from bs4.element import NavigableString, PreformattedString
+from html.parser import HTMLParser
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import threading
+import soupsieve
+import codecs
+import os
 import re
 
-def clean_html(html_content):
-    soup = BeautifulSoup(html_content, 'html.parser')
+try:
+    import lxml  # noqa: F401 - C parser, much faster than html.parser
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
 
-    # Remove unwanted tags like script and style
-    for script in soup(['script', 'style']):
-        script.decompose()
+# Only <title> and <body> are materialized; <body> ends up at the top level
+# of the parsed tree, so the content selector starts there. Profiles with
+# their own selectors get the full document, so html/:root/head selectors
+# (e.g. meta[property="og:title"]) match as they would in a browser.
+PARSE_ONLY = SoupStrainer(['title', 'body'])
+CONTENT_SELECTOR = "body > div > div:nth-of-type(1) > div > div"
+NO_CONTENT = "No content found."
 
-    # Locate the specific element using a CSS selector equivalent to the XPath
-    target_div = soup.select_one("html > body > div > div:nth-of-type(1) > div > div")
+def sniff_encoding(body, declared=None, partial=False):
+    """
+    Pick an encoding for raw page bytes without statistical detection
 
-    if target_div:
-        markdown_content = ""
-
-        # Process elements to retain markdown structure
-        for element in target_div.descendants:
-            if element.name == "h1":
-                markdown_content += f"\n# {element.get_text().strip()}\n\n"
-            elif element.name == "h2":
-                markdown_content += f"\n## {element.get_text().strip()}\n\n\n"  # Add newline before and after
-            elif element.name == "h3":
-                markdown_content += f"\n### {element.get_text().strip()}\n\n\n"  # Add newline before and after
-            elif element.name in ["ul", "ol"]:  # Handle unordered and ordered lists
-                for li in element.find_all("li"):
-                    markdown_content += f"- {li.get_text().strip()}\n"
-                markdown_content += "\n"  # Add a newline after lists
-            elif element.name == "blockquote":  # Handle blockquotes
-                markdown_content += f"\n> {element.get_text().strip()}\n\n"
-            elif element.name == "p":  # Handle paragraphs
-                markdown_content += f"{element.get_text().strip()}\n\n"
-            elif element.name == "code":  # Inline code
-                markdown_content += f"`{element.get_text().strip()}`"
-            else:
+    Tries, in order: the charset declared by the server, a byte order mark,
+    <meta charset> / XML declaration, then UTF-8 if the bytes are valid
+    UTF-8. Returns None when none of these apply, leaving the (slow)
+    detection as a last resort for the caller.
+
+    Args:
+        body: Raw bytes (the whole page, or its first chunk)
+        declared: Charset from the Content-Type header
+        partial: body is a prefix; a multi-byte sequence may be cut at the end
+    """
+    for encoding in (declared,
+                     EncodingDetector.strip_byte_order_mark(body)[1],
+                     EncodingDetector.find_declared_encoding(body, is_html=True)):
+        if encoding:
+            try:
+                return codecs.lookup(encoding).name
+            except LookupError:
                 continue
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(body, final=not partial)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return None
+
+def decode_html(body, declared=None):
+    """Decode page bytes, falling back to charset detection only when needed"""
+    encoding = sniff_encoding(body, declared)
+    if encoding:
+        return body.decode(encoding, errors='replace')
+    return UnicodeDammit(body, is_html=True).unicode_markup
+
+def parse_html(html_content, encoding=None, full_document=False):
+    """
+    Parse a page once, keeping just the title and body
+
+    Args:
+        html_content: Page as text, or raw bytes straight from the fetcher
+        encoding: Charset declared by the server (bytes only)
+        full_document: Keep <html> and <head> too (for profile selectors)
+    """
+    parse_only = None if full_document else PARSE_ONLY
+    if isinstance(html_content, bytes):
+        encoding = sniff_encoding(html_content, encoding)
+        return BeautifulSoup(html_content, HTML_PARSER, parse_only=parse_only, from_encoding=encoding)
+    return BeautifulSoup(html_content, HTML_PARSER, parse_only=parse_only)
+
+def _as_soup(html_content, profile=None):
+    if isinstance(html_content, BeautifulSoup):
+        return html_content
+    return parse_html(html_content, full_document=bool(profile and profile.full_document))
+
+HEADINGS = {'h1': '#', 'h2': '##', 'h3': '###'}
+LISTS = ('ul', 'ol')
+LINE_BREAKS = ('p', 'br', 'div')
+_NEWLINES = re.compile(r'\n+')
+
+def _inline_text(node, nested_lists=None, tags=None):
+    """
+    Text of a block element in one walk over its subtree
+
+    Inline <code> becomes `code` and paragraphs inside the block start new
+    lines. Nested lists are not part of the text; they are appended to
+    `nested_lists` (when given) for the caller to emit, so their items are
+    not repeated. `tags` maps source tags onto the built-in ones.
+    """
+    tags = tags or {}
+    parts = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if type(current) is str:  # Line break marker
+            parts.append(current)
+            continue
+        if isinstance(current, NavigableString):
+            if not isinstance(current, PreformattedString):  # Comments, doctypes...
+                parts.append(str(current))
+            continue
+
+        name = None if current is node else tags.get(current.name, current.name)
+        if name in LISTS:
+            if nested_lists is not None:
+                nested_lists.append(current)
+        elif name == 'code':
+            parts.append(f"`{current.get_text().strip()}`")
+        elif name in LINE_BREAKS:
+            stack.append('\n')
+            stack.extend(reversed(current.contents))
+            stack.append('\n')
+        else:
+            stack.extend(reversed(current.contents))
+    return _NEWLINES.sub('\n', ''.join(parts).strip())
+
+def html_to_markdown(root, profile=None):
+    """
+    Convert a content subtree to Markdown in a single pass
+
+    Each node is visited once. Headings, paragraphs, blockquotes, list items
+    and stray inline code become blocks; any other tag is a container whose
+    children are walked in document order. Nested lists are indented.
+
+    Args:
+        root: Content element
+        profile: ExtractionProfile whose tag mapping applies (default: none)
+
+    Returns:
+        Markdown text: one line per block, a blank line before headings
+    """
+    headings = profile.headings if profile else HEADINGS
+    tags = profile.tags if profile else {}
+    lines = []
+    stack = [(child, 0) for child in reversed(root.contents)]
+    while stack:
+        node, depth = stack.pop()
+        if isinstance(node, NavigableString):
+            continue  # Bare text outside blocks is layout whitespace
+
+        name = tags.get(node.name, node.name)
+        nested = []
+        if name in headings:
+            if lines:
+                lines.append('')
+            lines.append(f"{headings[name]} {_inline_text(node, nested, tags)}")
+        elif name == 'p':
+            text = _inline_text(node, nested, tags)
+            if text:
+                lines.append(text)
+        elif name == 'blockquote':
+            text = _inline_text(node, nested, tags)
+            if text:
+                lines.extend(f"> {line}" for line in text.split('\n'))
+        elif name == 'code':
+            lines.append(f"`{node.get_text().strip()}`")
+        elif name in LISTS:
+            items = [child for child in node.children
+                     if tags.get(getattr(child, 'name', None), getattr(child, 'name', None)) == 'li']
+            for item in reversed(items):
+                stack.append((item, depth))
+        elif name == 'li':
+            indent = '  ' * depth
+            text = _inline_text(node, nested, tags).replace('\n', f"\n{indent}  ")
+            lines.append(f"{indent}- {text}")
+            depth += 1
+        else:
+            stack.extend((child, depth) for child in reversed(node.contents))
+
+        # Lists found inside a block are emitted right after it
+        for sublist in reversed(nested):
+            stack.append((sublist, depth))
+
+    return '\n'.join(lines)
 
-        # Normalize newlines and ensure proper spacing
-        markdown_content = re.sub(r'\n+', '\n', markdown_content)  # Normalize excessive newlines
-        markdown_content = re.sub(r'(^|\n)(#+)', r'\1\n\2', markdown_content)  # Ensure space before headers
+# Built-in element handlers a profile's `markdown` mapping can point tags at
+MARKDOWN_ROLES = ('p', 'blockquote', 'code', 'ul', 'ol', 'li')
 
-        return markdown_content.strip()
+class ExtractionProfile:
+    """
+    Per-source extraction rules, compiled once and reused for every page
+
+    Built from an EXTRACT_PROFILES entry in simexp.yaml:
+
+        content_selector: CSS selector of the content element
+        title_selector:   CSS selector of the title (default: <title>);
+                          <meta> elements give their content attribute
+        drop:             CSS selectors removed before conversion
+                          (script and style are always removed)
+        markdown:         tag → handler, e.g. {h4: '####', section: p, dd: li,
+                          aside: drop}
+
+    Args:
+        name: Profile name
+        spec: Profile dict from the configuration (None for the built-in one)
+
+    Profiles that set content_selector or title_selector are matched
+    against the full document (html, head and body); the built-in layout
+    only needs <title> and <body> and parses just those.
+
+    Raises:
+        ValueError: For invalid selectors or mappings
+    """
+
+    def __init__(self, name, spec=None):
+        spec = spec or {}
+        self.name = name
+        self.spec = spec
+        self.headings = dict(HEADINGS)
+        self.tags = {}
+        drop = ['script', 'style'] + list(spec.get('drop') or [])
+        self.full_document = bool(spec.get('content_selector') or spec.get('title_selector'))
+
+        for tag, role in (spec.get('markdown') or {}).items():
+            role = str(role)
+            if role.strip('#') == '' and 1 <= len(role) <= 6:
+                self.headings[tag] = role
+            elif re.fullmatch(r'h[1-6]', role):
+                self.headings[tag] = '#' * int(role[1])
+            elif role in MARKDOWN_ROLES:
+                self.tags[tag] = role
+            elif role == 'drop':
+                drop.append(tag)
+            else:
+                raise ValueError(f"unknown Markdown mapping {tag}: {role}")
+
+        try:
+            self.content = soupsieve.compile(spec.get('content_selector') or CONTENT_SELECTOR)
+            title = spec.get('title_selector')
+            self.title = soupsieve.compile(title) if title else None
+            self.drop = soupsieve.compile(', '.join(drop))
+        except soupsieve.SelectorSyntaxError as e:
+            raise ValueError(f"invalid selector: {e}") from e
+
+DEFAULT_PROFILE = ExtractionProfile('default')
+
+_profile_cache = {}
+profile_cache_stats = {'compiled': 0, 'hits': 0}
+
+def get_profile(name, spec=None):
+    """
+    Compiled profile for a name, compiling only when first seen or changed
+
+    Args:
+        name: Profile name ('default' without a spec is the built-in layout)
+        spec: Profile dict from EXTRACT_PROFILES
+
+    Returns:
+        ExtractionProfile (raises ValueError for an invalid spec)
+    """
+    if spec is None and name == 'default':
+        profile_cache_stats['hits'] += 1
+        return DEFAULT_PROFILE
+    cached = _profile_cache.get(name)
+    if cached is not None and cached.spec == spec:
+        profile_cache_stats['hits'] += 1
+        return cached
+    profile = ExtractionProfile(name, spec)
+    _profile_cache[name] = profile
+    profile_cache_stats['compiled'] += 1
+    return profile
+
+def clean_html(html_content, profile=None):
+    soup = _as_soup(html_content, profile)
+    profile = profile or DEFAULT_PROFILE
+
+    # Remove unwanted elements (script, style and the profile's drop list)
+    for element in profile.drop.select(soup):
+        element.decompose()
+
+    # Locate the content element with the profile's precompiled selector
+    target_div = profile.content.select_one(soup)
+
+    if target_div:
+        return html_to_markdown(target_div, profile).strip()
 
     # Fallback if no specific content is found
-    return "No content found."
+    return NO_CONTENT
+
+VOID_ELEMENTS = ('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                 'link', 'meta', 'source', 'track', 'wbr')
+
+class MarkdownStreamParser(HTMLParser):
+    """
+    Incremental HTML → Markdown converter for pages too large to hold as a tree
+
+    Feed decoded text in chunks with feed(); every Markdown line is passed to
+    `emit` as soon as its block closes, so memory stays bounded by the open
+    element stack and the current block. The layout matches clean_html() for
+    well-formed pages: same content selector, same line format.
+
+    Args:
+        emit: Callback receiving each Markdown line
+    """
+
+    def __init__(self, emit):
+        super().__init__(convert_charrefs=True)
+        self.emit = emit
+        self.title = None
+        self.found = False       # Content element seen
+        self.lines = 0
+        self._stack = []         # Open element frames
+        self._blocks = []        # Blocks being captured (li can nest)
+        self._list_depth = -1
+        self._skip = 0           # Inside <script>/<style>
+        self._title_parts = None
+        self._code_parts = None
+        self._in_target = False
+        self._done = False
+
+    # Element stack ---------------------------------------------------
+
+    def _is_target(self):
+        """Whether the element just opened matches CONTENT_SELECTOR"""
+        names = [frame['name'] for frame in self._stack]
+        if 'body' not in names:
+            return False
+        body = names.index('body')
+        return (len(names) == body + 5
+                and names[body + 1:] == ['div'] * 4
+                and self._stack[body + 2]['nth_div'] == 1)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_ELEMENTS:
+            self.handle_startendtag(tag, attrs)
+            return
+
+        nth_div = 0
+        if self._stack and tag == 'div':
+            self._stack[-1]['divs'] += 1
+            nth_div = self._stack[-1]['divs']
+        frame = {'name': tag, 'divs': 0, 'nth_div': nth_div}
+        self._stack.append(frame)
+
+        if tag in ('script', 'style'):
+            self._skip += 1
+        elif tag == 'title' and self.title is None:
+            self._title_parts = []
+        elif not self._done and not self._in_target and self._is_target():
+            self._in_target = frame['target'] = True
+            self.found = True
+        elif self._in_target:
+            self._open(tag, frame)
+
+    def handle_startendtag(self, tag, attrs):
+        if tag == 'br' and self._blocks and self._in_target:
+            self._blocks[-1]['parts'].append('\n')
+
+    def handle_endtag(self, tag):
+        names = [frame['name'] for frame in self._stack]
+        if tag not in names:
+            return  # Stray end tag
+        index = len(names) - 1 - names[::-1].index(tag)
+        while len(self._stack) > index:
+            self._close(self._stack.pop())
+
+    def handle_data(self, data):
+        if self._skip:
+            return
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+        elif self._in_target and self._blocks:
+            if self._code_parts is not None:
+                self._code_parts.append(data)
+            else:
+                self._blocks[-1]['parts'].append(data)
+
+    def close(self):
+        """Flush blocks still open at the end of input (or at a size cap)"""
+        super().close()
+        while self._stack:
+            self._close(self._stack.pop())
+
+    # Blocks ----------------------------------------------------------
+
+    def _open(self, tag, frame):
+        if self._blocks:
+            block = self._blocks[-1]
+            if tag in LISTS:
+                # Lists inside a block are emitted after the text so far
+                self._flush(block)
+                self._list_depth += 1
+                frame['list'] = True
+            elif tag == 'code' and self._code_parts is None:
+                self._code_parts = []
+                frame['code'] = True
+            elif tag in LINE_BREAKS:
+                block['parts'].append('\n')
+                frame['line_break'] = True
+            elif tag == 'li' and self._list_depth >= 0:
+                self._start_block(tag, frame)
+            return
 
-def extract_title(html_content):
-    soup = BeautifulSoup(html_content, 'html.parser')
-    title = soup.title.string if soup.title else 'Untitled'
+        if tag in LISTS:
+            self._list_depth += 1
+            frame['list'] = True
+        elif tag in HEADINGS or tag in ('p', 'blockquote', 'code', 'li'):
+            self._start_block(tag, frame)
+
+    def _start_block(self, tag, frame):
+        block = {'kind': tag, 'parts': [], 'depth': max(self._list_depth, 0), 'flushed': False}
+        self._blocks.append(block)
+        frame['block'] = block
+        if tag == 'code':
+            self._code_parts = []
+            frame['code'] = True
+
+    def _close(self, frame):
+        name = frame['name']
+        if name in ('script', 'style'):
+            self._skip -= 1
+        elif name == 'title' and self._title_parts is not None:
+            self.title = ''.join(self._title_parts).strip()
+            self._title_parts = None
+        if not self._in_target:
+            return
+
+        if frame.get('code'):
+            code = ''.join(self._code_parts).strip()
+            self._code_parts = None
+            self._blocks[-1]['parts'].append(f"`{code}`")
+        if frame.get('line_break'):
+            self._blocks[-1]['parts'].append('\n')
+        if frame.get('list'):
+            self._list_depth -= 1
+        if frame.get('block'):
+            self._flush(self._blocks.pop(), final=True)
+        if frame.get('target'):
+            while self._blocks:
+                self._flush(self._blocks.pop(), final=True)
+            self._in_target = False
+            self._done = True
+
+    def _emit(self, line):
+        self.emit(line)
+        self.lines += 1
+
+    def _flush(self, block, final=False):
+        """Emit a block's captured text; a flushed li keeps any tail text"""
+        text = _NEWLINES.sub('\n', ''.join(block['parts']).strip())
+        block['parts'] = []
+        kind = block['kind']
+
+        if kind in HEADINGS:
+            if block['flushed'] and not text:
+                return
+            if self.lines:
+                self._emit('')
+            self._emit(f"{HEADINGS[kind]} {text}")
+        elif kind == 'code':
+            self._emit(text)
+        elif kind == 'li':
+            indent = '  ' * block['depth']
+            text = text.replace('\n', f"\n{indent}  ")
+            if not block['flushed']:
+                self._emit(f"{indent}- {text}")
+            elif text:
+                self._emit(f"{indent}  {text}")
+        elif text:
+            for line in text.split('\n') if kind == 'blockquote' else [text]:
+                self._emit(f"> {line}" if kind == 'blockquote' else line)
+        block['flushed'] = True
+
+
+def extract_title(html_content, profile=None):
+    soup = _as_soup(html_content, profile)
+    if profile and profile.title:
+        element = profile.title.select_one(soup)
+        title = ''
+        if element:
+            title = (element.get('content') if element.name == 'meta' else element.get_text()) or ''
+            title = title.strip()
+        return title or 'Untitled'
+    title = soup.title.string if soup.title and soup.title.string else 'Untitled'
     return title.strip()
 
-def process_content(html_content):
-    title = extract_title(html_content)
-    cleaned_content = clean_html(html_content)
-    return title, cleaned_content
\ No newline at end of file
+def process_content(html_content, encoding=None, profile=None):
+    # One parse shared by title and content extraction; bytes are decoded by
+    # the parser using the declared encoding (or <meta charset>)
+    if profile and profile.full_document:
+        soup = parse_html(html_content, encoding, full_document=True)
+    else:
+        soup = parse_html(html_content, encoding)
+    title = extract_title(soup, profile)
+    cleaned_content = clean_html(soup, profile)
+    return title, cleaned_content
+
+def _process_in_worker(html_content, encoding, profile_name, profile_spec):
+    """process_content() in a pool worker; profiles compile once per process"""
+    profile = get_profile(profile_name, profile_spec) if profile_name else None
+    return process_content(html_content, encoding, profile)
+
+class ParsePool:
+    """
+    Run process_content() in worker processes, outside the GIL
+
+    Threads that fetched a page hand its raw bytes over with process() and
+    block until the title and Markdown come back. At most `max_pending`
+    pages are queued or being parsed at once; further callers wait, so
+    memory stays bounded however many sources a run has. Use as a context
+    manager.
+
+    Args:
+        workers: Worker processes (default: CPU count)
+        max_pending: Pages in flight before callers block (default: 2 x workers)
+    """
+
+    def __init__(self, workers=None, max_pending=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 2
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        # forkserver/spawn: forking a process that runs fetch threads is unsafe
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+
+    def process(self, html_content, encoding=None, profile=None):
+        """Same as process_content(), executed in a worker process"""
+        name, spec = (None, None)
+        if profile is not None and profile is not DEFAULT_PROFILE:
+            name, spec = profile.name, profile.spec
+        with self._slots:
+            with self._lock:
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            try:
+                future = self._executor.submit(_process_in_worker, html_content, encoding, name, spec)
+                return future.result()
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+
+    def close(self):
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
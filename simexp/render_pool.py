@@ -0,0 +1,198 @@
+"""
+SimExp Render Pool
+Browser-rendered extraction for JavaScript-heavy sources
+
+A static fetch returns the page before any script runs, so sources that
+build their content client-side come back as "No content found." Sources
+marked with `render: true` are loaded instead in a pool of warm headless
+Chromium pages. The pool uses one browser and one context, blocks images,
+fonts and media, and hands the rendered DOM to processor just like a
+fetched page.
+
+- At most `pages` renders run at once (the concurrency cap)
+- A page is recycled (closed and replaced) after `max_uses` renders or an error
+- The browser is launched on first use and runs on its own event-loop
+  thread, so extraction worker threads can call render() directly
+
+♠️🌿🎸🧵 G.Music Assembly - Rendered Extraction
+"""
+
+import asyncio
+import threading
+from typing import Optional, Tuple
+
+DEFAULT_RENDER_PAGES = 2
+DEFAULT_MAX_USES = 50
+DEFAULT_RENDER_TIMEOUT = 30000  # ms, per navigation / wait
+BLOCKED_RESOURCES = ('image', 'font', 'media')
+
+
+class RenderPool:
+    """
+    Pool of warm headless browser pages for rendering sources
+
+    Usage:
+        with RenderPool(pages=4) as pool:
+            html, charset = pool.render(url)
+
+    Args:
+        pages: Warm pages, and so the maximum concurrent renders
+        max_uses: Renders per page before it is recycled
+        timeout: Navigation / selector timeout in milliseconds
+        blocked: Resource types that are never downloaded
+        cdp_url: Render in an existing Chrome over CDP instead of launching one
+    """
+
+    def __init__(self, pages: int = DEFAULT_RENDER_PAGES, max_uses: int = DEFAULT_MAX_USES,
+                 timeout: int = DEFAULT_RENDER_TIMEOUT, blocked=BLOCKED_RESOURCES, cdp_url: Optional[str] = None):
+        self.pages = max(1, int(pages))
+        self.max_uses = max(1, int(max_uses))
+        self.timeout = timeout
+        self.blocked = frozenset(blocked)
+        self.cdp_url = cdp_url
+
+        self.rendered = 0
+        self.recycled = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+        self._loop = None
+        self._thread = None
+        self._error = None
+        self._start_lock = threading.Lock()
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._idle = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def started(self) -> bool:
+        return self._loop is not None
+
+    def _ensure_started(self) -> None:
+        """Launch the browser and warm the pages once; a failed launch is not retried"""
+        with self._start_lock:
+            if self._error:
+                raise RuntimeError(self._error)
+            if self._loop:
+                return
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name='simexp-render', daemon=True)
+            thread.start()
+            try:
+                asyncio.run_coroutine_threadsafe(self._launch(), loop).result()
+            except Exception as e:
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join()
+                loop.close()
+                # Playwright errors carry a multi-line install banner; keep the first line
+                detail = str(e).strip().splitlines()
+                self._error = f"Could not start browser: {detail[0] if detail else type(e).__name__}"
+                raise RuntimeError(self._error) from e
+            self._loop, self._thread = loop, thread
+
+    async def _launch(self) -> None:
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        try:
+            if self.cdp_url:
+                self._browser = await self._playwright.chromium.connect_over_cdp(self.cdp_url)
+            else:
+                self._browser = await self._playwright.chromium.launch(headless=True)
+            self._context = await self._browser.new_context()
+            await self._context.route('**/*', self._route)
+            self._idle = asyncio.Queue()
+            for _ in range(self.pages):
+                await self._idle.put([await self._new_page(), 0])
+        except Exception:
+            await self._playwright.stop()
+            raise
+
+    async def _route(self, route) -> None:
+        if route.request.resource_type in self.blocked:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _new_page(self):
+        page = await self._context.new_page()
+        page.set_default_timeout(self.timeout)
+        return page
+
+    async def _render(self, url: str, wait_for: Optional[str]) -> str:
+        slot = await self._idle.get()
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        healthy = False
+        try:
+            if slot[0] is None:  # Replacement failed last time
+                slot[:] = [await self._new_page(), 0]
+            page = slot[0]
+            await page.goto(url, wait_until='networkidle', timeout=self.timeout)
+            if wait_for:
+                await page.wait_for_selector(wait_for)
+            html = await page.content()
+            healthy = True
+            self.rendered += 1
+            return html
+        finally:
+            self.in_flight -= 1
+            slot[1] += 1
+            if slot[0] is not None and (not healthy or slot[1] >= self.max_uses):
+                self.recycled += 1
+                try:
+                    await slot[0].close()
+                except Exception:
+                    pass
+                try:
+                    slot[:] = [await self._new_page(), 0]
+                except Exception:
+                    slot[:] = [None, 0]
+            self._idle.put_nowait(slot)
+
+    def render(self, url: str, wait_for: Optional[str] = None) -> Tuple[bytes, str]:
+        """
+        Render a page and return its DOM (blocks the calling thread)
+
+        Args:
+            url: Page to load
+            wait_for: CSS selector to wait for after the network is idle
+
+        Returns:
+            tuple: (html bytes, 'utf-8'), ready for processor.process_content()
+
+        Raises:
+            RuntimeError: If the browser could not be started
+        """
+        self._ensure_started()
+        html = asyncio.run_coroutine_threadsafe(self._render(url, wait_for), self._loop).result()
+        return html.encode('utf-8'), 'utf-8'
+
+    async def _shutdown(self) -> None:
+        for closer in (self._context, self._browser):
+            try:
+                if closer is not None:
+                    await closer.close()
+            except Exception:
+                pass
+        await self._playwright.stop()
+
+    def close(self) -> None:
+        """Close the pages, the browser and the event-loop thread"""
+        with self._start_lock:
+            if not self._loop:
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+            finally:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join()
+                self._loop.close()
+                self._loop = self._thread = None
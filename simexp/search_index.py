@@ -0,0 +1,248 @@
+"""
+SimExp Archive Search Index
+Full-text search over archived extractions (SQLite FTS5)
+
+Every archived document is indexed as it is saved, in BASE_PATH/.search.db:
+
+    documents      one row per (date, source): path and content hash
+    documents_fts  FTS5 table over the Markdown body (porter + unicode61),
+                   in ~64KB chunks with rowid = document id << 20 | chunk
+
+Chunking keeps indexing of streamed multi-megabyte pages in bounded
+memory. A day's document replaces its previous version, and an unchanged
+hash skips the re-index. Queries use FTS5 syntax ("exact phrase", AND/OR/NOT,
+prefix*), are ranked with bm25 and return highlighted snippets. Date and
+source filters use the documents table, so searching years of archives
+does not touch a single Markdown file. `simexp search --reindex` builds
+the index for archives written before it existed.
+
+♠️🌿🎸🧵 G.Music Assembly - Archive Search
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from typing import Optional, Dict, List, Callable, TextIO
+
+SEARCH_DB = '.search.db'
+DEFAULT_LIMIT = 20
+CHUNK_CHARS = 64 * 1024
+CHUNK_BITS = 20  # Chunks per document: up to 2**20 (64GB of text)
+LEGACY_FILE_PATTERN = re.compile(r'\d{8}_(.+?)\.md(?:\.gz|\.zst|\.diff)?')  # Daily files without a manifest
+
+_local = threading.local()
+_fts5_missing = False
+
+
+def get_search_db(base_path: str) -> str:
+    """Path of the archive's search index"""
+    return os.path.join(base_path, SEARCH_DB)
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Per-thread cached connection with the schema in place"""
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+    conn = connections.get(db_path)
+    if conn is None:
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        conn = sqlite3.connect(db_path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        with conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS documents ('
+                'id INTEGER PRIMARY KEY, date TEXT NOT NULL, source TEXT NOT NULL, '
+                'path TEXT NOT NULL, hash TEXT, UNIQUE(date, source))'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS documents_source ON documents (source, date)')
+            conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5("
+                "body, tokenize='porter unicode61')"
+            )
+        connections[db_path] = conn
+    return conn
+
+
+def close_connections() -> None:
+    """Close this thread's cached index connections"""
+    for conn in getattr(_local, 'connections', {}).values():
+        conn.close()
+    _local.connections = {}
+
+
+def _chunks(f: TextIO):
+    """Document text in ~CHUNK_CHARS pieces, split at line ends"""
+    chunk, size = [], 0
+    for line in f:
+        chunk.append(line)
+        size += len(line)
+        if size >= CHUNK_CHARS:
+            yield ''.join(chunk)
+            chunk, size = [], 0
+    if chunk:
+        yield ''.join(chunk)
+
+
+def index_document(base_path: str, date: str, source: str, path: str, digest: Optional[str],
+                   open_text: Callable[[], TextIO]) -> bool:
+    """
+    Add or replace a day's document in the index
+
+    Args:
+        base_path: Archive base path
+        date: YYYYMMDD
+        source: Source filename
+        path: Archived file path
+        digest: Content hash (an unchanged hash skips the work)
+        open_text: Opens the document as a text stream; only called when re-indexing
+
+    Returns:
+        bool: True if the document was (re-)indexed
+    """
+    global _fts5_missing
+    if _fts5_missing:
+        return False
+    try:
+        conn = _connect(get_search_db(base_path))
+    except sqlite3.OperationalError as e:
+        if 'fts5' in str(e).lower():
+            _fts5_missing = True
+            print("⚠️ Warning: SQLite has no FTS5 support; archive search is disabled")
+            return False
+        raise
+
+    row = conn.execute('SELECT id, hash, path FROM documents WHERE date = ? AND source = ?',
+                       (date, source)).fetchone()
+    if row and digest and row[1] == digest:
+        if row[2] != path:
+            with conn:
+                conn.execute('UPDATE documents SET path = ? WHERE id = ?', (path, row[0]))
+        return False
+
+    with conn, open_text() as f:
+        if row:
+            doc_id = row[0]
+            conn.execute('UPDATE documents SET path = ?, hash = ? WHERE id = ?', (path, digest, doc_id))
+            conn.execute('DELETE FROM documents_fts WHERE rowid BETWEEN ? AND ?',
+                         (doc_id << CHUNK_BITS, ((doc_id + 1) << CHUNK_BITS) - 1))
+        else:
+            doc_id = conn.execute('INSERT INTO documents (date, source, path, hash) VALUES (?, ?, ?, ?)',
+                                  (date, source, path, digest)).lastrowid
+        for number, chunk in enumerate(_chunks(f)):
+            conn.execute('INSERT INTO documents_fts (rowid, body) VALUES (?, ?)',
+                         ((doc_id << CHUNK_BITS) | number, chunk))
+    return True
+
+
+def _quote_terms(query: str) -> str:
+    """Plain-text fallback for queries that are not valid FTS5 syntax"""
+    return ' '.join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+
+def search(base_path: str, query: str, source: Optional[str] = None, since: Optional[str] = None,
+           until: Optional[str] = None, limit: int = DEFAULT_LIMIT) -> List[Dict]:
+    """
+    Ranked full-text search over the archive
+
+    Args:
+        base_path: Archive base path
+        query: FTS5 query - words, "exact phrase", AND/OR/NOT, prefix*
+        source: Only this source
+        since: Only days on or after YYYYMMDD
+        until: Only days on or before YYYYMMDD
+        limit: Maximum hits
+
+    Returns:
+        Hits, best first: {'date', 'source', 'path', 'snippet', 'score'}
+    """
+    db_path = get_search_db(base_path)
+    if not query.strip() or not os.path.exists(db_path):
+        return []
+
+    sql = ('SELECT documents_fts.rowid, d.id, d.date, d.source, d.path, bm25(documents_fts) '
+           f'FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid >> {CHUNK_BITS} '
+           'WHERE documents_fts MATCH ?')
+    params = []
+    if source:
+        sql += ' AND d.source = ?'
+        params.append(source)
+    if since:
+        sql += ' AND d.date >= ?'
+        params.append(since)
+    if until:
+        sql += ' AND d.date <= ?'
+        params.append(until)
+    sql += ' ORDER BY bm25(documents_fts)'
+
+    conn = _connect(db_path)
+    try:
+        cursor = conn.execute(sql, [query] + params)
+    except sqlite3.OperationalError:
+        query = _quote_terms(query)
+        cursor = conn.execute(sql, [query] + params)
+
+    # Best-ranked chunk of each document; snippets only for the hits returned
+    hits, seen = [], set()
+    for chunk_id, doc_id, date, name, path, score in cursor:
+        if doc_id in seen:
+            continue
+        seen.add(doc_id)
+        hits.append({'date': date, 'source': name, 'path': path, 'score': -score, '_chunk': chunk_id})
+        if len(hits) >= limit:
+            break
+    cursor.close()
+    for hit in hits:
+        hit['snippet'] = conn.execute(
+            "SELECT snippet(documents_fts, 0, '[', ']', '…', 16) FROM documents_fts "
+            'WHERE documents_fts MATCH ? AND rowid = ?', (query, hit.pop('_chunk'))
+        ).fetchone()[0]
+    return hits
+
+
+def reindex(base_path: str) -> int:
+    """
+    Index every archived document (for archives older than the index)
+
+    Daily folders are read through their manifest; files of folders written
+    before manifests existed (YYYYMMDD_<source>.md[.gz|.zst]) are indexed
+    without a hash, so they are re-read on every reindex.
+
+    Returns:
+        Number of documents (re-)indexed
+    """
+    import io
+    from .archiver import read_manifest, read_markdown, open_markdown
+
+    indexed = 0
+    if not os.path.isdir(base_path):
+        return indexed
+    for date in sorted(os.listdir(base_path)):
+        daily_folder = os.path.join(base_path, date)
+        if not re.fullmatch(r'\d{8}', date) or not os.path.isdir(daily_folder):
+            continue
+        manifest = read_manifest(daily_folder)
+        documents = [(source, os.path.join(daily_folder, entry['file']), entry.get('hash'))
+                     for source, entry in manifest.items()]
+        # Files saved before manifests existed: the source name comes from the filename
+        listed = {entry['file'] for entry in manifest.values()}
+        for name in sorted(os.listdir(daily_folder)):
+            match = LEGACY_FILE_PATTERN.fullmatch(name)
+            if match and name not in listed and match.group(1) not in manifest:
+                documents.append((match.group(1), os.path.join(daily_folder, name), None))
+
+        for source, path, digest in documents:
+            if not os.path.exists(path):
+                continue
+            try:
+                if path.endswith('.diff'):  # Snapshot diffs are rebuilt to their full text
+                    open_text = lambda: io.StringIO(read_markdown(path))
+                else:
+                    open_text = lambda: open_markdown(path)
+                if index_document(base_path, date, source, path, digest, open_text):
+                    indexed += 1
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Warning: Could not index {path}: {e}")
+    return indexed
@@ -0,0 +1,165 @@
+"""
+SimExp Session Archive
+Cold storage for completed sessions
+
+Completed sessions move their full history into a compressed archive
+(~/.simexp/archive/<session_id>.json.gz, or .json.zst when zstandard is
+installed) and leave a small stub in the workspace. The stub keeps the
+session ID, note references and summary stats, so directory-tree session
+lookups and `session list` only parse a few hundred bytes per workspace.
+
+♠️🌿🎸🧵 G.Music Assembly - Session Archival
+"""
+
+import os
+import gzip
+from datetime import datetime
+from typing import Optional, Dict
+
+from .session_storage import json_loads, json_dumps_compact
+
+ARCHIVE_DIR = os.path.expanduser('~/.simexp/archive')
+
+# Top-level fields kept in the workspace stub
+STUB_FIELDS = [
+    'session_id',
+    'search_key',
+    'session_uuid',
+    'note_uuid',
+    'note_url',
+    'public_url',
+    'title',
+    'ai_assistant',
+    'issue_number',
+    'cdp_endpoint',
+    'created_at',
+    'stats',
+    'schema_version',
+]
+
+COMPRESSION_EXTENSIONS = {
+    'gzip': '.json.gz',
+    'zstd': '.json.zst',
+}
+
+
+def is_archived(session: Optional[Dict]) -> bool:
+    """Whether a session dict is an archive stub"""
+    return bool(session and session.get('archived'))
+
+
+def get_archive_path(session_id: str, compression: str = 'gzip') -> str:
+    """Archive file path for a session ID"""
+    return os.path.join(ARCHIVE_DIR, f"{session_id}{COMPRESSION_EXTENSIONS[compression]}")
+
+
+def _write_archive(path: str, session: Dict, compression: str) -> int:
+    """Write the compressed archive atomically and return its size in bytes"""
+    payload = json_dumps_compact(session)
+
+    if compression == 'zstd':
+        import zstandard
+        data = zstandard.ZstdCompressor(level=10).compress(payload)
+    else:
+        data = gzip.compress(payload, compresslevel=9)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(data)
+
+
+def read_archive(path: str) -> Dict:
+    """
+    Read a compressed session archive
+
+    Args:
+        path: Path to a .json.gz or .json.zst archive
+
+    Returns:
+        Full session dictionary
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if path.endswith('.zst'):
+        import zstandard
+        payload = zstandard.ZstdDecompressor().decompress(data)
+    else:
+        payload = gzip.decompress(data)
+
+    return json_loads(payload)
+
+
+def archive_session(state, compression: str = 'gzip') -> Dict:
+    """
+    Move a session's history into cold storage and leave a stub
+
+    Args:
+        state: SessionState of the workspace holding the session
+        compression: 'gzip' (default) or 'zstd' (requires zstandard)
+
+    Returns:
+        The stub that now lives in the workspace
+
+    Raises:
+        ValueError: If there is no session, it is already archived,
+                    or the compression is unknown
+    """
+    if compression not in COMPRESSION_EXTENSIONS:
+        raise ValueError(f"Invalid compression: {compression}. Must be one of {list(COMPRESSION_EXTENSIONS)}")
+
+    session = state.load_session()
+    if not session:
+        raise ValueError("No session stored")
+    if is_archived(session):
+        raise ValueError(f"Session already archived at {session['archived']['path']}")
+
+    session.pop('_session_dir', None)
+    session.pop('_is_active', None)
+
+    archive_path = get_archive_path(session['session_id'], compression)
+    size_bytes = _write_archive(archive_path, session, compression)
+
+    stub = {key: session[key] for key in STUB_FIELDS if key in session}
+    # The published URL moves up from 'west' so note_lock_key() still finds the session
+    public_url = session.get('public_url') or (session.get('west') or {}).get('public_url')
+    if public_url:
+        stub['public_url'] = public_url
+    stub['archived'] = {
+        'path': archive_path,
+        'compression': compression,
+        'size_bytes': size_bytes,
+        'archived_at': datetime.now().isoformat(),
+        'completed_at': session.get('north', {}).get('completed_at'),
+    }
+
+    state.save_session(stub)
+    return stub
+
+
+def rehydrate_session(state) -> Dict:
+    """
+    Restore the full session history from its archive into the workspace
+
+    The archive file is kept, so rehydrating is always safe to repeat.
+
+    Args:
+        state: SessionState of the workspace holding the stub
+
+    Returns:
+        Full session dictionary
+
+    Raises:
+        ValueError: If there is no archived session in the workspace
+        FileNotFoundError: If the archive file is missing
+    """
+    stub = state.load_session()
+    if not is_archived(stub):
+        raise ValueError("Session is not archived")
+
+    session = read_archive(stub['archived']['path'])
+    state.save_session(session)
+    return session
@@ -0,0 +1,267 @@
+"""
+SimExp Session Index
+Full-text search across the history of every session (SQLite FTS5)
+
+Reflections, observed patterns, extracted wisdom, seeds for the next
+session and the text written to session notes are indexed as they are
+tracked, in ~/.simexp/session_index.db:
+
+    entries      one row per tracked item: session, workspace, kind, timestamp
+    entries_fts  FTS5 table over the item's text (porter + unicode61)
+
+An entry is identified by (session_id, kind, timestamp), so indexing the
+same item twice is a no-op. Finding what an earlier session concluded is
+one indexed query instead of loading every workspace's session file and
+decompressing the archive. `simexp session search --reindex` adds the
+history of registered workspaces and archived sessions tracked before the
+index existed (write text is only known to the index, so it is kept).
+
+♠️🌿🎸🧵 G.Music Assembly - Session Search
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Optional, Dict, List, Iterator, Tuple
+
+from .search_index import _quote_terms
+
+SESSION_INDEX_DB = os.path.expanduser('~/.simexp/session_index.db')
+DEFAULT_LIMIT = 20
+
+# kind -> (direction, action_type, text field) for items kept in the session history
+SESSION_KINDS = {
+    'reflection': ('north', 'reflection_notes', 'reflection'),
+    'pattern': ('north', 'observed_patterns', 'pattern'),
+    'wisdom': ('north', 'extracted_wisdom', 'wisdom'),
+    'seed': ('north', 'seeds_for_next', 'seed'),
+    'write': ('south', 'content_written', None),  # Text lives in the index only
+}
+
+_local = threading.local()
+_fts5_missing = False
+
+
+def _connect(db_path: Optional[str] = None) -> Optional[sqlite3.Connection]:
+    """Per-thread cached connection with the schema in place (None without FTS5)"""
+    global _fts5_missing
+    if _fts5_missing:
+        return None
+    db_path = db_path or SESSION_INDEX_DB
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+    conn = connections.get(db_path)
+    if conn is None:
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        conn = sqlite3.connect(db_path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        try:
+            with conn:
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS entries ('
+                    'id INTEGER PRIMARY KEY, session_id TEXT NOT NULL, workspace TEXT, '
+                    'kind TEXT NOT NULL, timestamp TEXT NOT NULL, '
+                    'UNIQUE(session_id, kind, timestamp))'
+                )
+                conn.execute('CREATE INDEX IF NOT EXISTS entries_kind ON entries (kind, timestamp)')
+                conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5("
+                    "body, tokenize='porter unicode61')"
+                )
+        except sqlite3.OperationalError as e:
+            conn.close()
+            if 'fts5' in str(e).lower():
+                _fts5_missing = True
+                print("⚠️ Warning: SQLite has no FTS5 support; session search is disabled")
+                return None
+            raise
+        connections[db_path] = conn
+    return conn
+
+
+def close_connections() -> None:
+    """Close this thread's cached index connections"""
+    for conn in getattr(_local, 'connections', {}).values():
+        conn.close()
+    _local.connections = {}
+
+
+def _insert(conn: sqlite3.Connection, session_id: str, workspace: Optional[str], kind: str,
+            timestamp: str, text: str) -> bool:
+    """Insert one entry unless it is already indexed"""
+    cursor = conn.execute(
+        'INSERT OR IGNORE INTO entries (session_id, workspace, kind, timestamp) VALUES (?, ?, ?, ?)',
+        (session_id, workspace, kind, timestamp))
+    if not cursor.rowcount:
+        return False
+    conn.execute('INSERT INTO entries_fts (rowid, body) VALUES (?, ?)', (cursor.lastrowid, text))
+    return True
+
+
+def index_entry(session_id: str, kind: str, text: str, timestamp: str,
+                workspace: Optional[str] = None, db_path: Optional[str] = None) -> bool:
+    """
+    Add one tracked item to the session index
+
+    Args:
+        session_id: Session the item belongs to
+        kind: A key of SESSION_KINDS
+        text: Searchable text
+        timestamp: ISO timestamp of the tracked action
+        workspace: Workspace directory of the session
+        db_path: Index file (default: SESSION_INDEX_DB)
+
+    Returns:
+        bool: True if the entry was added (False if already indexed)
+    """
+    if kind not in SESSION_KINDS:
+        raise ValueError(f"Invalid kind: {kind}. Must be one of {list(SESSION_KINDS)}")
+    if not text or not text.strip():
+        return False
+    conn = _connect(db_path)
+    if conn is None:
+        return False
+    with conn:
+        return _insert(conn, session_id, workspace, kind, timestamp, text)
+
+
+def _entry_text(kind: str, entry: Dict) -> Optional[str]:
+    """Searchable text of a session history entry"""
+    field = SESSION_KINDS[kind][2]
+    if field is None or not isinstance(entry, dict):
+        return None
+    text = entry.get(field)
+    if kind == 'reflection' and entry.get('prompt'):
+        text = f"{entry['prompt']}\n{text or ''}"
+    return text
+
+
+def session_entries(session: Dict) -> Iterator[Tuple[str, str, str]]:
+    """
+    Searchable items of a full session dict
+
+    Yields:
+        (kind, timestamp, text) for every reflection, pattern, wisdom and seed
+    """
+    for kind, (direction, action_type, _) in SESSION_KINDS.items():
+        for entry in (session.get(direction) or {}).get(action_type) or []:
+            text = _entry_text(kind, entry)
+            if text and entry.get('timestamp'):
+                yield kind, entry['timestamp'], text
+
+
+def index_session(session: Dict, workspace: Optional[str] = None, db_path: Optional[str] = None) -> int:
+    """
+    Add a session's history to the index (entries already indexed are skipped)
+
+    Args:
+        session: Full session dictionary (not an archive stub)
+        workspace: Workspace directory of the session
+        db_path: Index file (default: SESSION_INDEX_DB)
+
+    Returns:
+        Number of entries added
+    """
+    session_id = session.get('session_id')
+    conn = _connect(db_path)
+    if not session_id or conn is None:
+        return 0
+    added = 0
+    with conn:
+        for kind, timestamp, text in session_entries(session):
+            if _insert(conn, session_id, workspace, kind, timestamp, text):
+                added += 1
+    return added
+
+
+def search_sessions(query: str, kind: Optional[str] = None, session_id: Optional[str] = None,
+                    since: Optional[str] = None, limit: int = DEFAULT_LIMIT,
+                    db_path: Optional[str] = None) -> List[Dict]:
+    """
+    Ranked full-text search across every indexed session
+
+    Args:
+        query: FTS5 query - words, "exact phrase", AND/OR/NOT, prefix*
+        kind: Only this kind of entry (reflection, pattern, wisdom, seed, write)
+        session_id: Only this session
+        since: Only entries tracked on or after this ISO date/timestamp
+        limit: Maximum hits
+        db_path: Index file (default: SESSION_INDEX_DB)
+
+    Returns:
+        Hits, best first: {'session_id', 'workspace', 'kind', 'timestamp', 'text', 'snippet', 'score'}
+    """
+    db_path = db_path or SESSION_INDEX_DB
+    if not query.strip() or not os.path.exists(db_path):
+        return []
+    conn = _connect(db_path)
+    if conn is None:
+        return []
+
+    sql = ("SELECT e.session_id, e.workspace, e.kind, e.timestamp, entries_fts.body, "
+           "snippet(entries_fts, 0, '[', ']', '…', 16), bm25(entries_fts) "
+           'FROM entries_fts JOIN entries e ON e.id = entries_fts.rowid '
+           'WHERE entries_fts MATCH ?')
+    params = []
+    if kind:
+        sql += ' AND e.kind = ?'
+        params.append(kind)
+    if session_id:
+        sql += ' AND e.session_id = ?'
+        params.append(session_id)
+    if since:
+        sql += ' AND e.timestamp >= ?'
+        params.append(since)
+    sql += ' ORDER BY bm25(entries_fts) LIMIT ?'
+    params.append(limit)
+
+    try:
+        rows = conn.execute(sql, [query] + params).fetchall()
+    except sqlite3.OperationalError:
+        rows = conn.execute(sql, [_quote_terms(query)] + params).fetchall()
+    return [{'session_id': sid, 'workspace': workspace, 'kind': entry_kind, 'timestamp': timestamp,
+             'text': text, 'snippet': snippet, 'score': -score}
+            for sid, workspace, entry_kind, timestamp, text, snippet, score in rows]
+
+
+def reindex_sessions(db_path: Optional[str] = None) -> int:
+    """
+    Index the history of every registered workspace and archived session
+
+    Returns:
+        Number of entries added
+    """
+    from .session_manager import SessionState, list_registered_workspaces
+    from .session_archive import is_archived, read_archive
+    from . import session_archive
+
+    added = 0
+    seen = set()
+    for workspace in list_registered_workspaces():
+        try:
+            session = SessionState(workspace_dir=workspace).storage.load()
+            if not session:
+                continue
+            if is_archived(session):
+                session = read_archive(session['archived']['path'])
+            seen.add(session.get('session_id'))
+            added += index_session(session, workspace, db_path)
+        except Exception as e:
+            print(f"⚠️ Warning: Could not index session in {workspace}: {e}")
+
+    # Archived sessions whose workspace is gone (or was never registered)
+    archive_dir = session_archive.ARCHIVE_DIR
+    if os.path.isdir(archive_dir):
+        extensions = tuple(session_archive.COMPRESSION_EXTENSIONS.values())
+        for name in sorted(os.listdir(archive_dir)):
+            extension = next((ext for ext in extensions if name.endswith(ext)), None)
+            if extension is None or name[:-len(extension)] in seen:
+                continue
+            path = os.path.join(archive_dir, name)
+            try:
+                added += index_session(read_archive(path), None, db_path)
+            except Exception as e:
+                print(f"⚠️ Warning: Could not index archive {path}: {e}")
+    return added
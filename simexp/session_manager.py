@@ -6,17 +6,39 @@ Manages terminal session state and Simplenote note creation
 """
 
 import os
+import re
 import json
 import uuid
 import asyncio
 from datetime import datetime
 from typing import Optional, Dict, List
 from pathlib import Path
-import yaml
-import pyperclip
 
 from .playwright_writer import SimplenoteWriter, write_to_note
 from .session_file_handler import SessionFileHandler
+from .session_storage import open_storage
+from .session_archive import is_archived, rehydrate_session
+from .note_lock import session_note_lock
+
+
+# Current session file schema. Bump it together with a new @session_migration.
+#   1: original session (no Four Directions structure, no schema_version field)
+#   2: Four Directions structure (east/south/west/north + stats)
+SCHEMA_VERSION = 2
+
+# Workspaces that have held a session, for bulk operations (migrate --all)
+SESSION_REGISTRY_FILE = os.path.expanduser('~/.simexp/session_registry.json')
+
+# from_version -> function upgrading a session dict to from_version + 1
+_SESSION_MIGRATIONS = {}
+
+
+def session_migration(from_version: int):
+    """Register a function that upgrades a session dict from one schema version to the next"""
+    def decorator(func):
+        _SESSION_MIGRATIONS[from_version] = func
+        return func
+    return decorator
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -73,10 +95,12 @@ def initialize_four_directions_session(session_data: Dict) -> Dict:
         'completion_percentage': 0
     }
 
+    session_data['schema_version'] = SCHEMA_VERSION
+
     return session_data
 
 
-def update_session_data(direction: str, action_type: str, action_data: Dict) -> None:
+def update_session_data(direction: str, action_type: str, action_data: Dict) -> Optional[str]:
     """
     Update session data for a specific direction and action type
 
@@ -88,6 +112,27 @@ def update_session_data(direction: str, action_type: str, action_data: Dict) ->
         action_type: Type of action within the direction (e.g., 'files_added', 'reflection_notes')
         action_data: Dictionary containing the action data to append
 
+    Returns:
+        ID of the updated session
+
+    Raises:
+        ValueError: If direction or action_type is invalid
+    """
+    return append_session_actions(direction, action_type, [action_data])
+
+
+def append_session_actions(direction: str, action_type: str, actions: List[Dict]) -> Optional[str]:
+    """
+    Append several actions to one direction with a single load and save
+
+    Args:
+        direction: Cardinal direction ('east', 'south', 'west', 'north')
+        action_type: Type of action within the direction (e.g., 'files_added')
+        actions: Action dictionaries to append, in order
+
+    Returns:
+        ID of the updated session
+
     Raises:
         ValueError: If direction or action_type is invalid
     """
@@ -95,26 +140,38 @@ def update_session_data(direction: str, action_type: str, action_data: Dict) ->
     if direction not in valid_directions:
         raise ValueError(f"Invalid direction: {direction}. Must be one of {valid_directions}")
 
-    # Get active session
-    session = get_active_session()
-    if not session:
+    # Locate the active session's storage
+    state = find_active_session_state()
+    if not state:
         raise ValueError("No active session found")
 
-    # Ensure direction exists
-    if direction not in session:
-        session = migrate_legacy_session(session)
+    # Append timestamp to actions if not present
+    for action_data in actions:
+        if 'timestamp' not in action_data:
+            action_data['timestamp'] = datetime.now().isoformat()
 
-    # Append timestamp to action if not present
-    if 'timestamp' not in action_data:
-        action_data['timestamp'] = datetime.now().isoformat()
+    # SQLite: append one row per action and refresh stats from indexed counts,
+    # all on one connection in one transaction
+    if state.backend == 'sqlite':
+        with state.storage.transaction():
+            if state.storage.has_direction(direction):
+                for action_data in actions:
+                    state.append_action(direction, action_type, action_data)
+                return _refresh_sqlite_stats(state).get('session_id')
+
+    session = state.load_session()
 
-    # Append action to the appropriate array
+    # Archived sessions get their history back before new actions are added
+    if is_archived(session):
+        session = rehydrate_session(state)
+
+    # Append actions to the appropriate array
     if action_type in session[direction]:
         if isinstance(session[direction][action_type], list):
-            session[direction][action_type].append(action_data)
-        else:
+            session[direction][action_type].extend(actions)
+        elif actions:
             # Handle non-list fields (like 'published')
-            session[direction][action_type] = action_data
+            session[direction][action_type] = actions[-1]
     else:
         raise ValueError(f"Invalid action_type: {action_type} for direction {direction}")
 
@@ -122,8 +179,8 @@ def update_session_data(direction: str, action_type: str, action_data: Dict) ->
     calculate_session_stats(session)
 
     # Save session
-    state = SessionState()
     state.save_session(session)
+    return session.get('session_id')
 
 
 def calculate_session_stats(session: Dict) -> Dict:
@@ -139,9 +196,6 @@ def calculate_session_stats(session: Dict) -> Dict:
     Returns:
         Updated session dictionary with recalculated stats
     """
-    if 'south' not in session:
-        session = migrate_legacy_session(session)
-
     # Count files
     total_files = len(session.get('south', {}).get('files_added', []))
 
@@ -155,6 +209,25 @@ def calculate_session_stats(session: Dict) -> Dict:
             collab_emails.add(collab['collaborator_email'])
     total_collaborators = len(collab_emails)
 
+    # Update stats
+    session['stats'] = _compute_stats(session, total_files, total_writes, total_collaborators)
+
+    return session
+
+
+def _compute_stats(session: Dict, total_files: int, total_writes: int, total_collaborators: int) -> Dict:
+    """
+    Build the stats dictionary from action counts and direction fields
+
+    Args:
+        session: Session dictionary (action lists are not read)
+        total_files: Number of tracked file additions
+        total_writes: Number of tracked content writes
+        total_collaborators: Number of unique collaborator emails
+
+    Returns:
+        Stats dictionary
+    """
     # Calculate session duration
     created_at = session.get('created_at')
     if created_at:
@@ -170,7 +243,7 @@ def calculate_session_stats(session: Dict) -> Dict:
 
     if session.get('east', {}).get('vision_statement'):
         completion_count += 1
-    if session.get('south', {}).get('files_added') or session.get('south', {}).get('content_written'):
+    if total_files or total_writes:
         completion_count += 1
     if session.get('west', {}).get('published'):
         completion_count += 1
@@ -179,8 +252,7 @@ def calculate_session_stats(session: Dict) -> Dict:
 
     completion_percentage = int((completion_count / total_directions) * 100)
 
-    # Update stats
-    session['stats'] = {
+    return {
         'total_files': total_files,
         'total_writes': total_writes,
         'total_collaborators': total_collaborators,
@@ -188,7 +260,28 @@ def calculate_session_stats(session: Dict) -> Dict:
         'completion_percentage': completion_percentage
     }
 
-    return session
+
+def _refresh_sqlite_stats(state: 'SessionState') -> Dict:
+    """
+    Recalculate stats for a SQLite-backed session using indexed counts
+
+    Args:
+        state: SessionState using the SQLite backend
+
+    Returns:
+        Top-level session fields, with the refreshed stats
+    """
+    storage = state.storage
+    meta = storage.load_meta()
+    stats = _compute_stats(
+        meta,
+        storage.count_actions('south', 'files_added'),
+        storage.count_actions('south', 'content_written'),
+        len(storage.distinct_values('south', 'collaborations', 'collaborator_email'))
+    )
+    storage.set_meta('stats', stats)
+    meta['stats'] = stats
+    return meta
 
 
 def migrate_legacy_session(session: Dict) -> Dict:
@@ -240,6 +333,52 @@ def migrate_legacy_session(session: Dict) -> Dict:
     return session
 
 
+@session_migration(1)
+def _migrate_v1_to_v2(session: Dict) -> Dict:
+    """Schema 1 -> 2: add the Four Directions structure"""
+    return migrate_legacy_session(session)
+
+
+def get_schema_version(session: Dict) -> int:
+    """Schema version of a session dict (files without the field are version 1)"""
+    return session.get('schema_version', 1)
+
+
+def upgrade_session(session: Dict) -> bool:
+    """
+    Upgrade a session dict in place to SCHEMA_VERSION
+
+    Applies registered migrations one version at a time. Archive stubs are
+    left alone; their full history is upgraded when rehydrated.
+
+    Args:
+        session: Session dictionary
+
+    Returns:
+        True if the session was changed and should be persisted
+    """
+    if is_archived(session):
+        return False
+
+    version = get_schema_version(session)
+    if version >= SCHEMA_VERSION:
+        return False
+
+    while version < SCHEMA_VERSION:
+        migration = _SESSION_MIGRATIONS.get(version)
+        if migration is None:
+            raise ValueError(f"No session migration registered from schema version {version}")
+        migrated = migration(session)
+        if migrated is not session:
+            session.clear()
+            session.update(migrated)
+        version += 1
+        session['schema_version'] = version
+
+    return True
+
+
+@session_note_lock('add', on_timeout=None)
 async def handle_session_add(file_path: str, heading: Optional[str] = None, cdp_url: Optional[str] = None, direction: str = 'south') -> None:
     """
     Handle the session add command
@@ -332,34 +471,8 @@ def _track_file_addition(file_path: str, heading: Optional[str], direction: str,
         content_length: Length of formatted content in characters
     """
     try:
-        # Detect content type from file extension
-        file_ext = Path(file_path).suffix.lower()
-        content_type_map = {
-            '.md': 'markdown',
-            '.txt': 'text',
-            '.py': 'python',
-            '.js': 'javascript',
-            '.json': 'json',
-            '.yaml': 'yaml',
-            '.yml': 'yaml',
-            '.html': 'html',
-            '.css': 'css',
-            '.sh': 'shell'
-        }
-        content_type = content_type_map.get(file_ext, 'document')
-
-        # Prepare file metadata
-        file_data = {
-            'path': file_path,
-            'filename': Path(file_path).name,
-            'heading': heading,
-            'content_type': content_type,
-            'size_chars': content_length,
-            'direction': direction
-        }
-
         # Update session data
-        update_session_data(direction, 'files_added', file_data)
+        update_session_data(direction, 'files_added', _file_metadata(file_path, heading, direction, content_length))
         print(f"📊 File tracked in {direction.upper()} direction")
 
     except Exception as e:
@@ -367,62 +480,346 @@ def _track_file_addition(file_path: str, heading: Optional[str], direction: str,
         print(f"⚠️ Warning: Could not track file metadata: {e}")
 
 
+def _file_metadata(file_path: str, heading: Optional[str], direction: str, content_length: int) -> Dict:
+    """files_added entry for a file (content type from its extension)"""
+    # Detect content type from file extension
+    file_ext = Path(file_path).suffix.lower()
+    content_type_map = {
+        '.md': 'markdown',
+        '.txt': 'text',
+        '.py': 'python',
+        '.js': 'javascript',
+        '.json': 'json',
+        '.yaml': 'yaml',
+        '.yml': 'yaml',
+        '.html': 'html',
+        '.css': 'css',
+        '.sh': 'shell'
+    }
+    content_type = content_type_map.get(file_ext, 'document')
+
+    return {
+        'path': file_path,
+        'filename': Path(file_path).name,
+        'heading': heading,
+        'content_type': content_type,
+        'size_chars': content_length,
+        'direction': direction
+    }
+
+
+@session_note_lock('add', on_timeout=0)
+async def handle_session_add_batch(files: List[Dict], cdp_url: Optional[str] = None, direction: str = 'south') -> int:
+    """
+    Add several files to the session note in one browser attach
+
+    The note is searched for once and all files are appended with a single
+    write; every file is then tracked as its own `files_added` entry, in
+    one session save.
+
+    Args:
+        files: Dicts with 'path', optional 'heading', optional 'content'
+               (text to use instead of reading the file) and optional
+               'metadata' (extra keys stored with the files_added entry)
+        cdp_url: Optional CDP URL for browser connection
+        direction: Cardinal direction for the tracked entries. Default: 'south'
+
+    Returns:
+        Number of files added to the note
+    """
+    session = get_active_session()
+    if not session:
+        print("❌ No active session. Start a session first with 'simexp session start'")
+        return 0
+
+    if not cdp_url:
+        from .simex import get_cdp_url
+        cdp_url = get_cdp_url()
+
+    handler = SessionFileHandler()
+    sections = []
+    tracked = []
+    for entry in files:
+        file_path = str(Path(entry['path']).resolve())
+        # Archived Markdown may be compressed or a snapshot diff: label it as .md
+        display_path = re.sub(r'\.md(\.gz|\.zst|\.diff)$', '.md', file_path)
+        try:
+            content = entry['content'] if entry.get('content') is not None else handler.read_file(file_path)
+        except OSError as e:
+            print(f"⚠️ Warning: Skipping {Path(file_path).name}: {e}")
+            continue
+        formatted_content = handler.format_content(display_path, content, entry.get('heading'))
+        sections.append(formatted_content)
+        file_data = _file_metadata(display_path, entry.get('heading'), direction, len(formatted_content))
+        file_data.update(path=file_path, filename=Path(file_path).name)
+        file_data.update(entry.get('metadata') or {})
+        tracked.append(file_data)
+
+    if not sections:
+        print("⚠️ Nothing to add")
+        return 0
+
+    try:
+        async with SimplenoteWriter(note_url='https://app.simplenote.com/', cdp_url=cdp_url) as writer:
+            print(f"🌐 Adding {len(sections)} File(s) to Session Note")
+            print(f"🔮 Session: {session['session_id']}")
+            print(f"🧭 Direction: {direction.upper()}")
+
+            await writer.page.goto('https://app.simplenote.com/')
+            await writer.page.wait_for_load_state('networkidle')
+
+            if not await search_and_select_note(session['session_id'], writer.page):
+                print("❌ Could not find session note")
+                return 0
+
+            content = "\n\n".join(sections)
+            print(f"✍️ Writing {len(content)} chars in one append")
+            await writer.append_content(content)
+    except Exception as e:
+        print(f"❌ Error adding files: {e}")
+        return 0
+
+    for file_data in tracked:
+        print(f"✅ Added file: {file_data['filename']} to session")
+    try:
+        append_session_actions(direction, 'files_added', tracked)
+        print(f"📊 {len(tracked)} file(s) tracked in {direction.upper()} direction")
+    except Exception as e:
+        print(f"⚠️ Warning: Could not track file metadata: {e}")
+    return len(tracked)
+
+
 class SessionState:
     """
     Manages local session state persistence
 
-    State is stored in .simexp/session.json in the current working directory
+    State is stored in .simexp/ in the current working directory, either as
+    session.json (default) or session.db when the SQLite storage backend is
+    selected (SESSION_STORAGE: sqlite in ~/.simexp/simexp.yaml)
     """
 
     STATE_DIR = '.simexp'
     STATE_FILE = 'session.json'
 
-    def __init__(self, workspace_dir: str = None):
+    def __init__(self, workspace_dir: str = None, backend: Optional[str] = None):
         """
         Initialize SessionState
 
         Args:
             workspace_dir: Workspace directory (defaults to current working directory)
+            backend: Storage backend ('json' or 'sqlite'). Defaults to the backend
+                     of the existing session, or the configured one for new sessions.
         """
         self.workspace_dir = workspace_dir or os.getcwd()
         self.state_dir = os.path.join(self.workspace_dir, self.STATE_DIR)
-        self.state_file = os.path.join(self.state_dir, self.STATE_FILE)
+        self.storage = open_storage(self.state_dir, backend)
+        self.state_file = self.storage.path
+        self._loaded = None  # Session parsed while locating this workspace, used by the next load
+
+    @property
+    def backend(self) -> str:
+        """Name of the storage backend in use"""
+        return self.storage.name
 
     def ensure_state_dir(self):
         """Create .simexp directory if it doesn't exist"""
         os.makedirs(self.state_dir, exist_ok=True)
 
+    def exists(self) -> bool:
+        """Whether a session is stored in this workspace"""
+        return self.storage.exists()
+
     def save_session(self, session_data: Dict) -> None:
         """
-        Save session data to .simexp/session.json
+        Save session data to the workspace storage
 
         Args:
             session_data: Dictionary containing session information
         """
+        self._loaded = None
         self.ensure_state_dir()
-        with open(self.state_file, 'w') as f:
-            json.dump(session_data, f, indent=2)
+        self.storage.save(session_data)
 
     def load_session(self) -> Optional[Dict]:
         """
-        Load session data from .simexp/session.json
+        Load session data from the workspace storage
+
+        Older schema versions are upgraded once here and written back, so
+        the rest of SimExp can rely on the current structure.
 
         Returns:
             Session data dictionary or None if no active session
         """
-        if not os.path.exists(self.state_file):
-            return None
-
-        try:
-            with open(self.state_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return None
+        session, self._loaded = (self._loaded or self.storage.load()), None
+        if session and upgrade_session(session):
+            try:
+                self.storage.save(session)
+            except OSError:
+                pass  # Read-only workspace: keep the upgraded copy in memory
+        return session
 
     def clear_session(self) -> None:
-        """Remove session state file"""
-        if os.path.exists(self.state_file):
-            os.remove(self.state_file)
+        """Remove session state"""
+        self._loaded = None
+        self.storage.clear()
+
+    def append_action(self, direction: str, action_type: str, action_data: Dict) -> None:
+        """
+        Append a tracked action without rewriting unrelated history
+
+        Args:
+            direction: Cardinal direction ('east', 'south', 'west', 'north')
+            action_type: Action list within the direction (e.g., 'content_written')
+            action_data: Action dictionary to append
+
+        Raises:
+            ValueError: If no session is stored or action_type is invalid
+        """
+        self._loaded = None
+        self.storage.append_action(direction, action_type, action_data)
+
+    def query_actions(
+        self,
+        direction: str,
+        action_type: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Query tracked actions by time range
+
+        With the SQLite backend this is an indexed lookup that does not
+        load the rest of the session history.
+
+        Args:
+            direction: Cardinal direction ('east', 'south', 'west', 'north')
+            action_type: Action list within the direction
+            since: Inclusive ISO8601 lower bound on the action timestamp
+            until: Exclusive ISO8601 upper bound on the action timestamp
+            limit: Only return the most recent N matching actions
+
+        Returns:
+            List of action dictionaries, oldest first
+
+        Examples:
+            # Writes in the last hour
+            since = (datetime.now() - timedelta(hours=1)).isoformat()
+            state.query_actions('south', 'content_written', since=since)
+        """
+        return self.storage.query_actions(direction, action_type, since=since, until=until, limit=limit)
+
+    def export_json(self, json_path: str) -> None:
+        """
+        Export the session as a plain JSON document (session.json format)
+
+        Args:
+            json_path: Destination file path
+        """
+        session = self.load_session()
+        if session is None:
+            raise ValueError("No session stored")
+        with open(json_path, 'w') as f:
+            json.dump(session, f, indent=2)
+
+    def import_json(self, json_path: str) -> None:
+        """
+        Import a session from a JSON document (session.json format)
+
+        Args:
+            json_path: Source file path
+        """
+        with open(json_path, 'r') as f:
+            self.save_session(json.load(f))
+
+
+def register_session_workspace(workspace_dir: str) -> None:
+    """
+    Record a workspace that holds a session in ~/.simexp/session_registry.json
+
+    Args:
+        workspace_dir: Directory containing the .simexp/ folder
+    """
+    workspaces = list_registered_workspaces()
+    workspace_dir = os.path.abspath(workspace_dir)
+    if workspace_dir in workspaces:
+        return
+
+    workspaces.append(workspace_dir)
+    try:
+        os.makedirs(os.path.dirname(SESSION_REGISTRY_FILE), exist_ok=True)
+        with open(SESSION_REGISTRY_FILE, 'w') as f:
+            json.dump({'workspaces': workspaces}, f, indent=2)
+    except OSError:
+        pass  # Registry is best-effort
+
+
+def list_registered_workspaces() -> List[str]:
+    """
+    Workspaces recorded in the session registry
+
+    Returns:
+        List of workspace directories (may include ones that no longer exist)
+    """
+    if not os.path.exists(SESSION_REGISTRY_FILE):
+        return []
+
+    try:
+        with open(SESSION_REGISTRY_FILE, 'r') as f:
+            return list(json.load(f).get('workspaces', []))
+    except (json.JSONDecodeError, IOError, AttributeError):
+        return []
+
+
+def migrate_session_workspace(workspace_dir: str) -> Dict:
+    """
+    Upgrade the session stored in one workspace to SCHEMA_VERSION
+
+    Args:
+        workspace_dir: Directory containing the .simexp/ folder
+
+    Returns:
+        Dict with workspace, from_version, to_version and status
+        ('migrated', 'current', 'archived', 'missing' or 'error')
+    """
+    result = {'workspace': workspace_dir, 'from_version': None, 'to_version': None}
+    try:
+        state = SessionState(workspace_dir=workspace_dir)
+        session = state.storage.load()
+        if not session:
+            result['status'] = 'missing'
+            return result
+
+        result['from_version'] = get_schema_version(session)
+        if is_archived(session):
+            result['status'] = 'archived'
+        elif upgrade_session(session):
+            state.storage.save(session)
+            result['status'] = 'migrated'
+        else:
+            result['status'] = 'current'
+        result['to_version'] = get_schema_version(session)
+    except Exception as e:
+        result['status'] = 'error'
+        result['error'] = str(e)
+    return result
+
+
+def migrate_all_sessions(workspace_dirs: List[str], max_workers: int = 8) -> List[Dict]:
+    """
+    Upgrade many session workspaces in parallel
+
+    Args:
+        workspace_dirs: Workspace directories to upgrade
+        max_workers: Number of worker threads
+
+    Returns:
+        List of migrate_session_workspace() results, in input order
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(migrate_session_workspace, workspace_dirs))
 
 
 def generate_html_metadata(
@@ -455,6 +852,8 @@ def generate_html_metadata(
     Returns:
         Hidden div with YAML metadata as string
     """
+    import yaml
+
     if agents is None:
         agents = ['Jerry', 'Aureon', 'Nyro', 'JamAI', 'Synth']
 
@@ -590,6 +989,7 @@ async def create_session_note(
 
         # Use clipboard-based insertion for reliability (faster and handles large content)
         print(f"📝 Writing content to note (via clipboard)...")
+        import pyperclip
         pyperclip.copy(full_content)
         await writer.page.keyboard.press('Control+a')  # Select all (in case there's placeholder text)
         await asyncio.sleep(0.2)
@@ -616,6 +1016,7 @@ async def create_session_note(
 
     state = SessionState()
     state.save_session(session_data)
+    register_session_workspace(state.workspace_dir)
     print(f"💾 Session state saved to {state.state_file}")
     print(f"🔑 Search key: {session_id}")
     print(f"🧭 Four Directions structure initialized")
@@ -623,30 +1024,44 @@ async def create_session_note(
     return session_data
 
 
-def get_active_session() -> Optional[Dict]:
+def _is_loadable(state: 'SessionState') -> bool:
     """
-    Get the currently active session
+    Whether a workspace holds a session that can be read
 
-    Searches for session.json in this order:
-    1. Current directory: ./.simexp/session.json
-    2. Parent directories: ../.simexp/session.json (walking up)
-    3. Home directory: ~/.simexp/session.json
+    Corrupt or unparseable session files are skipped, so they never hide a
+    valid session further up the tree. SQLite sessions are checked through
+    their metadata only; a parsed JSON session is kept for the next load.
+    """
+    if not state.exists():
+        return False
+    if state.backend == 'sqlite':
+        return state.storage.is_readable()
+    session = state.storage.load()
+    if not isinstance(session, dict) or not session:
+        return False
+    state._loaded = session
+    return True
 
-    Returns:
-        Session data dictionary or None if no active session
+
+def find_active_session_state() -> Optional['SessionState']:
     """
-    # Start from current directory
-    current_dir = os.getcwd()
+    Locate the storage of the currently active session without loading
+    its history (unreadable session files are skipped)
 
-    # Walk up directory tree looking for .simexp/session.json
-    check_dir = current_dir
+    Searches for a stored session in this order:
+    1. Current directory: ./.simexp/
+    2. Parent directories: ../.simexp/ (walking up)
+    3. Home directory: ~/.simexp/
+
+    Returns:
+        SessionState for the active session or None if no active session
+    """
+    # Walk up directory tree looking for .simexp/session.json (or session.db)
+    check_dir = os.getcwd()
     while True:
         state = SessionState(workspace_dir=check_dir)
-        session = state.load_session()
-        if session:
-            # Add directory info to session data
-            session['_session_dir'] = state.state_dir
-            return session
+        if _is_loadable(state):
+            return state
 
         # Move to parent directory
         parent = os.path.dirname(check_dir)
@@ -655,10 +1070,31 @@ def get_active_session() -> Optional[Dict]:
         check_dir = parent
 
     # Finally check home directory
-    home_dir = os.path.expanduser('~')
-    state = SessionState(workspace_dir=home_dir)
+    state = SessionState(workspace_dir=os.path.expanduser('~'))
+    if _is_loadable(state):
+        return state
+    return None
+
+
+def get_active_session() -> Optional[Dict]:
+    """
+    Get the currently active session
+
+    Searches for session.json in this order:
+    1. Current directory: ./.simexp/session.json
+    2. Parent directories: ../.simexp/session.json (walking up)
+    3. Home directory: ~/.simexp/session.json
+
+    Returns:
+        Session data dictionary or None if no active session
+    """
+    state = find_active_session_state()
+    if not state:
+        return None
+
     session = state.load_session()
     if session:
+        # Add directory info to session data
         session['_session_dir'] = state.state_dir
     return session
 
@@ -694,7 +1130,7 @@ def list_all_sessions() -> List[Dict]:
 
     while True:
         state = SessionState(workspace_dir=check_dir)
-        if os.path.exists(state.state_file) and check_dir not in seen_dirs:
+        if state.exists() and check_dir not in seen_dirs:
             session = state.load_session()
             if session:
                 session['_session_dir'] = state.state_dir
@@ -712,7 +1148,7 @@ def list_all_sessions() -> List[Dict]:
     home_dir = os.path.expanduser('~')
     if home_dir not in seen_dirs:
         state = SessionState(workspace_dir=home_dir)
-        if os.path.exists(state.state_file):
+        if state.exists():
             session = state.load_session()
             if session:
                 session['_session_dir'] = state.state_dir
@@ -732,6 +1168,7 @@ def clear_active_session() -> None:
     print("🧹 Session cleared")
 
 
+@session_note_lock('title', on_timeout=False)
 async def set_session_title(title: str, cdp_url: str = 'http://localhost:9223') -> bool:
     """
     Set a title for the current session note
@@ -11,6 +11,7 @@ from typing import Optional, List, Dict
 from .playwright_writer import SimplenoteWriter
 from .session_manager import get_active_session, search_and_select_note
 from .collaborator_config import resolve_collaborator
+from .note_lock import session_note_lock
 
 
 def validate_email(email: str) -> bool:
@@ -640,6 +641,7 @@ async def list_collaborators(
 
 # High-level functions that combine search + action
 
+@session_note_lock('publish', on_timeout=None)
 async def publish_session_note(
     cdp_url: str = 'http://localhost:9223',
     debug: bool = True
@@ -686,6 +688,7 @@ async def publish_session_note(
         return public_url
 
 
+@session_note_lock('unpublish', on_timeout=False)
 async def unpublish_session_note(
     cdp_url: str = 'http://localhost:9223',
     debug: bool = True
@@ -732,6 +735,7 @@ async def unpublish_session_note(
         return success
 
 
+@session_note_lock('collab-add', on_timeout=False)
 async def add_session_collaborator(
     email: str,
     cdp_url: str = 'http://localhost:9223',
@@ -787,6 +791,7 @@ async def add_session_collaborator(
         return success
 
 
+@session_note_lock('collab-remove', on_timeout=False)
 async def remove_session_collaborator(
     email: str,
     cdp_url: str = 'http://localhost:9223',
@@ -884,6 +889,7 @@ async def list_session_collaborators(
         return collaborators
 
 
+@session_note_lock('share', on_timeout={'success': False, 'added': [], 'failed': [], 'total': 0})
 async def share_session_note(
     identifier: str,
     cdp_url: str = 'http://localhost:9223',
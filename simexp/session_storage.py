@@ -0,0 +1,524 @@
+"""
+SimExp Session Storage
+Pluggable storage backends for session state
+
+Two backends are available:
+- json:   single .simexp/session.json document (default, human-readable)
+- sqlite: .simexp/session.db in WAL mode, one table per direction/action
+          type indexed by timestamp, so appends and time-range queries do
+          not need to load the whole session history
+
+The backend is selected with SESSION_STORAGE in ~/.simexp/simexp.yaml
+(or the SIMEXP_SESSION_STORAGE environment variable). Existing workspaces
+keep whichever backend they were created with.
+
+♠️🌿🎸🧵 G.Music Assembly - Session State Storage
+"""
+
+import os
+import json
+import sqlite3
+from contextlib import contextmanager
+from typing import Optional, Dict, List, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional fast path
+    orjson = None
+
+
+# Direction list fields that hold append-only action histories.
+# Each one gets its own table in the SQLite backend.
+ACTION_TABLES = [
+    ('east', 'goals'),
+    ('south', 'files_added'),
+    ('south', 'content_written'),
+    ('south', 'collaborations'),
+    ('west', 'opened_in_browser'),
+    ('north', 'reflection_notes'),
+    ('north', 'observed_patterns'),
+    ('north', 'extracted_wisdom'),
+    ('north', 'seeds_for_next'),
+]
+
+STORAGE_BACKENDS = ('json', 'sqlite')
+
+# On-disk encodings for the JSON backend. 'pretty' is the original
+# indent=2 layout; 'compact' drops whitespace and is written with orjson
+# when it is installed. Compact files carry a FORMAT_KEY marker so any
+# reader knows how they were produced; files without it are pretty.
+JSON_FORMATS = ('pretty', 'compact')
+FORMAT_KEY = '_format'
+
+CONFIG_FILE = os.path.expanduser('~/.simexp/simexp.yaml')
+_config_cache = {'mtime': None, 'config': {}}
+
+
+def _read_config() -> Dict:
+    """Read ~/.simexp/simexp.yaml, re-parsing only when the file changes"""
+    try:
+        mtime = os.path.getmtime(CONFIG_FILE)
+    except OSError:
+        return {}
+
+    if _config_cache['mtime'] != mtime:
+        try:
+            import yaml
+            with open(CONFIG_FILE, 'r') as f:
+                config = yaml.safe_load(f) or {}
+        except Exception:
+            config = {}
+        _config_cache['mtime'] = mtime
+        _config_cache['config'] = config if isinstance(config, dict) else {}
+
+    return _config_cache['config']
+
+
+def json_loads(data):
+    """Parse JSON bytes or text, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+
+def json_dumps_compact(obj) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits - stdlib handles them
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _json_text(obj) -> str:
+    """Compact JSON as text (SQLite TEXT columns)"""
+    return json_dumps_compact(obj).decode('utf-8')
+
+
+def _table_name(direction: str, action_type: str) -> str:
+    """Table name for a direction/action type pair (e.g. 'south_files_added')"""
+    return f"{direction}_{action_type}"
+
+
+class JSONSessionStorage:
+    """
+    Stores the whole session as one JSON document
+
+    This is the original SimExp format and remains the default.
+    """
+
+    name = 'json'
+    FILE_NAME = 'session.json'
+
+    def __init__(self, state_dir: str, json_format: Optional[str] = None):
+        self.state_dir = state_dir
+        self.path = os.path.join(state_dir, self.FILE_NAME)
+        self.json_format = json_format or get_configured_json_format()
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def load(self) -> Optional[Dict]:
+        if not os.path.exists(self.path):
+            return None
+
+        try:
+            with open(self.path, 'rb') as f:
+                session = json_loads(f.read())
+        except (ValueError, IOError):
+            return None
+
+        if isinstance(session, dict):
+            session.pop(FORMAT_KEY, None)
+        return session
+
+    def save(self, session_data: Dict) -> None:
+        os.makedirs(self.state_dir, exist_ok=True)
+
+        if self.json_format == 'compact':
+            payload = dict(session_data)
+            payload[FORMAT_KEY] = 'compact'
+            with open(self.path, 'wb') as f:
+                f.write(json_dumps_compact(payload))
+        else:
+            with open(self.path, 'w') as f:
+                json.dump(session_data, f, indent=2)
+
+    def clear(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def append_action(self, direction: str, action_type: str, action_data: Dict) -> None:
+        """Append one action to a direction list (load, append, save)"""
+        session = self.load()
+        if session is None:
+            raise ValueError("No session stored")
+
+        if action_type not in session.get(direction, {}):
+            raise ValueError(f"Invalid action_type: {action_type} for direction {direction}")
+
+        if isinstance(session[direction][action_type], list):
+            session[direction][action_type].append(action_data)
+        else:
+            session[direction][action_type] = action_data
+
+        self.save(session)
+
+    def query_actions(
+        self,
+        direction: str,
+        action_type: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        session = self.load() or {}
+        actions = session.get(direction, {}).get(action_type, [])
+        if not isinstance(actions, list):
+            return []
+
+        results = [
+            a for a in actions
+            if (since is None or a.get('timestamp', '') >= since)
+            and (until is None or a.get('timestamp', '') < until)
+        ]
+        if limit is not None:
+            results = results[-limit:]
+        return results
+
+
+class SQLiteSessionStorage:
+    """
+    Stores the session in a SQLite database (WAL mode)
+
+    Layout:
+        session_meta          key -> JSON value for every top-level field.
+                              Direction dicts are stored without their
+                              action lists (those live in their own tables).
+        <direction>_<action>  one row per tracked action, indexed by timestamp
+
+    The schema is created once (recorded in PRAGMA user_version) and checked
+    once per storage instance. Inside `with storage.transaction():` every
+    method shares one connection and one write transaction.
+    """
+
+    name = 'sqlite'
+    FILE_NAME = 'session.db'
+    SCHEMA_VERSION = 1
+
+    def __init__(self, state_dir: str):
+        self.state_dir = state_dir
+        self.path = os.path.join(state_dir, self.FILE_NAME)
+        self._schema_ready = False
+        self._active = None
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(self.state_dir, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        if not self._schema_ready:
+            if conn.execute('PRAGMA user_version').fetchone()[0] < self.SCHEMA_VERSION:
+                self._create_schema(conn)
+            self._schema_ready = True
+        return conn
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        conn.execute('PRAGMA journal_mode=WAL')  # Persistent: stored in the database file
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS session_meta ('
+            'key TEXT PRIMARY KEY, value TEXT)'
+        )
+        for direction, action_type in ACTION_TABLES:
+            table = _table_name(direction, action_type)
+            conn.execute(
+                f'CREATE TABLE IF NOT EXISTS {table} ('
+                'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                'timestamp TEXT, data TEXT)'
+            )
+            conn.execute(
+                f'CREATE INDEX IF NOT EXISTS idx_{table}_timestamp ON {table}(timestamp)'
+            )
+        conn.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+
+    @contextmanager
+    def _connection(self, write: bool = False):
+        """The transaction's connection, or a new one (committed on success if write)"""
+        if self._active is not None:
+            yield self._active
+            return
+        conn = self._connect()
+        try:
+            if write:
+                with conn:
+                    yield conn
+            else:
+                yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run several storage calls on one connection in one write transaction
+
+        Yields:
+            This storage; its methods use the shared connection until exit
+        """
+        if self._active is not None:
+            yield self
+            return
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            self._active = conn
+            with conn:
+                yield self
+        finally:
+            self._active = None
+            conn.close()
+
+    def load(self) -> Optional[Dict]:
+        if not os.path.exists(self.path):
+            return None
+
+        try:
+            with self._connection() as conn:
+                rows = conn.execute('SELECT key, value FROM session_meta').fetchall()
+                if not rows:
+                    return None
+
+                session = {key: json_loads(value) for key, value in rows}
+                for direction, action_type in ACTION_TABLES:
+                    if not isinstance(session.get(direction), dict):
+                        continue
+                    table = _table_name(direction, action_type)
+                    session[direction][action_type] = [
+                        json_loads(data)
+                        for (data,) in conn.execute(f'SELECT data FROM {table} ORDER BY id')
+                    ]
+                return session
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def is_readable(self) -> bool:
+        """Whether a session is stored and its database can be read"""
+        try:
+            return bool(self.load_meta())
+        except (sqlite3.Error, ValueError):
+            return False
+
+    def save(self, session_data: Dict) -> None:
+        meta, actions = self._split(session_data)
+
+        with self._connection(write=True) as conn:
+            conn.execute('DELETE FROM session_meta')
+            conn.executemany(
+                'INSERT INTO session_meta (key, value) VALUES (?, ?)',
+                [(key, _json_text(value)) for key, value in meta.items()]
+            )
+            for direction, action_type in ACTION_TABLES:
+                table = _table_name(direction, action_type)
+                conn.execute(f'DELETE FROM {table}')
+                conn.executemany(
+                    f'INSERT INTO {table} (timestamp, data) VALUES (?, ?)',
+                    [(e.get('timestamp') if isinstance(e, dict) else None, _json_text(e))
+                     for e in actions.get((direction, action_type), [])]
+                )
+
+    def clear(self) -> None:
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
+        self._schema_ready = False
+
+    def has_direction(self, direction: str) -> bool:
+        """Whether the stored session already has this direction initialized"""
+        return isinstance(self.load_meta().get(direction), dict)
+
+    def append_action(self, direction: str, action_type: str, action_data: Dict) -> None:
+        """Append one action as a single row insert (no history reload)"""
+        with self._connection(write=True) as conn:
+            row = conn.execute(
+                'SELECT value FROM session_meta WHERE key = ?', (direction,)
+            ).fetchone()
+            if row is None:
+                raise ValueError("No session stored")
+
+            if (direction, action_type) in ACTION_TABLES:
+                table = _table_name(direction, action_type)
+                conn.execute(
+                    f'INSERT INTO {table} (timestamp, data) VALUES (?, ?)',
+                    (action_data.get('timestamp'), _json_text(action_data))
+                )
+                return
+
+            direction_data = json_loads(row[0])
+            if action_type not in direction_data:
+                raise ValueError(f"Invalid action_type: {action_type} for direction {direction}")
+            direction_data[action_type] = action_data
+            conn.execute(
+                'UPDATE session_meta SET value = ? WHERE key = ?',
+                (_json_text(direction_data), direction)
+            )
+
+    def query_actions(
+        self,
+        direction: str,
+        action_type: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        if (direction, action_type) not in ACTION_TABLES or not os.path.exists(self.path):
+            return []
+
+        table = _table_name(direction, action_type)
+        clauses, params = [], []
+        if since is not None:
+            clauses.append('timestamp >= ?')
+            params.append(since)
+        if until is not None:
+            clauses.append('timestamp < ?')
+            params.append(until)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ''
+
+        sql = f'SELECT data FROM {table}{where} ORDER BY id'
+        if limit is not None:
+            # Most recent `limit` rows, returned oldest first
+            sql = (f'SELECT data FROM (SELECT id, data FROM {table}{where} '
+                   f'ORDER BY id DESC LIMIT ?) ORDER BY id')
+            params.append(limit)
+
+        with self._connection() as conn:
+            return [json_loads(data) for (data,) in conn.execute(sql, params)]
+
+    def load_meta(self) -> Dict:
+        """Top-level session fields without the action histories"""
+        if not os.path.exists(self.path):
+            return {}
+
+        with self._connection() as conn:
+            rows = conn.execute('SELECT key, value FROM session_meta').fetchall()
+            return {key: json_loads(value) for key, value in rows}
+
+    def set_meta(self, key: str, value) -> None:
+        """Replace a single top-level session field"""
+        with self._connection(write=True) as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO session_meta (key, value) VALUES (?, ?)',
+                (key, _json_text(value))
+            )
+
+    def distinct_values(self, direction: str, action_type: str, field: str) -> List:
+        """Distinct non-null values of one field across an action history"""
+        if (direction, action_type) not in ACTION_TABLES or not os.path.exists(self.path):
+            return []
+
+        with self._connection() as conn:
+            table = _table_name(direction, action_type)
+            rows = conn.execute(
+                f"SELECT DISTINCT json_extract(data, '$.' || ?) FROM {table}", (field,)
+            ).fetchall()
+            return [value for (value,) in rows if value is not None]
+
+    def count_actions(self, direction: str, action_type: str) -> int:
+        """Number of recorded actions of one type"""
+        if (direction, action_type) not in ACTION_TABLES or not os.path.exists(self.path):
+            return 0
+
+        with self._connection() as conn:
+            table = _table_name(direction, action_type)
+            return conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+    @staticmethod
+    def _split(session_data: Dict) -> Tuple[Dict, Dict]:
+        """Separate action histories from the rest of the session"""
+        meta = {}
+        actions = {}
+        for key, value in session_data.items():
+            if isinstance(value, dict) and any(d == key for d, _ in ACTION_TABLES):
+                direction_data = dict(value)
+                for direction, action_type in ACTION_TABLES:
+                    if direction == key and isinstance(direction_data.get(action_type), list):
+                        actions[(direction, action_type)] = direction_data.pop(action_type)
+                meta[key] = direction_data
+            else:
+                meta[key] = value
+        return meta, actions
+
+
+_BACKEND_CLASSES = {
+    'json': JSONSessionStorage,
+    'sqlite': SQLiteSessionStorage,
+}
+
+
+def get_configured_backend() -> str:
+    """
+    Get the storage backend for new sessions using priority chain
+
+    Priority order:
+    1. SIMEXP_SESSION_STORAGE environment variable
+    2. SESSION_STORAGE from ~/.simexp/simexp.yaml
+    3. 'json' (fallback default)
+    """
+    env_backend = os.environ.get('SIMEXP_SESSION_STORAGE')
+    if env_backend in STORAGE_BACKENDS:
+        return env_backend
+
+    backend = str(_read_config().get('SESSION_STORAGE', 'json')).lower()
+    if backend in STORAGE_BACKENDS:
+        return backend
+
+    return 'json'
+
+
+def get_configured_json_format() -> str:
+    """
+    Get the on-disk format for JSON session files using priority chain
+
+    Priority order:
+    1. SIMEXP_SESSION_JSON_FORMAT environment variable
+    2. SESSION_JSON_FORMAT from ~/.simexp/simexp.yaml
+    3. 'pretty' (fallback default)
+    """
+    env_format = os.environ.get('SIMEXP_SESSION_JSON_FORMAT')
+    if env_format in JSON_FORMATS:
+        return env_format
+
+    json_format = str(_read_config().get('SESSION_JSON_FORMAT', 'pretty')).lower()
+    if json_format in JSON_FORMATS:
+        return json_format
+
+    return 'pretty'
+
+
+def open_storage(state_dir: str, backend: Optional[str] = None):
+    """
+    Open the storage for a .simexp directory
+
+    An explicit backend wins. Otherwise an existing session.db or
+    session.json decides, and brand new workspaces use the configured
+    backend.
+
+    Raises:
+        ValueError: If backend is not a known storage backend
+    """
+    if backend is None:
+        if os.path.exists(os.path.join(state_dir, SQLiteSessionStorage.FILE_NAME)):
+            backend = 'sqlite'
+        elif os.path.exists(os.path.join(state_dir, JSONSessionStorage.FILE_NAME)):
+            backend = 'json'
+        else:
+            backend = get_configured_backend()
+
+    if backend not in _BACKEND_CLASSES:
+        raise ValueError(f"Invalid session storage: {backend}. Must be one of {list(STORAGE_BACKENDS)}")
+
+    return _BACKEND_CLASSES[backend](state_dir)
@@ -1,14 +1,12 @@
 import os
-import requests
 from datetime import datetime
 from typing import Optional
-from .simfetcher import fetch_content
-from .processor import process_content
-from .archiver import save_as_markdown
-import yaml
-from .imp_clip import update_sources_from_clipboard, is_clipboard_content_valid
+from urllib.parse import urlparse
+from .archiver import (
+    save_as_markdown, find_markdown_path, read_markdown, read_manifest, resolve_compression, MarkdownStreamWriter, ExtractionCheckpoint,
+    COMPRESSION_SUFFIXES
+)
 import asyncio
-import pyperclip
 import subprocess
 import shutil
 import time
@@ -27,8 +25,14 @@ from .session_sharing import (
     list_session_collaborators,
     share_session_note
 )
-from .session_manager import handle_session_add
+from .session_manager import handle_session_add, handle_session_add_batch
 from .timestamp_utils import format_timestamped_entry, insert_after_metadata
+from .note_lock import NoteLock, NoteLockTimeout, session_note_lock, get_lock_stats, note_lock_key
+from .source_manifest import load_manifest, SourceState, due_sources
+from .search_index import search as search_archive, reindex as reindex_archive, DEFAULT_LIMIT
+from .snapshots import (
+    save_snapshot, resolve_archive_mode, reconstruct, changes_for_day, DEFAULT_KEYFRAME_DAYS
+)
 
 # Config file in user's home directory (not package directory)
 CONFIG_FILE = os.path.expanduser('~/.simexp/simexp.yaml')
@@ -59,6 +63,8 @@ def resolve_public_url(public_url: str, cdp_url: str = None) -> Optional[str]:
         >>> resolve_public_url('https://app.simplenote.com/p/0ZqWsQ')
         '76502186-4d7d-48d6-a961-80a48573b2c7'
     """
+    from .simfetcher import fetch_content
+
     print(f"🔍 Detecting public Simplenote URL...")
     print(f"   🌐 Public URL: {public_url}")
 
@@ -825,6 +831,8 @@ def get_cdp_url(override: str = None) -> str:
         # Fallback
         get_cdp_url()  # → http://localhost:9222
     """
+    import yaml
+
     # Priority 1: Explicit override parameter
     if override:
         return override
@@ -926,8 +934,10 @@ def check_chrome_cdp_running(port=9222):
     Returns:
         bool: True if Chrome CDP is accessible, False otherwise
     """
+    from .simfetcher import http_get
+
     try:
-        response = requests.get(f'http://localhost:{port}/json/version', timeout=2)
+        response = http_get(f'http://localhost:{port}/json/version', timeout=2, retry=False)
         return response.status_code == 200
     except:
         return False
@@ -973,6 +983,8 @@ def init_config():
     Initialize SimExp configuration interactively
     Creates ~/.simexp/simexp.yaml with user settings
     """
+    import yaml
+
     # Create config directory if it doesn't exist
     config_dir = os.path.dirname(CONFIG_FILE)
     os.makedirs(config_dir, exist_ok=True)
@@ -1099,15 +1111,20 @@ def write_command(note_url, content=None, mode='append', headless=False, cdp_url
                 return
 
         # Write directly to the note using browser navigation
-        success = asyncio.run(_write_to_public_note(
-            public_url=note_url,
-            content=content,
-            mode=mode,
-            cdp_url=resolved_cdp,
-            init_session=init_session,
-            ai_assistant=ai_assistant,
-            issue_number=issue_number
-        ))
+        try:
+            with NoteLock(note_lock_key(note_url), operation='write'):
+                success = asyncio.run(_write_to_public_note(
+                    public_url=note_url,
+                    content=content,
+                    mode=mode,
+                    cdp_url=resolved_cdp,
+                    init_session=init_session,
+                    ai_assistant=ai_assistant,
+                    issue_number=issue_number
+                ))
+        except NoteLockTimeout as e:
+            print(f"❌ {e}")
+            return
 
         if not success:
             print("\n❌ Failed to write to note")
@@ -1125,15 +1142,20 @@ def write_command(note_url, content=None, mode='append', headless=False, cdp_url
     print(f"🌐 Target: {note_url}")
     print(f"📄 Content length: {len(content)} chars")
 
-    # Execute async write
-    result = asyncio.run(write_to_note(
-        note_url=note_url,
-        content=content,
-        mode=mode,
-        headless=headless,
-        debug=True,
-        cdp_url=resolved_cdp
-    ))
+    # Execute async write (one writer per note at a time)
+    try:
+        with NoteLock(note_lock_key(note_url), operation='write'):
+            result = asyncio.run(write_to_note(
+                note_url=note_url,
+                content=content,
+                mode=mode,
+                headless=headless,
+                debug=True,
+                cdp_url=resolved_cdp
+            ))
+    except NoteLockTimeout as e:
+        print(f"❌ {e}")
+        return
 
     if result['success']:
         print(f"\n✅ Write successful!")
@@ -1319,6 +1341,7 @@ def session_write_command(content=None, cdp_url=None, date_flag=None, prepend=Fa
         print(f"📌 Mode: PREPEND (after metadata)")
 
     # Execute search and write
+    @session_note_lock('write', on_timeout=False)
     async def write_to_session():
         async with SimplenoteWriter(
             note_url='https://app.simplenote.com/',
@@ -1398,7 +1421,8 @@ def session_write_command(content=None, cdp_url=None, date_flag=None, prepend=Fa
             print(f"✅ Write successful!")
 
             # 🧭 Phase 3: Track write in session data
-            _track_content_write(len(content), 'append' if not prepend else 'prepend', bool(date_flag))
+            _track_content_write(len(content), 'append' if not prepend else 'prepend', bool(date_flag),
+                                 content=content)
 
             return True
 
@@ -1407,16 +1431,19 @@ def session_write_command(content=None, cdp_url=None, date_flag=None, prepend=Fa
         print(f"\n❌ Write failed")
 
 
-def _track_content_write(content_length: int, mode: str, has_timestamp: bool) -> None:
+def _track_content_write(content_length: int, mode: str, has_timestamp: bool,
+                         content: Optional[str] = None) -> None:
     """
     Track content write in session data (Phase 3: South Direction)
 
-    Records write metadata for audit and completion tracking.
+    Records write metadata for audit and completion tracking. The text
+    itself only goes to the session search index.
 
     Args:
         content_length: Length of content written in characters
         mode: Write mode ('append' or 'prepend')
         has_timestamp: Whether timestamp was added to content
+        content: Text written, for `simexp session search`
     """
     try:
         from .session_manager import update_session_data
@@ -1428,8 +1455,10 @@ def _track_content_write(content_length: int, mode: str, has_timestamp: bool) ->
             'has_timestamp': has_timestamp
         }
 
-        update_session_data('south', 'content_written', write_data)
+        session_id = update_session_data('south', 'content_written', write_data)
         print(f"📊 Write tracked in SOUTH direction")
+        if content:
+            _index_session_text(session_id, 'write', content, write_data['timestamp'])
 
     except Exception as e:
         # Don't block the write operation if tracking fails
@@ -1616,6 +1645,8 @@ def session_list_command():
         if session.get('issue_number'):
             print(f"   🎯 Issue: #{session['issue_number']}")
         print(f"   📅 Created: {session.get('created_at', 'unknown')}")
+        if session.get('archived'):
+            print(f"   🗄️  Archived")
         if is_active:
             print(f"   ⭐ ACTIVE (current directory)")
         print()
@@ -1657,6 +1688,31 @@ def session_info_command():
     print(f"📍 Current Directory: {current_dir}")
     print()
 
+    # Archived sessions only keep a stub with summary stats
+    if session.get('archived'):
+        archived = session['archived']
+        stats = session.get('stats', {})
+        print(f"🗄️  Archived: {archived.get('path')}")
+        print(f"   Completed: {archived.get('completed_at') or 'unknown'}")
+        print(f"   Files Added: {stats.get('total_files', 0)} | Writes: {stats.get('total_writes', 0)} | "
+              f"Collaborators: {stats.get('total_collaborators', 0)}")
+        print(f"   💡 Restore full history with: simexp session rehydrate")
+        print()
+
+    # Note lock queue (concurrent writers to this session's note)
+    lock_stats = get_lock_stats(session['session_id'])
+    if lock_stats:
+        holder = lock_stats['holder']
+        print(f"🔒 Note Lock:")
+        if holder:
+            print(f"   Held by: PID {holder['pid']} ({holder['operation']}) since {holder['since']}")
+        else:
+            print(f"   Held by: nobody")
+        print(f"   Queue Depth: {lock_stats['waiting']} waiting (max seen: {lock_stats['max_queue_depth']})")
+        print(f"   Wait Time: avg {lock_stats['avg_wait_seconds']:.1f}s | max {lock_stats['max_wait_seconds']:.1f}s | "
+              f"last {lock_stats['last_wait_seconds']:.1f}s over {lock_stats['acquisitions']} edit(s)")
+        print()
+
     # Display Four Directions Status (Phase 7 Enhancement)
     if 'east' in session and 'stats' in session:
         print("🧭 Four Directions Status:")
@@ -1720,9 +1776,122 @@ def session_info_command():
     print(f"💡 To see all sessions: simexp session list")
 
 
+def session_storage_command(backend=None):
+    """
+    Show or convert the storage backend of the current session
+
+    Args:
+        backend: Target backend ('json' or 'sqlite'). If None, only shows the current one.
+    """
+    import sys
+    from .session_manager import find_active_session_state
+
+    state = find_active_session_state()
+    if not state:
+        print("❌ No active session. Run 'simexp session start' first.")
+        sys.exit(1)
+
+    print(f"🗄️  Session storage: {state.backend} ({state.state_file})")
+
+    if not backend or backend == state.backend:
+        return
+
+    session = state.load_session()
+    if session is None:
+        print(f"❌ Could not load session from {state.state_file}")
+        sys.exit(1)
+
+    target = SessionState(workspace_dir=state.workspace_dir, backend=backend)
+    target.save_session(session)
+    state.clear_session()
+
+    print(f"✅ Converted session to {backend} storage: {target.state_file}")
+
+
+def session_export_command(output_path):
+    """Export the current session as a session.json-format document"""
+    import sys
+    from .session_manager import find_active_session_state
+
+    state = find_active_session_state()
+    if not state:
+        print("❌ No active session. Run 'simexp session start' first.")
+        sys.exit(1)
+
+    state.export_json(output_path)
+    print(f"✅ Session exported to {output_path}")
+
+
+def session_import_command(input_path, backend=None):
+    """Import a session.json-format document into the current directory"""
+    from .session_manager import register_session_workspace
+
+    state = SessionState(backend=backend)
+    state.import_json(input_path)
+    register_session_workspace(state.workspace_dir)
+    print(f"✅ Session imported into {state.state_file} ({state.backend} storage)")
+
+
+def session_migrate_command(migrate_all=False, workers=8):
+    """
+    Upgrade session files to the current schema version
+
+    Args:
+        migrate_all: Upgrade every known session (registry + directory tree),
+                     not just the active one
+        workers: Number of parallel workers for --all
+    """
+    import sys
+    from .session_manager import (
+        SCHEMA_VERSION,
+        find_active_session_state,
+        list_all_sessions,
+        list_registered_workspaces,
+        migrate_all_sessions,
+        register_session_workspace
+    )
+
+    if migrate_all:
+        workspaces = list_registered_workspaces()
+        for session in list_all_sessions():
+            workspace = os.path.dirname(session['_session_dir'])
+            if workspace not in workspaces:
+                workspaces.append(workspace)
+    else:
+        state = find_active_session_state()
+        if not state:
+            print("❌ No active session. Run 'simexp session start' first.")
+            sys.exit(1)
+        workspaces = [state.workspace_dir]
+
+    print(f"♠️🌿🎸🧵 Migrating {len(workspaces)} session(s) to schema v{SCHEMA_VERSION}")
+    print()
+
+    results = migrate_all_sessions(workspaces, max_workers=workers)
+
+    icons = {'migrated': '⬆️ ', 'current': '✓ ', 'archived': '🗄️ ', 'missing': '∅ ', 'error': '❌'}
+    for result in results:
+        status = result['status']
+        detail = ''
+        if status == 'migrated':
+            detail = f" v{result['from_version']} → v{result['to_version']}"
+        elif status == 'error':
+            detail = f" {result['error']}"
+        print(f"   {icons[status]} {result['workspace']}: {status}{detail}")
+        if status in ('migrated', 'current', 'archived'):
+            register_session_workspace(result['workspace'])
+
+    counts = {}
+    for result in results:
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+    print()
+    print("💡 " + ", ".join(f"{count} {status}" for status, count in sorted(counts.items())))
+
+
 def session_publish_command(cdp_url=None):
     """Publish the current session's note"""
     import sys
+    import pyperclip
 
     # Resolve CDP URL using priority chain (Issue #11)
     resolved_cdp = get_cdp_url(cdp_url)
@@ -1878,6 +2047,29 @@ def session_share_command(identifier, cdp_url=None):
 # ♠️🌿🎸🧵 G.Music Assembly - North Direction Commands
 # ═══════════════════════════════════════════════════════════════
 
+def _index_session_text(session_id: Optional[str], kind: str, text: str, timestamp: str) -> None:
+    """
+    Add a tracked item to the cross-session search index
+
+    Args:
+        session_id: Session the item was tracked in
+        kind: Entry kind ('reflection', 'pattern', 'wisdom', 'seed' or 'write')
+        text: Searchable text
+        timestamp: Timestamp of the tracked action
+    """
+    if not session_id:
+        return
+    try:
+        from .session_manager import find_active_session_state
+        from .session_index import index_entry
+
+        state = find_active_session_state()
+        index_entry(session_id, kind, text, timestamp, workspace=state.workspace_dir if state else None)
+    except Exception as e:
+        # The session history is the source of truth; `session search --reindex` catches up
+        print(f"⚠️ Warning: Could not update session search index: {e}")
+
+
 def _track_north_reflection(prompt: Optional[str], reflection: str) -> None:
     """
     Track reflection note in north direction
@@ -1887,18 +2079,17 @@ def _track_north_reflection(prompt: Optional[str], reflection: str) -> None:
         reflection: The reflection text itself
     """
     try:
-        session = get_active_session()
-        if session:
-            reflection_entry = {
-                'timestamp': datetime.now().isoformat(),
-                'prompt': prompt,
-                'reflection': reflection
-            }
-            session['north']['reflection_notes'].append(reflection_entry)
+        from .session_manager import update_session_data
 
-            state = SessionState()
-            state.save_session(session)
-            print(f"✅ Reflection tracked in NORTH direction")
+        reflection_entry = {
+            'timestamp': datetime.now().isoformat(),
+            'prompt': prompt,
+            'reflection': reflection
+        }
+        session_id = update_session_data('north', 'reflection_notes', reflection_entry)
+        print(f"✅ Reflection tracked in NORTH direction")
+        _index_session_text(session_id, 'reflection', f"{prompt}\n{reflection}" if prompt else reflection,
+                            reflection_entry['timestamp'])
     except Exception as e:
         print(f"⚠️ Warning: Could not track reflection: {e}")
 
@@ -1964,17 +2155,15 @@ def session_reflect_command(prompt: Optional[str] = None):
 def _track_north_pattern(pattern: str) -> None:
     """Track observed pattern in north direction"""
     try:
-        session = get_active_session()
-        if session:
-            pattern_entry = {
-                'timestamp': datetime.now().isoformat(),
-                'pattern': pattern
-            }
-            session['north']['observed_patterns'].append(pattern_entry)
+        from .session_manager import update_session_data
 
-            state = SessionState()
-            state.save_session(session)
-            print(f"✅ Pattern tracked in NORTH direction")
+        pattern_entry = {
+            'timestamp': datetime.now().isoformat(),
+            'pattern': pattern
+        }
+        session_id = update_session_data('north', 'observed_patterns', pattern_entry)
+        print(f"✅ Pattern tracked in NORTH direction")
+        _index_session_text(session_id, 'pattern', pattern, pattern_entry['timestamp'])
     except Exception as e:
         print(f"⚠️ Warning: Could not track pattern: {e}")
 
@@ -2005,17 +2194,15 @@ def session_observe_pattern_command(pattern: str):
 def _track_north_wisdom(wisdom: str) -> None:
     """Track extracted wisdom in north direction"""
     try:
-        session = get_active_session()
-        if session:
-            wisdom_entry = {
-                'timestamp': datetime.now().isoformat(),
-                'wisdom': wisdom
-            }
-            session['north']['extracted_wisdom'].append(wisdom_entry)
+        from .session_manager import update_session_data
 
-            state = SessionState()
-            state.save_session(session)
-            print(f"✅ Wisdom tracked in NORTH direction")
+        wisdom_entry = {
+            'timestamp': datetime.now().isoformat(),
+            'wisdom': wisdom
+        }
+        session_id = update_session_data('north', 'extracted_wisdom', wisdom_entry)
+        print(f"✅ Wisdom tracked in NORTH direction")
+        _index_session_text(session_id, 'wisdom', wisdom, wisdom_entry['timestamp'])
     except Exception as e:
         print(f"⚠️ Warning: Could not track wisdom: {e}")
 
@@ -2043,21 +2230,31 @@ def session_extract_wisdom_command(wisdom: str):
     print(f"🌐 Wisdom extracted in NORTH direction")
 
 
-def session_complete_command(seeds: Optional[str] = None):
+def session_complete_command(seeds: Optional[str] = None, archive: bool = True, compression: str = 'gzip'):
     """
     Complete the session ceremony (Phase 5: North Direction)
 
     Marks the session as complete and optionally adds seeds for next session.
-    Displays a completion summary with Four Directions status.
+    Displays a completion summary with Four Directions status, then moves the
+    session history into cold storage (~/.simexp/archive/).
 
     Args:
         seeds: Optional seeds (insights/tasks) for next session
+        archive: Archive the session history after completion (default: True)
+        compression: Archive compression ('gzip' or 'zstd')
     """
-    session = get_active_session()
+    from .session_manager import find_active_session_state
+    from .session_archive import is_archived, rehydrate_session
+
+    state = find_active_session_state()
+    session = state.load_session() if state else None
     if not session:
         print("❌ No active session. Run 'simexp session start' first.")
         return
 
+    if is_archived(session):
+        session = rehydrate_session(state)
+
     # Mark as complete
     session['north']['completed'] = True
     session['north']['completed_at'] = datetime.now().isoformat()
@@ -2075,8 +2272,9 @@ def session_complete_command(seeds: Optional[str] = None):
     session = calculate_session_stats(session)
 
     # Save
-    state = SessionState()
     state.save_session(session)
+    if seeds and seeds.strip():
+        _index_session_text(session.get('session_id'), 'seed', seed_entry['seed'], seed_entry['timestamp'])
 
     # Display completion ceremony
     print("\n" + "╔" + "═" * 68 + "╗")
@@ -2119,17 +2317,475 @@ def session_complete_command(seeds: Optional[str] = None):
     print("✨ Session ceremony complete. May wisdom flow forward.")
     print("═" * 70 + "\n")
 
+    if archive:
+        _archive_completed_session(state, compression)
+
+
+def _archive_completed_session(state, compression: str = 'gzip') -> None:
+    """Move a completed session's history into cold storage"""
+    from .session_archive import archive_session
+
+    try:
+        stub = archive_session(state, compression=compression)
+        print(f"🗄️  Session history archived: {stub['archived']['path']}")
+        print(f"   📦 {stub['archived']['size_bytes']:,} bytes ({compression})")
+        print(f"   💡 Restore with: simexp session rehydrate")
+    except Exception as e:
+        print(f"⚠️ Warning: Could not archive session history: {e}")
+
+
+def session_archive_command(compression: str = 'gzip'):
+    """Move the current session's history into cold storage"""
+    import sys
+    from .session_manager import find_active_session_state
+    from .session_archive import archive_session
+
+    state = find_active_session_state()
+    if not state:
+        print("❌ No active session. Run 'simexp session start' first.")
+        sys.exit(1)
 
-def run_extraction():
+    try:
+        stub = archive_session(state, compression=compression)
+    except Exception as e:
+        print(f"❌ Could not archive session: {e}")
+        sys.exit(1)
+
+    print(f"🗄️  Session {stub['session_id']} archived")
+    print(f"   📦 {stub['archived']['path']} ({stub['archived']['size_bytes']:,} bytes)")
+    print(f"   📁 Stub left in {state.state_file}")
+
+
+def session_rehydrate_command():
+    """Restore the current session's full history from cold storage"""
+    import sys
+    from .session_manager import find_active_session_state
+    from .session_archive import rehydrate_session
+
+    state = find_active_session_state()
+    if not state:
+        print("❌ No active session. Run 'simexp session start' first.")
+        sys.exit(1)
+
+    try:
+        session = rehydrate_session(state)
+    except Exception as e:
+        print(f"❌ Could not rehydrate session: {e}")
+        sys.exit(1)
+
+    print(f"♻️  Session {session['session_id']} rehydrated into {state.state_file}")
+
+
+def session_search_command(query: str, kind: Optional[str] = None, session_id: Optional[str] = None,
+                           since: Optional[str] = None, limit: int = DEFAULT_LIMIT,
+                           reindex: bool = False, as_json: bool = False):
+    """
+    Search reflections, patterns, wisdom, seeds and writes across all sessions
+
+    Args:
+        query: FTS5 query ("exact phrase", AND/OR/NOT, prefix*)
+        kind: Only this kind of entry
+        session_id: Only this session
+        since: Only entries tracked on or after this ISO date
+        limit: Maximum hits
+        reindex: Index registered workspaces and archived sessions first
+        as_json: Print the hits as JSON (for the MCP server)
+
+    Returns:
+        List of hits, best first
+    """
+    import json
+    from .session_index import search_sessions, reindex_sessions
+
+    if reindex:
+        started = time.perf_counter()
+        count = reindex_sessions()
+        if not as_json:
+            print(f"🗂️  Indexed {count} session entr{'y' if count == 1 else 'ies'} in {time.perf_counter() - started:.2f}s")
+        if not query:
+            if as_json:
+                print(json.dumps([]))
+            return []
+
+    started = time.perf_counter()
+    hits = search_sessions(query, kind=kind, session_id=session_id, since=since, limit=limit)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if as_json:
+        print(json.dumps(hits, ensure_ascii=False))
+        return hits
+    if not hits:
+        print(f"🔍 No session entries match {query!r} ({elapsed_ms:.1f} ms)")
+        print("💡 Sessions tracked before the index existed: run 'simexp session search --reindex'")
+        return hits
+    print(f"🔍 {len(hits)} session entr{'y' if len(hits) == 1 else 'ies'} for {query!r} ({elapsed_ms:.1f} ms)")
+    for hit in hits:
+        print(f"\n🧭 {hit['kind']:<10} {hit['timestamp'][:19]}  {hit['session_id']}")
+        print(f"   {' '.join(hit['snippet'].split())}")
+        if hit['workspace']:
+            print(f"   📁 {hit['workspace']}")
+    return hits
+
+
+# Emoji per Assembly source filename
+SOURCE_EMOJI = {
+    'aureon': '🌿',
+    'nyro': '♠️',
+    'jamai': '🎸',
+    'synth': '🧵'
+}
+
+
+def _sources_from_urls(urls):
+    """Build extraction sources for URLs given on the command line"""
+    sources = []
+    for url in urls:
+        filename = os.path.basename(url.rstrip('/')).split('.')[0] or urlparse(url).netloc
+        sources.append({'url': url, 'filename': filename})
+    return sources
+
+
+def _resolve_profile(source, profiles):
+    """
+    Compiled extraction profile for a source
+
+    Uses the source's `profile` key, else the first EXTRACT_PROFILES entry
+    whose `hosts` list matches the URL, else the built-in Simplenote layout.
+
+    Args:
+        source: Source dict from the configuration
+        profiles: EXTRACT_PROFILES mapping from simexp.yaml
+
+    Returns:
+        ExtractionProfile (cached across sources and runs)
+    """
+    from .processor import get_profile, DEFAULT_PROFILE
+
+    name = source.get('profile')
+    if not name:
+        host = urlparse(source['url']).hostname or ''
+        for profile_name, spec in profiles.items():
+            hosts = (spec or {}).get('hosts') or []
+            if any(host == h or host.endswith('.' + h) for h in hosts):
+                name = profile_name
+                break
+    name = name or 'default'
+
+    if name != 'default' and name not in profiles:
+        print(f"⚠️ Warning: Unknown extraction profile '{name}' for {source['url']}, using default")
+        name = 'default'
+    try:
+        return get_profile(name, profiles.get(name))
+    except ValueError as e:
+        print(f"⚠️ Warning: Extraction profile '{name}' is invalid ({e}), using default")
+        return DEFAULT_PROFILE
+
+
+def _get_parse_workers(config, parse_workers=None):
+    """
+    Worker processes for the parsing stage
+
+    Args:
+        config: Loaded simexp.yaml
+        parse_workers: --workers value (N, or 'auto' for one per core);
+                       None falls back to EXTRACT_PARSE_WORKERS
+
+    Returns:
+        int, or None to parse on the extraction threads
+    """
+    value = parse_workers if parse_workers is not None else config.get('EXTRACT_PARSE_WORKERS')
+    if value is None or value is False:
+        return None
+    if str(value).lower() == 'auto':
+        return os.cpu_count() or 1
+    try:
+        count = int(value)
+    except (TypeError, ValueError):
+        count = 0
+    if count > 0:
+        return count
+    print(f"⚠️ Warning: Ignoring invalid EXTRACT_PARSE_WORKERS: {value}")
+    return None
+
+
+def _parse_workers_arg(value):
+    """argparse type for --workers: a positive integer or 'auto'"""
+    import argparse
+
+    if value.lower() == 'auto':
+        return 'auto'
+    if value.isdigit() and int(value) > 0:
+        return int(value)
+    raise argparse.ArgumentTypeError(f"expected a positive integer or 'auto', got '{value}'")
+
+
+def _get_extract_setting(config, key, default):
+    """Positive integer extraction setting from simexp.yaml"""
+    try:
+        value = int(config.get(key, default))
+        return value if value > 0 else default
+    except (TypeError, ValueError):
+        print(f"⚠️ Warning: Ignoring invalid {key}: {config.get(key)}")
+        return default
+
+
+def _extract_source(source, limiter, base_path, daily_folder, force=False, compression=None, parse_pool=None,
+                    archive_mode='full', keyframe_days=DEFAULT_KEYFRAME_DAYS, render_pool=None):
+    """
+    Fetch, process and save one source
+
+    Runs on a worker thread; only the fetch holds the per-host slot so
+    parsing and writing overlap with other sources' downloads. A 304 from
+    the HTTP cache skips processing when today's file already exists. With
+    a ParsePool, parsing runs in a worker process instead of this thread.
+    In 'diff' archive mode the document is saved as a change-only snapshot.
+    Sources marked `render: true` are loaded in the RenderPool's headless
+    browser instead, so script-built content reaches the processor.
+
+    Returns:
+        Result dict with status, per-stage timings and saved path or error
+    """
+    from .simfetcher import fetch_raw
+    from .processor import process_content, DEFAULT_PROFILE, NO_CONTENT
+
+    url = source['url']
+    profile = source.get('extraction_profile') or DEFAULT_PROFILE
+    result = {
+        'url': url,
+        'filename': source['filename'],
+        'profile': profile.name,
+        'title': None,
+        'fetched_at': None,
+        'content_found': None,
+        'success': False,
+        'unchanged': False,
+        'fetch_seconds': 0.0,
+        'process_seconds': 0.0,
+        'save_seconds': 0.0,
+        'characters': 0,
+        'path': None,
+        'error': None
+    }
+
+    started = time.perf_counter()
+    result['fetched_at'] = datetime.now().isoformat(timespec='seconds')
+    with limiter(url):
+        if source.get('render') and render_pool:
+            try:
+                raw_content, charset = render_pool.render(url, source.get('wait_for'))
+            except Exception as e:
+                result['error'] = f"Render failed: {e}"
+                return result
+            not_modified = False
+        else:
+            raw_content, charset, not_modified = fetch_raw(url, force=force)
+    result['fetch_seconds'] = time.perf_counter() - started
+
+    if raw_content is None:
+        result['error'] = 'Failed to fetch content'
+        return result
+
+    existing_path = find_markdown_path(daily_folder, source['filename'])
+    if not_modified and existing_path:
+        result['success'] = True
+        result['unchanged'] = True
+        result['path'] = existing_path
+        return result
+
+    started = time.perf_counter()
+    try:
+        process = parse_pool.process if parse_pool else process_content
+        title, cleaned_content = process(raw_content, charset, profile)
+    except Exception as e:
+        result['error'] = f"Processing failed: {e}"
+        return result
+    result['process_seconds'] = time.perf_counter() - started
+    result['title'] = title
+    result['content_found'] = cleaned_content != NO_CONTENT
+    result['characters'] = len(cleaned_content)
+
+    started = time.perf_counter()
+    if archive_mode == 'diff':
+        success, saved = save_snapshot(title, cleaned_content, base_path, daily_folder, source['filename'],
+                                       compression, keyframe_days)
+    else:
+        success, saved = save_as_markdown(title, cleaned_content, base_path, daily_folder, source['filename'], compression)
+    result['save_seconds'] = time.perf_counter() - started
+
+    if success:
+        result['success'] = True
+        result['path'] = saved
+    else:
+        result['error'] = f"Save failed: {saved}"
+    return result
+
+
+def _extract_source_streaming(source, limiter, base_path, daily_folder, max_bytes, compression=None):
+    """
+    Stream one source straight into its Markdown file
+
+    The response is read in chunks, fed to an incremental parser and each
+    Markdown line is written as soon as it is recognized, so memory use does
+    not grow with the page. Bodies over `max_bytes` are truncated. Only the
+    built-in Simplenote layout streams; sources with a custom extraction
+    profile go through _extract_source().
+
+    Returns:
+        Result dict like _extract_source(), plus 'truncated'
+    """
+    from .simfetcher import fetch_streaming
+    from .processor import MarkdownStreamParser, DEFAULT_PROFILE, NO_CONTENT
+
+    url = source['url']
+    result = {
+        'url': url,
+        'filename': source['filename'],
+        'profile': DEFAULT_PROFILE.name,
+        'title': None,
+        'fetched_at': None,
+        'content_found': None,
+        'success': False,
+        'unchanged': False,
+        'truncated': False,
+        'fetch_seconds': 0.0,
+        'process_seconds': 0.0,
+        'save_seconds': 0.0,
+        'characters': 0,
+        'path': None,
+        'error': None
+    }
+
+    started = time.perf_counter()
+    try:
+        with MarkdownStreamWriter(daily_folder, source['filename'], base_path, compression) as writer:
+            parser = MarkdownStreamParser(writer.write_line)
+
+            def feed(text):
+                feed_started = time.perf_counter()
+                parser.feed(text)
+                result['process_seconds'] += time.perf_counter() - feed_started
+
+            result['fetched_at'] = datetime.now().isoformat(timespec='seconds')
+            with limiter(url):
+                stream = fetch_streaming(url, feed, max_bytes=max_bytes)
+            if stream is None:
+                writer.discard()
+            parser.close()
+            if not parser.found:
+                writer.write_line(NO_CONTENT)
+    except Exception as e:
+        result['error'] = f"Streaming failed: {e}"
+        return result
+
+    result['fetch_seconds'] = time.perf_counter() - started - result['process_seconds']
+    if stream is None:
+        result['error'] = 'Failed to fetch content'
+        return result
+
+    result['success'] = True
+    result['title'] = parser.title or 'Untitled'  # Same fallback as process_content()
+    result['content_found'] = parser.found
+    result['truncated'] = stream['truncated']
+    result['characters'] = writer.characters
+    result['path'] = writer.file_path
+    return result
+
+
+def _print_source_result(source, result, elapsed):
+    """Print one finished source as a single block (safe across threads)"""
+    emoji = SOURCE_EMOJI.get(source['filename'].lower(), '📄')
+    lines = [f"{emoji} {source['filename'].title()}", f"   🌐 {source['url']}"]
+    if result['unchanged']:
+        lines.append(f"   ⏭️  Not modified since last fetch - kept {result['path']}")
+    elif result['success']:
+        lines.append(f"   📄 {result['characters']:,} characters extracted")
+        if result.get('truncated'):
+            lines.append(f"   ✂️  Page exceeded the size cap - content truncated")
+        lines.append(f"   💾 Saved: {result['path']}")
+    else:
+        lines.append(f"   ❌ {result['error']}")
+    lines.append(f"   ⏱️  {elapsed:.2f}s (fetch {result['fetch_seconds']:.2f}s, "
+                 f"process {result['process_seconds']:.2f}s, save {result['save_seconds']:.2f}s)")
+    print("\n".join(lines) + "\n", flush=True)
+
+
+def _print_profile_stats(results, compiled, cache_hits):
+    """Per-profile content hits / misses for the run summary"""
+    stats = {}
+    for _, result, _ in results:
+        entry = stats.setdefault(result['profile'], {'sources': 0, 'hits': 0, 'misses': 0})
+        entry['sources'] += 1
+        if result['content_found'] is True:
+            entry['hits'] += 1
+        elif result['content_found'] is False:
+            entry['misses'] += 1
+
+    print()
+    print(f"🧩 Extraction profiles ({compiled} compiled, {cache_hits} cache hit(s)):")
+    for name, entry in sorted(stats.items()):
+        line = f"   {name:<20} {entry['sources']} source(s), {entry['hits']} matched"
+        if entry['misses']:
+            line += f", {entry['misses']} no content"
+        print(line)
+
+
+def run_extraction(urls=None, max_workers=None, per_host=None, force=False, stream=None, max_bytes=None,
+                   compression=None, parse_workers=None, due=False, limit=None, resume=False, archive_mode=None,
+                   render=False, to_session=False, bundle=None):
     """
     Original extraction workflow - fetches content from clipboard/config sources
     This is the legacy feature of simexp
-    """
+
+    Sources are fetched, processed and saved concurrently on a bounded
+    thread pool (EXTRACT_MAX_WORKERS overall, EXTRACT_PER_HOST per host).
+    Pages the server reports as unchanged (HTTP 304) are not re-processed.
+    Each source is converted with its EXTRACT_PROFILES entry (selected by
+    the source's `profile` key or by host), compiled once and cached.
+    Every outcome is recorded in the source state database, which `due`
+    uses to fetch only sources whose refresh interval has elapsed. Finished
+    sources are checkpointed in the daily folder so an interrupted run can
+    be continued with `resume`. With ARCHIVE_MODE: diff, each day is stored
+    as a diff against the previous snapshot (see snapshots.py). Sources
+    marked `render: true` share a pool of warm headless browser pages.
+    With `to_session`, new and changed sources are then appended to the
+    active session note in one pass. With `bundle`, the day's sources are
+    also merged into one YYYYMMDD_bundle file (see bundle.py).
+
+    Args:
+        urls: Optional URLs to extract instead of the configured sources
+        max_workers: Global concurrency cap (default: config or 8)
+        per_host: Concurrent fetches per host (default: config or 2)
+        force: Ignore the HTTP cache and re-process every source
+        stream: Stream pages straight to disk with bounded memory
+                (default: EXTRACT_STREAMING from config, off)
+        max_bytes: Size cap per page in streaming mode (default: EXTRACT_MAX_BYTES or 50MB)
+        compression: Archive format - 'none', 'gzip' (.md.gz) or 'zstd' (.md.zst)
+                     (default: ARCHIVE_COMPRESSION from config, none)
+        parse_workers: Parse in N worker processes ('auto' = one per core)
+                       (default: EXTRACT_PARSE_WORKERS from config, off)
+        due: Extract only manifest sources that are due, by priority
+        limit: With `due`, fetch at most this many sources
+        resume: Skip sources today's checkpoint records as finished
+        archive_mode: 'full' copies or change-only 'diff' snapshots
+                      (default: ARCHIVE_MODE from config, full)
+        render: Render every source in the headless browser, as if all
+                were marked `render: true`
+        to_session: Append new/changed sources to the active session note
+        bundle: Also write the day's bundle - 'jsonl', 'arrow', 'parquet' or
+                'auto' (default: EXTRACT_BUNDLE from config, off)
+    """
+    import yaml
+    from .simfetcher import run_concurrently, HostLimiter, size_http_pool, DEFAULT_MAX_WORKERS, DEFAULT_PER_HOST, DEFAULT_MAX_BYTES
+    from .processor import ParsePool, profile_cache_stats, DEFAULT_PROFILE
+    from .imp_clip import update_sources_from_clipboard, is_clipboard_content_valid
+    from .bundle import resolve_bundle_format, bundle_row, write_bundle
+    from .render_pool import RenderPool, DEFAULT_RENDER_PAGES, DEFAULT_MAX_USES
+
     print("♠️🌿🎸🧵 SimExp Extraction Mode")
     print()
 
-    # Update sources from clipboard
-    update_sources_from_clipboard()
+    if not urls and not due:
+        # Update sources from clipboard
+        update_sources_from_clipboard()
 
     # Load configuration from YAML file
     config_path = CONFIG_FILE
@@ -2139,10 +2795,31 @@ def run_extraction():
         return
 
     with open(config_path, 'r') as config_file:
-        config = yaml.safe_load(config_file)
-
-    # Check if clipboard content is valid
-    if not is_clipboard_content_valid():
+        config = yaml.safe_load(config_file) or {}
+
+    # Source manifest (scheduling, host rate limits) and fetch history,
+    # kept next to simexp.yaml unless SOURCE_MANIFEST points elsewhere
+    config_dir = os.path.dirname(os.path.abspath(config_path))
+    manifest = load_manifest(
+        os.path.expanduser(config.get('SOURCE_MANIFEST') or os.path.join(config_dir, 'sources.yaml')),
+        fallback_sources=config.get('SOURCES', [])
+    )
+    source_state = SourceState(os.path.join(config_dir, 'sources.db'))
+
+    if urls:
+        sources = _sources_from_urls(urls)
+    elif due:
+        sources = due_sources(manifest['sources'], source_state.load(), limit=limit)
+        for source in sources:
+            if not source.get('filename'):
+                source['filename'] = _sources_from_urls([source['url']])[0]['filename']
+        print(f"🗓️  {len(sources)} of {len(manifest['sources'])} source(s) due"
+              + (f" (limit {limit})" if limit else ""))
+        if not sources:
+            print("✅ Nothing is due - every source is within its refresh interval.")
+            return []
+    elif not is_clipboard_content_valid():
+        # Check if clipboard content is valid
         print("📋 No valid URL in clipboard. Using sources from configuration.")
         sources = config.get('SOURCES', [])
     else:
@@ -2154,67 +2831,105 @@ def run_extraction():
         print("💡 Run 'simexp init' and add source URLs to your configuration.")
         return
 
-    base_path = config['BASE_PATH']
-
-    # Create a folder for the current date
+    base_path = config.get('BASE_PATH', os.path.expanduser('~/'))
+    max_workers = max_workers or _get_extract_setting(config, 'EXTRACT_MAX_WORKERS', DEFAULT_MAX_WORKERS)
+    per_host = per_host or _get_extract_setting(config, 'EXTRACT_PER_HOST', DEFAULT_PER_HOST)
+    size_http_pool(max_workers)
+    if stream is None:
+        stream = bool(config.get('EXTRACT_STREAMING', False))
+    max_bytes = max_bytes or _get_extract_setting(config, 'EXTRACT_MAX_BYTES', DEFAULT_MAX_BYTES)
+    compression = resolve_compression(compression or config.get('ARCHIVE_COMPRESSION'))
+    parse_workers = _get_parse_workers(config, parse_workers)
+    archive_mode = resolve_archive_mode(archive_mode or config.get('ARCHIVE_MODE'))
+    keyframe_days = _get_extract_setting(config, 'ARCHIVE_KEYFRAME_DAYS', DEFAULT_KEYFRAME_DAYS)
+    bundle_format = resolve_bundle_format(bundle or config.get('EXTRACT_BUNDLE'))
+
+    # Resolve and compile extraction profiles once, before the workers start
+    profiles = config.get('EXTRACT_PROFILES') or {}
+    compiled_before, hits_before = profile_cache_stats['compiled'], profile_cache_stats['hits']
+    sources = [dict(source, extraction_profile=_resolve_profile(source, profiles)) for source in sources]
+    if render:
+        sources = [dict(source, render=True) for source in sources]
+    render_count = sum(1 for source in sources if source.get('render'))
+
+    # Folder for the current date (created by the archiver on first save)
     current_date = datetime.now().strftime('%Y%m%d')
     daily_folder = os.path.join(base_path, current_date)
-    os.makedirs(daily_folder, exist_ok=True)
 
     print(f"📁 Output: {daily_folder}/")
+    checkpoint = ExtractionCheckpoint(daily_folder, resume=resume, urls=[source['url'] for source in sources])
+    if resume:
+        remaining = [source for source in sources if not checkpoint.is_done(source['url'])]
+        print(f"⏯️  Resuming: {len(sources) - len(remaining)} source(s) already done, {len(remaining)} remaining")
+        sources = remaining
+        if not sources:
+            print("✅ Nothing left to resume.")
+            return []
     print()
-    print(f"📚 Fetching {len(sources)} source(s)...")
+    print(f"📚 Fetching {len(sources)} source(s) "
+          f"(up to {max_workers} at once, {per_host} per host)...")
+    if stream:
+        print(f"🌊 Streaming mode: pages capped at {max_bytes / (1024 * 1024):.0f} MB")
+    if compression != 'none':
+        print(f"🗜️  Archiving as .md{COMPRESSION_SUFFIXES[compression]} ({compression})")
+    if parse_workers:
+        print(f"🧮 Parsing in {parse_workers} worker process(es)")
+    if render_count:
+        render_pages = _get_extract_setting(config, 'EXTRACT_RENDER_PAGES', DEFAULT_RENDER_PAGES)
+        print(f"🎭 Rendering {render_count} source(s) in a headless browser ({render_pages} page(s))")
+    if archive_mode == 'diff':
+        print(f"🧬 Change-only snapshots (full keyframe every {keyframe_days} snapshot(s))")
     print()
 
-    # Track statistics
-    success_count = 0
-    fail_count = 0
-
-    # Fetch, process, and save content for each source
-    for i, source in enumerate(sources, 1):
-        url = source['url']
-        filename = source['filename']
-
-        # Determine emoji based on filename
-        emoji_map = {
-            'aureon': '🌿',
-            'nyro': '♠️',
-            'jamai': '🎸',
-            'synth': '🧵'
-        }
-        emoji = emoji_map.get(filename.lower(), '📄')
-
-        print(f"{emoji} {filename.title()}")
-        print(f"   🌐 {url}")
-        print(f"   ⬇️  Fetching...", end=" ", flush=True)
-
-        raw_content = fetch_content(url)
-
-        if raw_content is None:
-            print("❌")
-            print(f"   ⚠️  Failed to fetch content")
-            print()
-            fail_count += 1
-            continue
-
-        print("✓")
-
-        # Process content
-        title, cleaned_content = process_content(raw_content)
-        content_length = len(cleaned_content)
-        print(f"   📄 {content_length:,} characters extracted")
-
-        # Save to markdown
-        success, result = save_as_markdown(title, cleaned_content, base_path, daily_folder, filename)
-
-        if success:
-            print(f"   💾 Saved: {result}")
-            success_count += 1
+    # Fetch, process, and save all sources concurrently
+    limiter = HostLimiter(per_host, manifest['host_rates'])
+    parse_pool = ParsePool(parse_workers) if parse_workers else None
+    render_pool = None
+    if render_count:
+        render_pool = RenderPool(
+            pages=render_pages,
+            max_uses=_get_extract_setting(config, 'EXTRACT_RENDER_MAX_USES', DEFAULT_MAX_USES),
+            cdp_url=config.get('EXTRACT_RENDER_CDP')
+        )
+    started = time.perf_counter()
+
+    def extract(source):
+        if stream and source['extraction_profile'] is DEFAULT_PROFILE and not source.get('render'):
+            result = _extract_source_streaming(source, limiter, base_path, daily_folder, max_bytes, compression)
         else:
-            print(f"   ❌ Save failed: {result}")
-            fail_count += 1
+            result = _extract_source(source, limiter, base_path, daily_folder, force=force,
+                                     compression=compression, parse_pool=parse_pool,
+                                     archive_mode=archive_mode, keyframe_days=keyframe_days,
+                                     render_pool=render_pool)
+        if result['success']:
+            checkpoint.record(source['url'], source['filename'], result['path'])
+        return result
 
-        print()
+    try:
+        results = run_concurrently(sources, extract, max_workers=max_workers, on_result=_print_source_result)
+    finally:
+        checkpoint.close()
+        if parse_pool:
+            parse_pool.close()
+        if render_pool:
+            render_pool.close()
+    wall_seconds = time.perf_counter() - started
+    source_state.record([
+        {'url': result['url'], 'success': result['success'], 'error': result['error']}
+        for _, result, _ in results
+    ])
+
+    bundle_path = None
+    if bundle_format:
+        try:
+            rows = [bundle_row(result) for _, result, _ in results if result['success']]
+            bundle_path = write_bundle(daily_folder, rows, bundle_format)
+        except Exception as e:
+            print(f"⚠️ Warning: Could not write the daily bundle: {e}")
+
+    unchanged_count = sum(1 for _, result, _ in results if result['unchanged'])
+    success_count = sum(1 for _, result, _ in results if result['success']) - unchanged_count
+    fail_count = len(results) - success_count - unchanged_count
 
     # Summary
     print("=" * 60)
@@ -2224,8 +2939,242 @@ def run_extraction():
         print(f"⚠️  Extraction finished with errors:")
         print(f"   ✓ Success: {success_count}")
         print(f"   ✗ Failed: {fail_count}")
+    if unchanged_count:
+        print(f"   ⏭️  Unchanged: {unchanged_count} (use --force to re-process)")
+    print()
+    print("⏱️  Per-source timings:")
+    for source, result, elapsed in results:
+        status = "⏭" if result['unchanged'] else ("✓" if result['success'] else "✗")
+        print(f"   {status} {source['filename']:<20} {elapsed:6.2f}s  "
+              f"(fetch {result['fetch_seconds']:.2f}s, process {result['process_seconds']:.2f}s, "
+              f"save {result['save_seconds']:.2f}s)")
+    serial_seconds = sum(elapsed for _, _, elapsed in results)
+    print(f"   Total: {wall_seconds:.2f}s wall ({serial_seconds:.2f}s if run one by one)")
+    if parse_pool:
+        print(f"   Parsing: {parse_pool.workers} process(es), "
+              f"peak {parse_pool.peak_in_flight}/{parse_pool.max_pending} page(s) in flight")
+    if bundle_path:
+        print(f"   Bundle: {bundle_path} ({bundle_format})")
+    if render_pool and render_pool.rendered:
+        print(f"   Rendering: {render_pool.rendered} page(s) on {render_pool.pages} warm page(s), "
+              f"peak {render_pool.peak_in_flight} at once, {render_pool.recycled} recycled")
+    _print_profile_stats(results, profile_cache_stats['compiled'] - compiled_before,
+                         profile_cache_stats['hits'] - hits_before)
     print("=" * 60)
 
+    if to_session:
+        print()
+        push_extraction_to_session(results)
+
+    return results
+
+
+def _session_entries_for_results(results, session):
+    """
+    Extracted sources the session note does not have yet
+
+    A source is pushed when its archived content hash differs from the one
+    recorded with its last files_added entry in this session, so unchanged
+    sources are not appended twice.
+
+    Returns:
+        Entries for handle_session_add_batch(), in extraction order
+    """
+    pushed = {}
+    for entry in (session.get('south') or {}).get('files_added') or []:
+        if isinstance(entry, dict) and entry.get('source_url'):
+            pushed[entry['source_url']] = entry.get('content_hash')
+
+    entries = []
+    manifests = {}
+    for _, result, _ in results:
+        if not result['success'] or not result['path']:
+            continue
+        daily_folder = os.path.dirname(result['path'])
+        if daily_folder not in manifests:
+            manifests[daily_folder] = read_manifest(daily_folder)
+        digest = (manifests[daily_folder].get(result['filename']) or {}).get('hash')
+        if digest and pushed.get(result['url']) == digest:
+            continue
+        entries.append({
+            'path': result['path'],
+            'content': read_markdown(result['path']),
+            'heading': f"Extracted: {result['url']}",
+            'metadata': {'source_url': result['url'], 'content_hash': digest},
+        })
+    return entries
+
+
+def push_extraction_to_session(results, cdp_url: Optional[str] = None) -> int:
+    """
+    Append new/changed extracted sources to the active session note
+
+    All sources go in with one browser attach and one write, each tracked
+    as a files_added entry (SOUTH) with its source URL and content hash.
+
+    Args:
+        results: run_extraction() results
+        cdp_url: Chrome DevTools Protocol URL (uses priority chain if None)
+
+    Returns:
+        Number of sources added to the session note
+    """
+    session = get_active_session()
+    if not session:
+        print("❌ No active session. Run 'simexp session start' first.")
+        return 0
+
+    entries = _session_entries_for_results(results, session)
+    if not entries:
+        print("✅ Session note already has the latest content of every extracted source")
+        return 0
+
+    print(f"📤 Adding {len(entries)} new/changed source(s) to session {session['session_id']}")
+    return asyncio.run(handle_session_add_batch(entries, cdp_url=get_cdp_url(cdp_url)))
+
+
+def _archive_base_path():
+    """BASE_PATH from simexp.yaml (None if not configured)"""
+    import yaml
+
+    if not os.path.exists(CONFIG_FILE):
+        print(f"❌ Configuration file '{CONFIG_FILE}' not found.")
+        print(f"💡 Please run 'simexp init' to create it.")
+        return None
+    with open(CONFIG_FILE, 'r') as config_file:
+        config = yaml.safe_load(config_file) or {}
+    return config.get('BASE_PATH', os.path.expanduser('~/'))
+
+
+def archive_save_command(content: str, title: Optional[str] = None, source_name: Optional[str] = None):
+    """
+    Archive content given on the command line (stdin) into today's folder
+
+    Args:
+        content: Text to archive
+        title: Optional title; also names the source when none is given
+        source_name: Source filename (default: slug of the title, or 'archive')
+
+    Returns:
+        Path of the archived file, or None on failure
+    """
+    base_path = _archive_base_path()
+    if base_path is None:
+        return None
+    if not content.strip():
+        print("❌ Nothing to archive (empty input)")
+        return None
+    source_name = source_name or re.sub(r'[^A-Za-z0-9_-]+', '-', (title or '').strip()).strip('-').lower() or 'archive'
+    daily_folder = os.path.join(base_path, datetime.now().strftime('%Y%m%d'))
+    body = f"# {title.strip()}\n\n{content.strip()}" if title and title.strip() else content.strip()
+    success, path = save_as_markdown(title, body, base_path, daily_folder, source_name)
+    if not success:
+        print(f"❌ Could not archive content: {path}")
+        return None
+    print(f"🗄️  Archived to {path}")
+    return path
+
+
+def archive_show_command(source_name: str, date: str):
+    """
+    Print a source's archived document for a day
+
+    Full copies are read as they are; change-only snapshots are rebuilt
+    from the nearest keyframe.
+
+    Args:
+        source_name: Source filename (without date prefix or extension)
+        date: Day in YYYYMMDD format
+    """
+    base_path = _archive_base_path()
+    if base_path is None:
+        return None
+    try:
+        text = reconstruct(base_path, source_name, date)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not rebuild '{source_name}' for {date}: {e}")
+        return None
+    if text is None:
+        daily_folder = os.path.join(base_path, date)
+        candidates = []
+        if os.path.isdir(daily_folder):
+            # Full copies are named after the day they were written
+            candidates = sorted(os.path.join(daily_folder, name) for name in os.listdir(daily_folder)
+                                 if re.fullmatch(rf"\d{{8}}_{re.escape(source_name)}\.md(\.gz|\.zst)?", name))
+        if not candidates:
+            print(f"❌ No archive for '{source_name}' on {date}")
+            return None
+        text = read_markdown(candidates[0])
+    print(text, end='')
+    return text
+
+
+def archive_changes_command(date: Optional[str] = None):
+    """
+    Print what changed per source on a day
+
+    Args:
+        date: Day in YYYYMMDD format (default: today)
+    """
+    base_path = _archive_base_path()
+    if base_path is None:
+        return None
+    date = date or datetime.now().strftime('%Y%m%d')
+    report = changes_for_day(base_path, date)
+    print(f"🧬 Changes on {date}")
+    if not report:
+        print("   No change-only snapshots recorded for this day.")
+        return report
+    for item in report:
+        if item['kind'] == 'full':
+            print(f"   ● {item['source']:<20} full snapshot")
+        elif item['added'] or item['removed']:
+            print(f"   ± {item['source']:<20} +{item['added']} / -{item['removed']} line(s)")
+        else:
+            print(f"   = {item['source']:<20} unchanged")
+    return report
+
+
+def search_command(query: str, source: Optional[str] = None, since: Optional[str] = None,
+                   until: Optional[str] = None, limit: int = DEFAULT_LIMIT, reindex: bool = False):
+    """
+    Search the extraction archive
+
+    Args:
+        query: FTS5 query ("exact phrase", AND/OR/NOT, prefix*)
+        source: Only this source
+        since: Only days on or after YYYYMMDD
+        until: Only days on or before YYYYMMDD
+        limit: Maximum hits
+        reindex: Index every archived document first (older archives)
+
+    Returns:
+        List of hits, best first
+    """
+    base_path = _archive_base_path()
+    if base_path is None:
+        return None
+    if reindex:
+        started = time.perf_counter()
+        count = reindex_archive(base_path)
+        print(f"🗂️  Indexed {count} document(s) in {time.perf_counter() - started:.2f}s")
+        if not query:
+            return []
+
+    started = time.perf_counter()
+    hits = search_archive(base_path, query, source=source, since=since, until=until, limit=limit)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if not hits:
+        print(f"🔍 No matches for {query!r} ({elapsed_ms:.1f} ms)")
+        print("💡 Archives written before the index existed: run 'simexp search --reindex'")
+        return hits
+    print(f"🔍 {len(hits)} match(es) for {query!r} ({elapsed_ms:.1f} ms)")
+    for hit in hits:
+        print(f"\n📄 {hit['date']}  {hit['source']}")
+        print(f"   {' '.join(hit['snippet'].split())}")
+        print(f"   {hit['path']}")
+    return hits
+
 
 # ═══════════════════════════════════════════════════════════════
 # BROWSER/CDP TESTING COMMANDS - Issue #36 Enhancement
@@ -2238,6 +3187,7 @@ def browser_test_command():
 
     🧵 Synth: Quick testing command for developers
     """
+    from .simfetcher import http_get
     import subprocess
 
     print("╔══════════════════════════════════════════════════════════════╗")
@@ -2290,7 +3240,7 @@ def browser_test_command():
         # 5. Test connection
         print("🧪 Connection Test:")
         try:
-            response = requests.get(f'{cdp_url}/json/version', timeout=3)
+            response = http_get(f'{cdp_url}/json/version', timeout=3, retry=False)
             if response.status_code == 200:
                 data = response.json()
                 print(f"   ✅ Connection SUCCESSFUL")
@@ -2303,7 +3253,7 @@ def browser_test_command():
                     print("🌐 Network Access Test:")
                     network_test_url = f'http://{local_ip}:9222/json/version'
                     try:
-                        network_response = requests.get(network_test_url, timeout=2)
+                        network_response = http_get(network_test_url, timeout=2, retry=False)
                         if network_response.status_code == 200:
                             print(f"   ✅ Network access WORKING")
                             print(f"   📱 You can access from other devices: {network_test_url}")
@@ -2475,6 +3425,9 @@ def main():
                 print("  list                                         - List all sessions (directory tree)")
                 print("  info                                         - Show current session & directory context")
                 print("  clear                                        - Clear active session")
+                print("  storage [json|sqlite]                        - Show or convert session storage backend")
+                print("  export <file> / import <file>                - Export/import session as JSON")
+                print("  migrate [--all]                              - Upgrade session files to current schema")
                 print("\nSession Content:")
                 print("  write <message>                              - Write to session note")
                 print("  read                                         - Read session note")
@@ -2491,7 +3444,9 @@ def main():
                 print("  reflect [--prompt <text>]                    - Open editor for reflection notes")
                 print("  observe-pattern '<text>'                     - Record an observed pattern")
                 print("  extract-wisdom '<text>'                      - Extract and record wisdom")
-                print("  complete [--seeds '<text>']                  - Complete session with ceremony")
+                print("  complete [--seeds '<text>'] [--keep-history] - Complete session with ceremony (archives history)")
+                print("  archive / rehydrate                          - Move history to/from ~/.simexp/archive/")
+                print("  search '<query>' [--kind <kind>] [--reindex] - Search insights and writes across all sessions")
                 print("\nExamples:")
                 print("  simexp session start --ai claude --issue 42  # Start new session")
                 print("  simexp session start TEST_COMMANDS.md        # Start with file")
@@ -2512,6 +3467,9 @@ def main():
                 print("  list                                         - List all sessions (directory tree)")
                 print("  info                                         - Show current session & directory context")
                 print("  clear                                        - Clear active session")
+                print("  storage [json|sqlite]                        - Show or convert session storage backend")
+                print("  export <file> / import <file>                - Export/import session as JSON")
+                print("  migrate [--all]                              - Upgrade session files to current schema")
                 print("\nSession Content:")
                 print("  write <message>                              - Write to session note")
                 print("  read                                         - Read session note")
@@ -2528,7 +3486,9 @@ def main():
                 print("  reflect [--prompt <text>]                    - Open editor for reflection notes")
                 print("  observe-pattern '<text>'                     - Record an observed pattern")
                 print("  extract-wisdom '<text>'                      - Extract and record wisdom")
-                print("  complete [--seeds '<text>']                  - Complete session with ceremony")
+                print("  complete [--seeds '<text>'] [--keep-history] - Complete session with ceremony (archives history)")
+                print("  archive / rehydrate                          - Move history to/from ~/.simexp/archive/")
+                print("  search '<query>' [--kind <kind>] [--reindex] - Search insights and writes across all sessions")
                 print("\nExamples:")
                 print("  simexp session start --ai claude --issue 42 --repo owner/repo  # Start with GitHub issue")
                 print("  simexp session start --ai claude --issue 42                    # Start (repo auto-detected)")
@@ -2617,6 +3577,51 @@ def main():
             elif subcommand == 'info':
                 session_info_command()
 
+            elif subcommand == 'storage':
+                import argparse
+                parser = argparse.ArgumentParser(
+                    description='Show or convert the session storage backend',
+                    prog='simexp session storage')
+                parser.add_argument('backend', nargs='?', default=None, choices=['json', 'sqlite'],
+                                    help='Convert the current session to this backend')
+
+                args = parser.parse_args(sys.argv[3:])
+                session_storage_command(args.backend)
+
+            elif subcommand == 'export':
+                import argparse
+                parser = argparse.ArgumentParser(
+                    description='Export the current session as JSON',
+                    prog='simexp session export')
+                parser.add_argument('output', help='Destination JSON file')
+
+                args = parser.parse_args(sys.argv[3:])
+                session_export_command(args.output)
+
+            elif subcommand == 'migrate':
+                import argparse
+                parser = argparse.ArgumentParser(
+                    description='Upgrade session files to the current schema version',
+                    prog='simexp session migrate')
+                parser.add_argument('--all', action='store_true', dest='migrate_all',
+                                    help='Migrate every known session (registry + directory tree)')
+                parser.add_argument('--workers', type=int, default=8, help='Parallel workers (default: 8)')
+
+                args = parser.parse_args(sys.argv[3:])
+                session_migrate_command(migrate_all=args.migrate_all, workers=args.workers)
+
+            elif subcommand == 'import':
+                import argparse
+                parser = argparse.ArgumentParser(
+                    description='Import a session from JSON into the current directory',
+                    prog='simexp session import')
+                parser.add_argument('input', help='Source JSON file (session.json format)')
+                parser.add_argument('--storage', default=None, choices=['json', 'sqlite'],
+                                    help='Storage backend for the imported session')
+
+                args = parser.parse_args(sys.argv[3:])
+                session_import_command(args.input, backend=args.storage)
+
             elif subcommand == 'add':
                 import argparse
                 parser = argparse.ArgumentParser(
@@ -2760,9 +3765,50 @@ def main():
                     description='Complete the session ceremony (Phase 5: North Direction)',
                     prog='simexp session complete')
                 parser.add_argument('--seeds', default=None, help='Seeds (insights/tasks) for next session')
+                parser.add_argument('--keep-history', action='store_true',
+                                    help='Keep the full history in session.json instead of archiving it')
+                parser.add_argument('--compression', default='gzip', choices=['gzip', 'zstd'],
+                                    help='Archive compression (zstd requires the zstandard package)')
 
                 args = parser.parse_args(sys.argv[3:])
-                session_complete_command(seeds=args.seeds)
+                session_complete_command(seeds=args.seeds, archive=not args.keep_history,
+                                         compression=args.compression)
+
+            elif subcommand == 'archive':
+                import argparse
+                parser = argparse.ArgumentParser(
+                    description='Move the session history into ~/.simexp/archive/',
+                    prog='simexp session archive')
+                parser.add_argument('--compression', default='gzip', choices=['gzip', 'zstd'],
+                                    help='Archive compression (zstd requires the zstandard package)')
+
+                args = parser.parse_args(sys.argv[3:])
+                session_archive_command(compression=args.compression)
+
+            elif subcommand == 'rehydrate':
+                session_rehydrate_command()
+
+            elif subcommand == 'search':
+                import argparse
+                from .session_index import SESSION_KINDS
+                parser = argparse.ArgumentParser(
+                    description='Search reflections, patterns, wisdom, seeds and writes across all sessions',
+                    prog='simexp session search')
+                parser.add_argument('query', nargs='?', default='',
+                                    help='Search terms, "exact phrase", AND/OR/NOT, prefix*')
+                parser.add_argument('--kind', default=None, choices=list(SESSION_KINDS), help='Only this kind of entry')
+                parser.add_argument('--session', default=None, help='Only this session ID')
+                parser.add_argument('--since', default=None, help='Only entries tracked on or after this date (YYYY-MM-DD)')
+                parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT, help='Maximum hits')
+                parser.add_argument('--reindex', action='store_true',
+                                    help='Index registered workspaces and archived sessions first')
+                parser.add_argument('--json', action='store_true', help='Print hits as JSON')
+
+                args = parser.parse_args(sys.argv[3:])
+                if not args.query and not args.reindex:
+                    parser.error('a query is required (or --reindex)')
+                session_search_command(args.query, kind=args.kind, session_id=args.session, since=args.since,
+                                       limit=args.limit, reindex=args.reindex, as_json=args.json)
 
             else:
                 print(f"Unknown session subcommand: {subcommand}")
@@ -2826,10 +3872,113 @@ def main():
                 print("Run 'simexp browser' for usage information")
                 sys.exit(1)
 
+        elif command == 'extract':
+            import argparse
+            parser = argparse.ArgumentParser(
+                description='Extract web content to the daily Markdown archive. Without URLs, uses clipboard/config sources.',
+                prog='simexp extract')
+            parser.add_argument('urls', nargs='*', help='Source URLs to extract (default: configured sources)')
+            parser.add_argument('--concurrency', type=int, default=None, help='Maximum sources processed at once (default: EXTRACT_MAX_WORKERS or 8)')
+            parser.add_argument('--per-host', type=int, default=None, help='Maximum concurrent fetches per host (default: EXTRACT_PER_HOST or 2)')
+            parser.add_argument('--force', action='store_true', help='Ignore the HTTP cache and re-process unchanged sources')
+            parser.add_argument('--stream', action='store_true', default=None, help='Stream pages to disk with bounded memory (default: EXTRACT_STREAMING)')
+            parser.add_argument('--max-bytes', type=int, default=None, help='Size cap per page when streaming (default: EXTRACT_MAX_BYTES or 50MB)')
+            parser.add_argument('--workers', type=_parse_workers_arg, default=None, metavar='N', help="Parse pages in N worker processes ('auto': one per core; default: EXTRACT_PARSE_WORKERS, off)")
+            parser.add_argument('--due', action='store_true', help='Only extract manifest sources whose refresh interval has elapsed')
+            parser.add_argument('--limit', type=int, default=None, help='With --due, extract at most N sources (highest priority first)')
+            parser.add_argument('--resume', action='store_true', help="Continue today's interrupted run, skipping finished sources")
+            parser.add_argument('--compress', choices=['none', 'gzip', 'zstd'], default=None, help='Write .md.gz / .md.zst archives (default: ARCHIVE_COMPRESSION or none)')
+            parser.add_argument('--render', action='store_true', help='Render every source in a headless browser (default: only sources marked render: true)')
+            parser.add_argument('--bundle', nargs='?', const='auto', default=None, choices=['auto', 'jsonl', 'arrow', 'parquet'], help="Also write the day's sources to one bundle file (no value: Arrow if pyarrow is installed, else JSON Lines)")
+            parser.add_argument('--to-session', action='store_true', help='Append new/changed sources to the active session note in one pass')
+            parser.add_argument('--archive-mode', choices=['full', 'diff'], default=None, help='Store full copies or diffs against the previous day (default: ARCHIVE_MODE or full)')
+
+            args = parser.parse_args(sys.argv[2:])
+            run_extraction(
+                urls=args.urls,
+                max_workers=args.concurrency,
+                per_host=args.per_host,
+                force=args.force,
+                stream=args.stream,
+                max_bytes=args.max_bytes,
+                compression=args.compress,
+                parse_workers=args.workers,
+                due=args.due,
+                limit=args.limit,
+                resume=args.resume,
+                archive_mode=args.archive_mode,
+                render=args.render,
+                to_session=args.to_session,
+                bundle=args.bundle
+            )
+
+        elif command == 'search':
+            import argparse
+            parser = argparse.ArgumentParser(
+                description='Full-text search over the extraction archive (phrases in quotes, AND/OR/NOT, prefix*)',
+                prog='simexp search')
+            parser.add_argument('query', nargs='?', default='', help='Search query')
+            parser.add_argument('--source', default=None, help='Only this source')
+            parser.add_argument('--since', default=None, metavar='YYYYMMDD', help='Only days on or after this date')
+            parser.add_argument('--until', default=None, metavar='YYYYMMDD', help='Only days on or before this date')
+            parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT, help=f'Maximum results (default: {DEFAULT_LIMIT})')
+            parser.add_argument('--reindex', action='store_true', help='Index every archived document first')
+
+            args = parser.parse_args(sys.argv[2:])
+            if not args.query and not args.reindex:
+                parser.print_help()
+                sys.exit(1)
+            search_command(args.query, source=args.source, since=args.since, until=args.until,
+                           limit=args.limit, reindex=args.reindex)
+
+        elif command == 'archive':
+            if len(sys.argv) < 3 or sys.argv[2] in ('--help', '-h', 'help'):
+                print("♠️🌿🎸🧵 SimExp Archive Commands")
+                print("\nUsage: simexp archive <subcommand>")
+                print("\nSubcommands:")
+                print("  save [--title T]       - Archive text read from stdin into today's folder")
+                print("  show <source> <date>   - Print a source's document for a day (YYYYMMDD)")
+                print("  changes [date]         - What changed per source on a day (default: today)")
+                # Bare 'simexp archive' is a usage error (callers piping content in must not see success)
+                sys.exit(0 if len(sys.argv) >= 3 else 1)
+
+            subcommand = sys.argv[2]
+            if subcommand == 'save':
+                import argparse
+                parser = argparse.ArgumentParser(description='Archive text read from stdin', prog='simexp archive save')
+                parser.add_argument('--title', default=None, help='Title (also names the archived file)')
+                parser.add_argument('--source', default=None, help='Source filename (default: from the title)')
+                args = parser.parse_args(sys.argv[3:])
+                if archive_save_command(sys.stdin.read(), title=args.title, source_name=args.source) is None:
+                    sys.exit(1)
+
+            elif subcommand == 'show':
+                import argparse
+                parser = argparse.ArgumentParser(description='Reconstruct an archived document', prog='simexp archive show')
+                parser.add_argument('source', help='Source filename (as in the archive)')
+                parser.add_argument('date', help='Day to show (YYYYMMDD)')
+                args = parser.parse_args(sys.argv[3:])
+                archive_show_command(args.source, args.date)
+
+            elif subcommand == 'changes':
+                import argparse
+                parser = argparse.ArgumentParser(description='Report what changed on a day', prog='simexp archive changes')
+                parser.add_argument('date', nargs='?', default=None, help='Day to report (YYYYMMDD, default: today)')
+                args = parser.parse_args(sys.argv[3:])
+                archive_changes_command(args.date)
+
+            else:
+                print(f"Unknown archive subcommand: {subcommand}")
+                print("Run 'simexp archive' for usage information")
+                sys.exit(1)
+
         elif command == 'help' or command == '--help' or command == '-h':
             print("♠️🌿🎸🧵 SimExp - Simplenote Web Content Extractor & Writer")
             print("\nCommands:")
             print("  simexp                       - Run extraction from clipboard/config")
+            print("  simexp extract [urls...]     - Extract sources concurrently (--due, --resume, --to-session, --bundle, --concurrency N, --per-host N, --workers N, --render, --force, --stream, --compress)")
+            print("  simexp search <query>        - Full-text search of the archive (--source, --since, --until, --reindex)")
+            print("  simexp archive <subcommand>  - Show archived days and daily changes (show, changes)")
             print("  simexp init                  - Initialize configuration")
             print("  simexp session <subcommand>  - Session management (use --help for details)")
             print("  simexp browser <subcommand>  - Browser/CDP testing & management (use --help for details)")
@@ -1,18 +1,395 @@
+import codecs
+import hashlib
+import json
+import re
+import os
+import threading
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+from .processor import decode_html, sniff_encoding
+from .session_storage import _read_config
+
+# Bounded parallelism for multi-source fetching
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_PER_HOST = 2
+
+# Shared HTTP client defaults, overridable in ~/.simexp/simexp.yaml
+HTTP_DEFAULTS = {
+    'HTTP_CONNECT_TIMEOUT': 5.0,
+    'HTTP_READ_TIMEOUT': 30.0,
+    'HTTP_RETRIES': 3,
+    'HTTP_BACKOFF': 0.5,
+}
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_http_sessions = {}
+_http_lock = threading.Lock()
+_http_pool_size = DEFAULT_MAX_WORKERS * DEFAULT_PER_HOST
+
+# Conditional-GET cache: <sha256(url)>.json (validators) + .body (raw bytes)
+HTTP_CACHE_DIR = os.path.expanduser('~/.simexp/cache/http')
+
+# Streaming mode: chunk size and default body cap (EXTRACT_MAX_BYTES)
+STREAM_CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+_CHARSET = re.compile(r'charset=["\']?([\w.:-]+)', re.I)
+
+
+class _HostSlot:
+    """One host's concurrency slot, optionally spacing request starts"""
+
+    def __init__(self, per_host, rate=None):
+        self._semaphore = threading.BoundedSemaphore(per_host)
+        self._interval = 1.0 / rate if rate else 0.0
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def __enter__(self):
+        self._semaphore.acquire()
+        if self._interval:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start)
+                self._next_start = start + self._interval
+            if start > now:
+                time.sleep(start - now)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._semaphore.release()
+        return False
+
+
+class HostLimiter:
+    """
+    Caps concurrent requests per host; `with limiter(url):` around a fetch
+
+    Args:
+        per_host: Concurrent requests per host
+        rates: Optional {host: requests per second} limits
+    """
+
+    def __init__(self, per_host=DEFAULT_PER_HOST, rates=None):
+        self.per_host = max(1, int(per_host))
+        self.rates = {host.lower(): rate for host, rate in (rates or {}).items()}
+        self._lock = threading.Lock()
+        self._slots = {}
+
+    def __call__(self, url):
+        parsed = urlparse(url)
+        host = parsed.netloc.lower()
+        with self._lock:
+            if host not in self._slots:
+                rate = self.rates.get(host) or self.rates.get((parsed.hostname or '').lower())
+                self._slots[host] = _HostSlot(self.per_host, rate)
+            return self._slots[host]
+
+
+def get_http_settings():
+    """HTTP timeouts and retry policy from simexp.yaml, falling back to HTTP_DEFAULTS"""
+    config = _read_config()
+    settings = {}
+    for key, default in HTTP_DEFAULTS.items():
+        try:
+            settings[key] = type(default)(config.get(key, default))
+        except (TypeError, ValueError):
+            print(f"⚠️ Warning: Ignoring invalid {key}: {config.get(key)}")
+            settings[key] = default
+    return settings
+
+
+def get_http_session(retry=True):
+    """
+    Shared, pooled requests.Session (keep-alive reused across sources)
+
+    Args:
+        retry: Retry connection errors and 429/5xx with exponential backoff
+
+    Returns:
+        requests.Session safe to share between extraction threads
+    """
+    with _http_lock:
+        if retry not in _http_sessions:
+            settings = get_http_settings()
+            retries = settings['HTTP_RETRIES'] if retry else 0
+            adapter = HTTPAdapter(
+                pool_connections=_http_pool_size,
+                pool_maxsize=_http_pool_size,
+                max_retries=Retry(
+                    total=retries,
+                    connect=retries,
+                    read=retries,
+                    status=retries,
+                    backoff_factor=settings['HTTP_BACKOFF'],
+                    status_forcelist=RETRY_STATUSES,
+                    allowed_methods=frozenset(['GET', 'HEAD']),
+                    raise_on_status=False
+                )
+            )
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            # Advertise every encoding urllib3 can decode (br/zstd when installed)
+            session.headers['Accept-Encoding'] = make_headers(accept_encoding=True)['accept-encoding']
+            _http_sessions[retry] = session
+        return _http_sessions[retry]
+
+
+def size_http_pool(max_workers):
+    """
+    Grow the shared connection pools to keep one connection per worker
+
+    Each pool (one per host) must hold as many connections as threads may
+    use at once, or urllib3 discards the extras instead of keeping them
+    alive. Sessions built for a smaller pool are rebuilt; call this before
+    starting the workers.
+
+    Args:
+        max_workers: Concurrent fetches the caller will run
+    """
+    global _http_pool_size
+    with _http_lock:
+        if max_workers <= _http_pool_size:
+            return
+        _http_pool_size = max_workers
+        for session in _http_sessions.values():
+            session.close()
+        _http_sessions.clear()
+
+
+def reset_http_session():
+    """Close pooled connections; the next request rebuilds them from config"""
+    with _http_lock:
+        for session in _http_sessions.values():
+            session.close()
+        _http_sessions.clear()
+
+
+def http_get(url, timeout=None, retry=True, **kwargs):
+    """
+    GET through the shared session with connect/read timeouts
+
+    Args:
+        url: URL to fetch
+        timeout: Seconds, or (connect, read) tuple (default: configured)
+        retry: Use the retrying session (False for quick probes)
+    """
+    if timeout is None:
+        settings = get_http_settings()
+        timeout = (settings['HTTP_CONNECT_TIMEOUT'], settings['HTTP_READ_TIMEOUT'])
+    return get_http_session(retry).get(url, timeout=timeout, **kwargs)
+
+
+def _cache_paths(url):
+    key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    return (os.path.join(HTTP_CACHE_DIR, f"{key}.json"), os.path.join(HTTP_CACHE_DIR, f"{key}.body"))
+
+
+def _atomic_write(path, data):
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def read_cache_entry(url):
+    """Cached validators and body for a URL, or None"""
+    meta_path, body_path = _cache_paths(url)
+    try:
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+        with open(body_path, 'rb') as f:
+            meta['body'] = f.read()
+        return meta
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cache_entry(url, response):
+    """Keep the body if the server sent ETag/Last-Modified, otherwise drop any stale entry"""
+    meta_path, body_path = _cache_paths(url)
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if not etag and not last_modified:
+        for path in (meta_path, body_path):
+            if os.path.exists(path):
+                os.remove(path)
+        return
+
+    os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+    _atomic_write(body_path, response.content)
+    _atomic_write(meta_path, json.dumps({
+        'url': url,
+        'etag': etag,
+        'last_modified': last_modified,
+        'encoding': declared_charset(response.headers.get('Content-Type')),
+        'fetched_at': datetime.now().isoformat()
+    }).encode('utf-8'))
+
+
+def fetch_raw(url, force=False):
+    """
+    Fetch a page as bytes, revalidating against the on-disk HTTP cache
+
+    Sends If-None-Match / If-Modified-Since when the URL was cached with an
+    ETag or Last-Modified. A 304 is answered from the cache. The body is not
+    decoded here: `requests` would run charset detection over the whole page
+    whenever the server omits a charset.
+
+    Args:
+        url: URL to fetch
+        force: Skip the validators and download the full page
+
+    Returns:
+        tuple: (body: bytes or None, declared_charset: str or None, not_modified: bool)
+    """
+    cached = None if force else read_cache_entry(url)
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
 
-def fetch_content(url):
     try:
-        response = requests.get(url)
+        response = http_get(url, headers=headers)
+        if response.status_code == 304 and cached:
+            return (cached['body'], cached.get('encoding'), True)
         response.raise_for_status()  # Raise an error for bad responses
-        return response.text
+    except requests.RequestException as e:
+        print(f"Error fetching {url}: {e}")
+        return (None, None, False)
+
+    try:
+        _store_cache_entry(url, response)
+    except OSError as e:
+        print(f"⚠️ Warning: Could not cache {url}: {e}")
+    return (response.content, declared_charset(response.headers.get('Content-Type')), False)
+
+
+def fetch_conditional(url, force=False):
+    """
+    Like fetch_raw(), decoded to text
+
+    Returns:
+        tuple: (content: str or None, not_modified: bool)
+    """
+    body, charset, not_modified = fetch_raw(url, force=force)
+    if body is None:
+        return (None, False)
+    return (decode_html(body, charset), not_modified)
+
+
+def fetch_content(url):
+    content, _ = fetch_conditional(url)
+    return content
+
+
+def declared_charset(content_type):
+    """Charset named in a Content-Type header, or None"""
+    match = _CHARSET.search(content_type or '')
+    return match.group(1) if match else None
+
+
+def fetch_streaming(url, feed, max_bytes=DEFAULT_MAX_BYTES, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Stream a page into `feed` as decoded text chunks, never holding the whole body
+
+    Args:
+        url: URL to fetch
+        feed: Callback receiving each decoded text chunk
+        max_bytes: Stop reading after this many body bytes (None = no cap)
+        chunk_size: Bytes per network read
+
+    Returns:
+        dict with bytes_read, truncated and encoding, or None if the fetch failed
+    """
+    try:
+        with http_get(url, stream=True) as response:
+            response.raise_for_status()
+            charset = declared_charset(response.headers.get('Content-Type'))
+            encoding = None
+            decoder = None
+
+            bytes_read = 0
+            truncated = False
+            for chunk in response.iter_content(chunk_size):
+                if max_bytes and bytes_read + len(chunk) > max_bytes:
+                    chunk = chunk[:max_bytes - bytes_read]
+                    truncated = True
+                bytes_read += len(chunk)
+                if decoder is None:
+                    # Header charset, else <meta charset> / BOM in the first chunk
+                    encoding = sniff_encoding(chunk, charset, partial=True) or 'windows-1252'
+                    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+                feed(decoder.decode(chunk))
+                if truncated:
+                    break
+            if decoder is not None:
+                feed(decoder.decode(b'', final=True))
     except requests.RequestException as e:
         print(f"Error fetching {url}: {e}")
         return None
 
-def fetch_all_content(sources):
+    return {'bytes_read': bytes_read, 'truncated': truncated, 'encoding': encoding}
+
+
+def run_concurrently(items, func, max_workers=DEFAULT_MAX_WORKERS, on_result=None):
+    """
+    Run func(item) for every item on a bounded thread pool
+
+    Args:
+        items: Work items
+        func: Called once per item from a worker thread
+        max_workers: Global concurrency cap
+        on_result: Optional callback(item, result, elapsed) run as each item finishes
+
+    Returns:
+        list of (item, result, elapsed_seconds) in the order of `items`
+    """
+    def timed(item):
+        start = time.perf_counter()
+        result = func(item)
+        elapsed = time.perf_counter() - start
+        if on_result:
+            on_result(item, result, elapsed)
+        return (item, result, elapsed)
+
+    items = list(items)
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+        return list(executor.map(timed, items))
+
+
+def fetch_all_content(sources, max_workers=DEFAULT_MAX_WORKERS, per_host=DEFAULT_PER_HOST):
+    """
+    Fetch many URLs concurrently
+
+    Args:
+        sources: Iterable (or dict keyed by) source URLs
+        max_workers: Global cap on concurrent fetches
+        per_host: Cap on concurrent fetches to the same host
+
+    Returns:
+        dict of url -> HTML for the URLs that fetched successfully
+    """
+    limiter = HostLimiter(per_host)
+    size_http_pool(max_workers)
+
+    def fetch(url):
+        with limiter(url):
+            return fetch_content(url)
+
     content = {}
-    for url in sources.keys():
-        html_content = fetch_content(url)
+    for url, html_content, _ in run_concurrently(sources, fetch, max_workers):
         if html_content:
             content[url] = html_content
-    return content
\ No newline at end of file
+    return content
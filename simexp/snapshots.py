@@ -0,0 +1,279 @@
+"""
+SimExp Change-Only Snapshots
+Daily archive files stored as diffs against the previous extraction
+
+With ARCHIVE_MODE: diff, a source's first snapshot is saved in full
+(YYYYMMDD/YYYYMMDD_<source>.md) and each later day as a unified diff
+against the day before (YYYYMMDD/YYYYMMDD_<source>.md.diff). Every
+ARCHIVE_KEYFRAME_DAYS snapshots a full keyframe is written again, so
+reconstructing any day applies at most that many diffs.
+
+Per source, BASE_PATH/.snapshots/ keeps:
+    <source>.json       ordered list of {date, kind, file, hash}
+    <source>.latest.md  full text of the newest snapshot (the diff base)
+
+The .diff files double as a "what changed today" report.
+
+♠️🌿🎸🧵 G.Music Assembly - Change-Only Archive
+"""
+
+import os
+import re
+import json
+import difflib
+import hashlib
+from typing import Optional, Dict, List
+
+from .archiver import (
+    save_as_markdown, read_markdown, get_markdown_path, _record_manifest, _temp_path, _index_for_search,
+    COMPRESSION_SUFFIXES
+)
+
+SNAPSHOTS_DIR = '.snapshots'
+DIFF_SUFFIX = '.diff'
+DEFAULT_KEYFRAME_DAYS = 7
+ARCHIVE_MODES = ('full', 'diff')
+
+_HUNK = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+
+def resolve_archive_mode(mode) -> str:
+    """Normalize an ARCHIVE_MODE value ('full' or 'diff')"""
+    mode = str(mode or 'full').lower()
+    if mode not in ARCHIVE_MODES:
+        print(f"⚠️ Warning: Unknown ARCHIVE_MODE '{mode}', archiving full copies")
+        return 'full'
+    return mode
+
+
+def _format_document(content: str) -> str:
+    """Same layout save_as_markdown() writes"""
+    return ''.join(f"{paragraph}\n\n" for paragraph in content.split('\n\n'))
+
+
+def _atomic_write_text(path: str, text: str) -> None:
+    temp_path = _temp_path(path)
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+def make_diff(old: str, new: str) -> str:
+    """Unified diff (no context lines) turning old into new"""
+    lines = difflib.unified_diff(old.split('\n'), new.split('\n'), n=0, lineterm='')
+    return ''.join(f"{line}\n" for line in lines)
+
+
+def _hunk_lines(diff: str):
+    """Diff lines from the first hunk on (skips the ---/+++ file header)"""
+    lines = diff.split('\n')
+    for i, line in enumerate(lines):
+        if line.startswith('@@'):
+            return lines[i:]
+    return []
+
+
+def apply_diff(old: str, diff: str) -> str:
+    """
+    Apply a diff produced by make_diff()
+
+    Raises:
+        ValueError: If the diff does not match the text
+    """
+    source = old.split('\n')
+    result = []
+    position = 0
+    for line in _hunk_lines(diff):
+        match = _HUNK.match(line)
+        if match:
+            start, count = int(match.group(1)), match.group(2)
+            count = 1 if count is None else int(count)
+            # With zero old lines the hunk inserts after line `start`
+            until = start if count == 0 else start - 1
+            result.extend(source[position:until])
+            position = until
+        elif line.startswith('-'):
+            if position >= len(source) or source[position] != line[1:]:
+                raise ValueError(f"diff does not apply at line {position + 1}")
+            position += 1
+        elif line.startswith('+'):
+            result.append(line[1:])
+    result.extend(source[position:])
+    return '\n'.join(result)
+
+
+def _index_path(base_path: str, source_name: str) -> str:
+    return os.path.join(base_path, SNAPSHOTS_DIR, f"{source_name}.json")
+
+
+def _latest_path(base_path: str, source_name: str) -> str:
+    return os.path.join(base_path, SNAPSHOTS_DIR, f"{source_name}.latest.md")
+
+
+def load_index(base_path: str, source_name: str) -> List[Dict]:
+    """Snapshot entries for a source, oldest first"""
+    try:
+        with open(_index_path(base_path, source_name), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def reconstruct(base_path: str, source_name: str, date: str, index: Optional[List[Dict]] = None) -> Optional[str]:
+    """
+    Rebuild a source's document for a day
+
+    Starts from the last keyframe on or before `date` and applies the diffs
+    after it in order.
+
+    Args:
+        base_path: Archive base path
+        source_name: Source filename (without extension)
+        date: YYYYMMDD
+        index: Preloaded index (default: read from disk)
+
+    Returns:
+        Document text, or None if the source has no snapshot for that day
+
+    Raises:
+        ValueError: If no keyframe precedes the day (e.g. a pruned index)
+    """
+    entries = [entry for entry in (index or load_index(base_path, source_name)) if entry['date'] <= date]
+    if not entries or entries[-1]['date'] != date:
+        return None
+
+    keyframes = [i for i, entry in enumerate(entries) if entry['kind'] == 'full']
+    if not keyframes:
+        raise ValueError(f"no full snapshot of '{source_name}' on or before {date} to rebuild from")
+    start = keyframes[-1]
+    text = None
+    for entry in entries[start:]:
+        path = os.path.join(base_path, entry['date'], entry['file'])
+        if entry['kind'] == 'full':
+            text = read_markdown(path)
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = apply_diff(text, f.read())
+    return text
+
+
+def save_snapshot(title, content, base_path, daily_folder, source_name, compression=None,
+                  keyframe_days=DEFAULT_KEYFRAME_DAYS):
+    """
+    Save today's document as a keyframe or as a diff against the last snapshot
+
+    Args:
+        title: Content title (unused, as in save_as_markdown)
+        content: The content to save
+        base_path: Archive base path
+        daily_folder: Full path to the daily folder (YYYYMMDD)
+        source_name: Source filename (without extension)
+        compression: Compression for keyframes ('none', 'gzip', 'zstd')
+        keyframe_days: Snapshots per keyframe (1 = always full)
+
+    Returns:
+        tuple: (success: bool, file_path: str)
+    """
+    try:
+        date = os.path.basename(os.path.normpath(daily_folder))
+        stored = load_index(base_path, source_name)
+        index = [entry for entry in stored if entry['date'] < date]
+        # Re-saving or back-filling a day: the next later diff was made against
+        # the old base, so rebuild its text now and re-diff it afterwards
+        later = [entry for entry in stored if entry['date'] > date]
+        next_text = None
+        if later and later[0]['kind'] == 'diff':
+            next_text = reconstruct(base_path, source_name, later[0]['date'], stored)
+        document = _format_document(content)
+        digest = hashlib.sha256(document.encode('utf-8')).hexdigest()
+
+        since_keyframe, has_keyframe = 0, False
+        for entry in reversed(index):
+            if entry['kind'] == 'full':
+                has_keyframe = True
+                break
+            since_keyframe += 1
+
+        previous = None
+        if has_keyframe and since_keyframe + 1 < max(1, keyframe_days):
+            latest_path = _latest_path(base_path, source_name)
+            if os.path.exists(latest_path) and stored[-1]['date'] == index[-1]['date']:
+                with open(latest_path, 'r', encoding='utf-8') as f:
+                    previous = f.read()
+            else:  # Re-saved today (or back-filling a day): rebuild the day before
+                previous = reconstruct(base_path, source_name, index[-1]['date'], index)
+
+        diff_path = get_markdown_path(daily_folder, source_name) + DIFF_SUFFIX
+        if previous is None:
+            success, file_path = save_as_markdown(title, content, base_path, daily_folder, source_name, compression)
+            if not success:
+                return (False, file_path)
+            if os.path.exists(diff_path):
+                os.remove(diff_path)
+            kind = 'full'
+        else:
+            os.makedirs(daily_folder, exist_ok=True)
+            diff = make_diff(previous, document)
+            file_path = diff_path
+            _atomic_write_text(file_path, diff)
+            plain_path = get_markdown_path(daily_folder, source_name, 'none')
+            for stale in (plain_path + suffix for suffix in COMPRESSION_SUFFIXES.values()):
+                if os.path.exists(stale):
+                    os.remove(stale)
+            _record_manifest(daily_folder, source_name, file_path, digest, len(diff.encode('utf-8')), False)
+            _index_for_search(base_path, daily_folder, source_name, file_path, digest, document)
+            kind = 'diff'
+
+        index.append({'date': date, 'kind': kind, 'file': os.path.basename(file_path), 'hash': digest})
+        if next_text is not None:
+            next_folder = os.path.join(base_path, later[0]['date'])
+            next_path = os.path.join(next_folder, later[0]['file'])
+            next_diff = make_diff(document, next_text)
+            _atomic_write_text(next_path, next_diff)
+            _record_manifest(next_folder, source_name, next_path, later[0]['hash'],
+                             len(next_diff.encode('utf-8')), False)
+        os.makedirs(os.path.join(base_path, SNAPSHOTS_DIR), exist_ok=True)
+        if not later:
+            _atomic_write_text(_latest_path(base_path, source_name), document)
+        _atomic_write_text(_index_path(base_path, source_name), json.dumps(index + later, indent=2))
+        return (True, file_path)
+    except Exception as e:
+        return (False, str(e))
+
+
+def diff_stats(diff: str) -> Dict[str, int]:
+    """Added / removed line counts of a diff"""
+    added = removed = 0
+    for line in _hunk_lines(diff):
+        if line.startswith('+'):
+            added += 1
+        elif line.startswith('-'):
+            removed += 1
+    return {'added': added, 'removed': removed}
+
+
+def changes_for_day(base_path: str, date: str) -> List[Dict]:
+    """
+    What changed on a day, per source
+
+    Returns:
+        [{'source', 'kind', 'added', 'removed'}] for every source with a
+        snapshot that day ('full' entries are keyframes or first snapshots)
+    """
+    snapshots_dir = os.path.join(base_path, SNAPSHOTS_DIR)
+    if not os.path.isdir(snapshots_dir):
+        return []
+    report = []
+    for name in sorted(os.listdir(snapshots_dir)):
+        if not name.endswith('.json'):
+            continue
+        source_name = name[:-len('.json')]
+        for entry in load_index(base_path, source_name):
+            if entry['date'] != date:
+                continue
+            item = {'source': source_name, 'kind': entry['kind'], 'added': 0, 'removed': 0}
+            if entry['kind'] == 'diff':
+                with open(os.path.join(base_path, date, entry['file']), 'r', encoding='utf-8') as f:
+                    item.update(diff_stats(f.read()))
+            report.append(item)
+    return report
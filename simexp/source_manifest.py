@@ -0,0 +1,227 @@
+"""
+SimExp Source Manifest
+Scheduling for large extraction source lists
+
+Sources are declared in ~/.simexp/sources.yaml (or the file named by
+SOURCE_MANIFEST in simexp.yaml):
+
+    defaults:
+      interval: 1d          # refresh interval: seconds or 30m / 6h / 1d / 1w
+      priority: 0           # higher is fetched first
+    hosts:
+      app.simplenote.com:
+        rate: 2             # requests per second to this host
+    sources:
+      - url: https://app.simplenote.com/p/0ZqWsQ
+        filename: aureon
+        interval: 6h
+        priority: 10
+
+Without a manifest, SOURCES from simexp.yaml are scheduled with the
+defaults. Fetch outcomes are kept in ~/.simexp/sources.db (SQLite, one row
+per URL), so `simexp extract --due` only fetches sources whose interval has
+elapsed since their last success, highest priority and most overdue first.
+
+♠️🌿🎸🧵 G.Music Assembly - Source Scheduling
+"""
+
+import os
+import re
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Optional, Dict, List
+
+SOURCE_MANIFEST = os.path.expanduser('~/.simexp/sources.yaml')
+SOURCE_STATE_DB = os.path.expanduser('~/.simexp/sources.db')
+
+DEFAULT_INTERVAL = 24 * 3600
+DEFAULT_PRIORITY = 0
+# First retry after a failure; doubles per consecutive failure, capped at the interval
+FAILURE_BACKOFF = 300
+
+_INTERVAL_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+
+def parse_interval(value, default: int = DEFAULT_INTERVAL) -> int:
+    """
+    Parse a refresh interval
+
+    Args:
+        value: Seconds (int) or a string like '90s', '30m', '6h', '1d', '2w'
+        default: Returned for missing or invalid values
+
+    Returns:
+        Interval in seconds
+    """
+    if value is None:
+        return default
+    if isinstance(value, (int, float)) and value > 0:
+        return int(value)
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*', str(value).lower())
+    if not match:
+        print(f"⚠️ Warning: Ignoring invalid interval: {value}")
+        return default
+    return int(float(match.group(1)) * _INTERVAL_UNITS[match.group(2) or 's'])
+
+
+def load_manifest(path: Optional[str] = None, fallback_sources: Optional[List[Dict]] = None) -> Dict:
+    """
+    Load and normalize the source manifest
+
+    Args:
+        path: Manifest file (default: SOURCE_MANIFEST)
+        fallback_sources: SOURCES from simexp.yaml, used when no manifest exists
+
+    Returns:
+        {'sources': [source dicts with 'interval' (s) and 'priority'],
+         'host_rates': {host: requests per second}}
+    """
+    import yaml
+
+    path = path or SOURCE_MANIFEST
+    data = {}
+    if os.path.exists(path):
+        try:
+            with open(path, 'r') as f:
+                data = yaml.safe_load(f) or {}
+        except (OSError, yaml.YAMLError) as e:
+            print(f"⚠️ Warning: Could not read source manifest {path}: {e}")
+    if not isinstance(data, dict):
+        data = {}
+
+    defaults = data.get('defaults') or {}
+    default_interval = parse_interval(defaults.get('interval'))
+    default_priority = defaults.get('priority', DEFAULT_PRIORITY)
+
+    sources = []
+    raw_sources = data['sources'] if 'sources' in data else (fallback_sources or [])
+    for entry in raw_sources or []:
+        if not isinstance(entry, dict) or not entry.get('url'):
+            continue
+        source = dict(entry)
+        source['interval'] = parse_interval(entry.get('interval'), default_interval)
+        try:
+            source['priority'] = int(entry.get('priority', default_priority))
+        except (TypeError, ValueError):
+            source['priority'] = DEFAULT_PRIORITY
+        sources.append(source)
+
+    host_rates = {}
+    for host, settings in (data.get('hosts') or {}).items():
+        try:
+            rate = float((settings or {}).get('rate', 0))
+        except (TypeError, ValueError, AttributeError):
+            rate = 0
+        if rate > 0:
+            host_rates[str(host).lower()] = rate
+
+    return {'sources': sources, 'host_rates': host_rates}
+
+
+class SourceState:
+    """
+    Last fetch outcome per source URL, in SQLite
+
+    Args:
+        path: Database file (default: SOURCE_STATE_DB)
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or SOURCE_STATE_DB
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS source_state ('
+            'url TEXT PRIMARY KEY, last_attempt TEXT, last_success TEXT, '
+            'failures INTEGER DEFAULT 0, last_error TEXT)'
+        )
+        return conn
+
+    def load(self) -> Dict[str, Dict]:
+        """All recorded sources: url -> {'last_attempt', 'last_success', 'failures', 'last_error'}"""
+        if not os.path.exists(self.path):
+            return {}
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                'SELECT url, last_attempt, last_success, failures, last_error FROM source_state'
+            ).fetchall()
+        finally:
+            conn.close()
+        return {
+            url: {'last_attempt': attempt, 'last_success': success, 'failures': failures, 'last_error': error}
+            for url, attempt, success, failures, error in rows
+        }
+
+    def record(self, outcomes: List[Dict], when: Optional[datetime] = None) -> None:
+        """
+        Store the outcome of a run in one transaction
+
+        Args:
+            outcomes: Dicts with 'url', 'success' and optional 'error'
+            when: Time of the run (default: now)
+        """
+        stamp = (when or datetime.now()).isoformat(timespec='seconds')
+        conn = self._connect()
+        try:
+            with conn:
+                for outcome in outcomes:
+                    if outcome['success']:
+                        conn.execute(
+                            'INSERT INTO source_state (url, last_attempt, last_success, failures, last_error) '
+                            'VALUES (?, ?, ?, 0, NULL) ON CONFLICT(url) DO UPDATE SET '
+                            'last_attempt = excluded.last_attempt, last_success = excluded.last_success, '
+                            'failures = 0, last_error = NULL',
+                            (outcome['url'], stamp, stamp)
+                        )
+                    else:
+                        conn.execute(
+                            'INSERT INTO source_state (url, last_attempt, failures, last_error) '
+                            'VALUES (?, ?, 1, ?) ON CONFLICT(url) DO UPDATE SET '
+                            'last_attempt = excluded.last_attempt, failures = failures + 1, '
+                            'last_error = excluded.last_error',
+                            (outcome['url'], stamp, outcome.get('error'))
+                        )
+        finally:
+            conn.close()
+
+
+def next_due(source: Dict, state: Optional[Dict]) -> Optional[datetime]:
+    """When a source is next due (None = never fetched successfully, due now)"""
+    if not state:
+        return None
+    candidates = []
+    if state.get('last_success'):
+        candidates.append(datetime.fromisoformat(state['last_success']) + timedelta(seconds=source['interval']))
+    if state.get('failures') and state.get('last_attempt'):
+        backoff = min(FAILURE_BACKOFF * 2 ** (state['failures'] - 1), source['interval'])
+        candidates.append(datetime.fromisoformat(state['last_attempt']) + timedelta(seconds=backoff))
+    return max(candidates) if candidates else None
+
+
+def due_sources(sources: List[Dict], states: Dict[str, Dict],
+                now: Optional[datetime] = None, limit: Optional[int] = None) -> List[Dict]:
+    """
+    Sources whose refresh interval has elapsed
+
+    Args:
+        sources: Normalized manifest sources
+        states: SourceState.load() result
+        now: Reference time (default: now)
+        limit: Fetch at most this many sources
+
+    Returns:
+        Due sources, highest priority first, then most overdue
+    """
+    now = now or datetime.now()
+    due = []
+    for source in sources:
+        when = next_due(source, states.get(source['url']))
+        if when is None or when <= now:
+            due.append((-source['priority'], when or datetime.min, source))
+    due.sort(key=lambda item: (item[0], item[1]))
+    selected = [source for _, _, source in due]
+    return selected[:limit] if limit else selected
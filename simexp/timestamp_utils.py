@@ -7,7 +7,6 @@ Issue #33: tlid Integration for temporal backbone
 """
 
 import os
-import yaml
 from datetime import datetime
 
 
@@ -109,6 +108,8 @@ def get_default_granularity():
     Returns:
         str: Default granularity ('s' if not configured)
     """
+    import yaml
+
     config_file = os.path.expanduser('~/.simexp/simexp.yaml')
 
     if os.path.exists(config_file):
@@ -0,0 +1,136 @@
+"""
+Test Suite for the Content-Addressed Archive
+
+Tests archiver's object store under BASE_PATH/.objects:
+- Identical content on different days is stored once and hardlinked
+- Changed content adds exactly one new object
+- Each daily folder records a manifest
+- The streaming writer shares objects with save_as_markdown()
+- Re-saving stored content writes no temp file, object or manifest
+
+♠️🌿🎸🧵 G.Music Assembly - Archive Dedupe
+"""
+
+import os
+import tempfile
+
+from simexp import archiver
+from simexp.archiver import (
+    save_as_markdown, MarkdownStreamWriter, read_manifest, get_objects_dir
+)
+
+
+def _objects(base_path):
+    return sorted(name for name in os.listdir(get_objects_dir(base_path)) if '.tmp.' not in name)
+
+
+def test_unchanged_content_is_linked():
+    """Re-saving identical content reuses the stored object"""
+    print("\n" + "=" * 70)
+    print("TEST 1: Identical content stored once")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as base:
+        day1, day2 = os.path.join(base, '20250101'), os.path.join(base, '20250102')
+        ok, first = save_as_markdown('T', "# Note\n\nBody", base, day1, 'aureon')
+        assert ok
+        ok, second = save_as_markdown('T', "# Note\n\nBody", base, day2, 'aureon')
+        assert ok
+
+        assert len(_objects(base)) == 1
+        assert os.path.samefile(first, second)
+        with open(second, encoding='utf-8') as f:
+            assert f.read() == "# Note\n\nBody\n\n"
+        print("✅ Second day hardlinked to the same object")
+
+        assert read_manifest(day1)['aureon']['reused'] is False
+        entry = read_manifest(day2)['aureon']
+        assert entry['reused'] is True and entry['file'] == os.path.basename(second)
+        assert entry['hash'] == _objects(base)[0]
+        print("✅ Manifests record hash and reuse")
+
+        ok, third = save_as_markdown('T', "# Note\n\nBody v2", base, day2, 'aureon')
+        assert ok and third == second
+        assert len(_objects(base)) == 2
+        assert not os.path.samefile(first, third)
+        with open(first, encoding='utf-8') as f:
+            assert 'v2' not in f.read()
+        print("✅ Changed content adds one object, earlier days untouched")
+
+
+def test_stream_writer_shares_objects():
+    """Streamed output dedupes against save_as_markdown() and discards cleanly"""
+    print("\n" + "=" * 70)
+    print("TEST 2: Streaming writer uses the store")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as base:
+        day1, day2 = os.path.join(base, '20250101'), os.path.join(base, '20250102')
+        save_as_markdown('T', "# Note\nline", base, day1, 'aureon')
+
+        with MarkdownStreamWriter(day2, 'aureon') as writer:
+            writer.write_line("")
+            writer.write_line("# Note")
+            writer.write_line("line")
+        assert writer.reused
+        assert len(_objects(base)) == 1
+        assert read_manifest(day2)['aureon']['reused'] is True
+        print("✅ Streamed copy linked to the existing object")
+
+        with MarkdownStreamWriter(day2, 'other') as writer:
+            writer.write_line("partial")
+            writer.discard()
+        assert not os.path.exists(writer.file_path)
+        assert 'other' not in read_manifest(day2)
+        assert os.listdir(get_objects_dir(base)) == _objects(base)
+        print("✅ Discarded streams leave nothing behind")
+
+
+def test_stored_content_is_not_rewritten():
+    """save_as_markdown() short-circuits on the content hash"""
+    print("\n" + "=" * 70)
+    print("TEST 3: Unchanged content costs no writes")
+    print("=" * 70)
+
+    opened = []
+    original_open = archiver._open_compressed
+
+    def counting_open(path, mode, compression):
+        if 'w' in mode:
+            opened.append(path)
+        return original_open(path, mode, compression)
+
+    with tempfile.TemporaryDirectory() as base:
+        day1, day2 = os.path.join(base, '20250101'), os.path.join(base, '20250102')
+        archiver._open_compressed = counting_open
+        try:
+            for compression in ('none', 'gzip'):
+                ok, path = save_as_markdown('T', "# Note\n\nBody", base, day1, 'aureon', compression)
+                assert ok and len(opened) == 1
+                manifest_stat = os.stat(os.path.join(day1, 'manifest.json'))
+
+                ok, again = save_as_markdown('T', "# Note\n\nBody", base, day1, 'aureon', compression)
+                assert ok and again == path and len(opened) == 1
+                assert os.stat(os.path.join(day1, 'manifest.json')).st_mtime_ns == manifest_stat.st_mtime_ns
+                opened.clear()
+            print("✅ Same day, same content: no temp file, object or manifest write")
+
+            ok, linked = save_as_markdown('T', "# Note\n\nBody", base, day2, 'aureon')
+            entry = read_manifest(day2)['aureon']
+            assert ok and opened == [] and entry['reused'] is True
+            assert os.path.samefile(linked, os.path.join(get_objects_dir(base), entry['hash']))
+            print("✅ New day, stored content: linked without rewriting the document")
+        finally:
+            archiver._open_compressed = original_open
+
+
+def main():
+    """Run all archive dedupe tests"""
+    test_unchanged_content_is_linked()
+    test_stream_writer_shares_objects()
+    test_stored_content_is_not_rewritten()
+    print("\n🎉 ALL ARCHIVE DEDUPE TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
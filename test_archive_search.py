@@ -0,0 +1,160 @@
+"""
+Test Suite for Archive Search
+
+Tests search_index.py and its hook in the archiver:
+- Saving a document indexes it; re-saving a day replaces the entry
+- Phrase queries, source and date filters, ranked snippets
+- Queries that are not valid FTS5 syntax still work
+- Change-only snapshots and --reindex of older archives are searchable
+- --reindex covers daily folders written before manifests existed
+- A year of daily archives is searched in milliseconds
+
+♠️🌿🎸🧵 G.Music Assembly - Archive Search
+"""
+
+import os
+import time
+import tempfile
+
+from simexp.archiver import save_as_markdown
+from simexp.snapshots import save_snapshot
+from simexp.search_index import search, reindex, get_search_db, close_connections
+
+
+def _save(tmp, date, source, text):
+    ok, path = save_as_markdown("t", text, tmp, os.path.join(tmp, date), source)
+    assert ok, path
+    return path
+
+
+def test_index_and_query():
+    """Saved documents are found with phrases and filters"""
+    print("\n" + "=" * 70)
+    print("TEST 1: Indexing on save and querying")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _save(tmp, '20250101', 'aureon', "The river runs north.\n\nMorning notes about the garden.")
+        _save(tmp, '20250102', 'aureon', "The north river froze.\n\nNothing about gardens today.")
+        _save(tmp, '20250102', 'journal', "Gardening plans: tomatoes and the river bed.")
+        path = _save(tmp, '20250103', 'journal', "An unrelated entry about C++ and e-mail.")
+
+        hits = search(tmp, 'river')
+        assert {(hit['date'], hit['source']) for hit in hits} == {
+            ('20250101', 'aureon'), ('20250102', 'aureon'), ('20250102', 'journal')}
+        assert all('[river]' in hit['snippet'] for hit in hits)
+        print(f"✅ 3 hits for 'river', snippets highlighted")
+
+        assert [hit['date'] for hit in search(tmp, '"river runs north"')] == ['20250101']
+        assert [hit['date'] for hit in search(tmp, 'river', source='aureon', since='20250102')] == ['20250102']
+        assert [hit['source'] for hit in search(tmp, 'river', until='20250101')] == ['aureon']
+        assert len(search(tmp, 'garden')) == 3  # porter stemming: gardens, gardening
+        print("✅ Phrase, source, date and stemmed queries")
+
+        assert [hit['path'] for hit in search(tmp, 'C++ e-mail')] == [path]
+        assert search(tmp, '') == [] and search(tmp, 'absent') == []
+        print("✅ Free-text fallback for queries that are not FTS5 syntax")
+
+        _save(tmp, '20250101', 'aureon', "Rewritten: only mountains now.")
+        assert [hit['date'] for hit in search(tmp, 'river', source='aureon')] == ['20250102']
+        assert [hit['date'] for hit in search(tmp, 'mountains')] == ['20250101']
+        print("✅ Re-saving a day replaces its indexed version")
+        close_connections()
+
+
+def test_snapshots_and_reindex():
+    """Diff snapshots are indexed with their full text; --reindex rebuilds"""
+    print("\n" + "=" * 70)
+    print("TEST 2: Snapshots and reindex")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        save_snapshot("t", "Day one: seeds planted.", tmp, os.path.join(tmp, '20250101'), 'log')
+        ok, diff_path = save_snapshot("t", "Day one: seeds planted.\n\nDay two: sprouts.",
+                                      tmp, os.path.join(tmp, '20250102'), 'log')
+        assert ok and diff_path.endswith('.md.diff')
+        assert sorted(hit['date'] for hit in search(tmp, 'seeds')) == ['20250101', '20250102']
+        assert [hit['path'] for hit in search(tmp, 'sprouts')] == [diff_path]
+        print("✅ Diff snapshots searchable by their full text")
+
+        close_connections()
+        os.remove(get_search_db(tmp))
+        assert search(tmp, 'seeds') == []
+        assert reindex(tmp) == 2
+        assert len(search(tmp, 'seeds')) == 2
+        assert reindex(tmp) == 0
+        print("✅ Reindex rebuilds the index; a second pass skips unchanged documents")
+        close_connections()
+
+
+def test_reindex_legacy_folders():
+    """Daily folders written before manifests existed are indexed too"""
+    print("\n" + "=" * 70)
+    print("TEST 3: Reindex of manifest-less archives")
+    print("=" * 70)
+
+    import gzip
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = os.path.join(tmp, '20240101')
+        os.makedirs(legacy)
+        with open(os.path.join(legacy, '20240101_aureon.md'), 'w', encoding='utf-8') as f:
+            f.write("A legacy note about lanterns.\n\n")
+        with gzip.open(os.path.join(legacy, '20240101_river.md.gz'), 'wt', encoding='utf-8') as f:
+            f.write("Compressed legacy lanterns.\n\n")
+        with open(os.path.join(legacy, 'notes.txt'), 'w') as f:
+            f.write("legacy lanterns, not an archive")
+        _save(tmp, '20240102', 'aureon', "A managed note about lanterns.")
+
+        close_connections()
+        os.remove(get_search_db(tmp))
+        assert reindex(tmp) == 3
+        hits = search(tmp, 'legacy')
+        assert sorted((hit['date'], hit['source']) for hit in hits) == [('20240101', 'aureon'), ('20240101', 'river')]
+        assert len(search(tmp, 'lanterns')) == 3
+        print("✅ Legacy .md and .md.gz files indexed under the source from their filename")
+        close_connections()
+
+
+def test_query_speed():
+    """A year of archives answers in milliseconds"""
+    print("\n" + "=" * 70)
+    print("TEST 4: Query latency over 365 days x 3 sources")
+    print("=" * 70)
+
+    words = "alpha beta gamma delta epsilon zeta eta theta iota kappa lambda".split()
+    with tempfile.TemporaryDirectory() as tmp:
+        for day in range(365):
+            date = f"{2024 + day // 360}{(day // 30) % 12 + 1:02d}{day % 30 + 1:02d}"
+            for source in ('a', 'b', 'c'):
+                body = '\n\n'.join(' '.join(words[(day + i + j) % len(words)] for j in range(12))
+                                   for i in range(40))
+                if day == 200 and source == 'b':
+                    body += "\n\nThe needle in the haystack."
+                _save(tmp, date, source, body)
+
+        started = time.perf_counter()
+        hits = search(tmp, '"needle in the haystack"')
+        elapsed = time.perf_counter() - started
+        assert len(hits) == 1 and hits[0]['source'] == 'b'
+        assert elapsed < 0.05, elapsed
+
+        started = time.perf_counter()
+        assert len(search(tmp, 'gamma', source='c', since='20240601', limit=5)) == 5
+        filtered = time.perf_counter() - started
+        assert filtered < 0.05, filtered
+        print(f"✅ Phrase query {elapsed * 1000:.1f} ms, filtered query {filtered * 1000:.1f} ms over 1,095 documents")
+        close_connections()
+
+
+def main():
+    """Run all archive search tests"""
+    test_index_and_query()
+    test_snapshots_and_reindex()
+    test_reindex_legacy_folders()
+    test_query_speed()
+    print("\n🎉 ALL ARCHIVE SEARCH TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
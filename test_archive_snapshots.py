@@ -0,0 +1,182 @@
+"""
+Test Suite for Change-Only Snapshots
+
+Tests snapshots.py and ARCHIVE_MODE: diff:
+- Diffs round-trip, including lines that look like diff headers
+- The first snapshot and every Nth are full keyframes, the rest diffs
+- Every day reconstructs exactly, also through read_markdown()
+- Re-saving a day replaces its snapshot instead of stacking diffs
+- Back-filling a day keeps later snapshots intact; a missing keyframe is reported
+- changes_for_day() reports per-source added / removed lines
+- Diff archives take far less space than full copies
+
+♠️🌿🎸🧵 G.Music Assembly - Change-Only Archive
+"""
+
+import os
+import json
+import tempfile
+
+from simexp import simex
+from simexp.archiver import read_markdown, find_markdown_path, read_manifest
+from simexp.snapshots import (
+    make_diff, apply_diff, save_snapshot, load_index, reconstruct, changes_for_day, _format_document
+)
+
+
+def _note(day):
+    """A long note where a couple of paragraphs change each day"""
+    paragraphs = [f"Paragraph {i}: the steady part of the note." for i in range(200)]
+    paragraphs[day % 200] = f"Paragraph {day % 200}: edited on day {day}."
+    paragraphs.append(f"--- entry for day {day}")
+    return '\n\n'.join(paragraphs)
+
+
+def test_diff_round_trip():
+    """apply_diff(old, make_diff(old, new)) == new"""
+    print("\n" + "=" * 70)
+    print("TEST 1: Diff round trip")
+    print("=" * 70)
+
+    cases = [
+        ("", "first\nsecond\n"),
+        ("a\nb\nc\n", "a\nc\n"),
+        ("a\nb\nc\n", "x\na\nb\nc\ny\n"),
+        ("--- a\n+++ b\n@@ -1 +1 @@\n", "--- b\n+++ a\n"),
+        (_format_document(_note(1)), _format_document(_note(2))),
+        ("same\n", "same\n"),
+    ]
+    for old, new in cases:
+        assert apply_diff(old, make_diff(old, new)) == new, (old, new)
+    try:
+        apply_diff("other\n", make_diff("a\nb\n", "a\n"))
+        assert False, "mismatched diff applied"
+    except ValueError:
+        pass
+    print(f"✅ {len(cases)} round trips, mismatched diffs rejected")
+
+
+def test_snapshots_over_days():
+    """Keyframe cadence, reconstruction, same-day re-save and change report"""
+    print("\n" + "=" * 70)
+    print("TEST 2: Ten days of snapshots")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        days = [f"202501{day:02d}" for day in range(1, 11)]
+        paths = []
+        for number, date in enumerate(days, start=1):
+            ok, path = save_snapshot("t", _note(number), tmp, os.path.join(tmp, date), 'journal', keyframe_days=4)
+            assert ok, path
+            paths.append(path)
+
+        kinds = [entry['kind'] for entry in load_index(tmp, 'journal')]
+        assert kinds == ['full', 'diff', 'diff', 'diff', 'full', 'diff', 'diff', 'diff', 'full', 'diff'], kinds
+        print("✅ Keyframe every 4 snapshots")
+
+        for number, (date, path) in enumerate(zip(days, paths), start=1):
+            expected = _format_document(_note(number))
+            assert reconstruct(tmp, 'journal', date) == expected
+            assert read_markdown(path) == expected
+        assert reconstruct(tmp, 'journal', '20241231') is None
+        print("✅ Every day reconstructs exactly (also via read_markdown)")
+
+        manifest = read_manifest(os.path.join(tmp, days[1]))
+        assert find_markdown_path(os.path.join(tmp, days[1]), 'journal') == paths[1]
+        assert manifest['journal']['file'] == os.path.basename(paths[1])
+
+        ok, path = save_snapshot("t", _note(99), tmp, os.path.join(tmp, days[-1]), 'journal', keyframe_days=4)
+        assert ok and len(load_index(tmp, 'journal')) == len(days)
+        assert reconstruct(tmp, 'journal', days[-1]) == _format_document(_note(99))
+        assert reconstruct(tmp, 'journal', days[-2]) == _format_document(_note(9))
+        print("✅ Re-saving a day replaces its snapshot")
+
+        ok, _ = save_snapshot("t", "Only note", tmp, os.path.join(tmp, days[-1]), 'other')
+        report = {item['source']: item for item in changes_for_day(tmp, days[-1])}
+        assert report['other']['kind'] == 'full'
+        assert report['journal']['kind'] == 'diff'
+        assert report['journal']['added'] == 5 and report['journal']['removed'] == 5
+        assert changes_for_day(tmp, '20200101') == []
+        print("✅ Daily change report: +5 / -5 for journal, other is new")
+
+
+def test_diff_mode_saves_space():
+    """Diff snapshots use a fraction of the space of full copies"""
+    print("\n" + "=" * 70)
+    print("TEST 3: Disk usage")
+    print("=" * 70)
+
+    def archived_bytes(root):
+        total = 0
+        for folder, dirs, files in os.walk(root):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            total += sum(os.path.getsize(os.path.join(folder, name)) for name in files if not name.startswith('.'))
+        return total
+
+    with tempfile.TemporaryDirectory() as full, tempfile.TemporaryDirectory() as diff:
+        for number in range(1, 8):
+            date = f"202502{number:02d}"
+            simex.save_as_markdown("t", _note(number), full, os.path.join(full, date), 'journal')
+            save_snapshot("t", _note(number), diff, os.path.join(diff, date), 'journal')
+        full_size, diff_size = archived_bytes(full), archived_bytes(diff)
+        assert diff_size * 4 < full_size, (diff_size, full_size)
+    print(f"✅ 7 days: {diff_size:,} bytes as diffs vs {full_size:,} bytes in full")
+
+
+def test_back_fill_and_missing_keyframe():
+    """Inserting or re-saving an earlier day re-diffs the next day"""
+    print("\n" + "=" * 70)
+    print("TEST 4: Back-filling and pruned indexes")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for number, date in ((1, '20260101'), (3, '20260103'), (4, '20260104'), (2, '20260102')):
+            ok, path = save_snapshot("t", _note(number), tmp, os.path.join(tmp, date), 'log')
+            assert ok, path
+        index = load_index(tmp, 'log')
+        assert [entry['date'] for entry in index] == ['20260101', '20260102', '20260103', '20260104']
+        assert [entry['kind'] for entry in index] == ['full', 'diff', 'diff', 'diff']
+        for number, date in enumerate(['20260101', '20260102', '20260103', '20260104'], start=1):
+            assert reconstruct(tmp, 'log', date) == _format_document(_note(number)), date
+        print("✅ Back-filled day inserted; later days still reconstruct")
+
+        ok, _ = save_snapshot("t", _note(50), tmp, os.path.join(tmp, '20260102'), 'log')
+        assert reconstruct(tmp, 'log', '20260102') == _format_document(_note(50))
+        assert reconstruct(tmp, 'log', '20260103') == _format_document(_note(3))
+        assert read_manifest(os.path.join(tmp, '20260103'))['log']['hash'] == index[2]['hash']
+        print("✅ Re-saving an earlier day keeps the next day intact")
+
+        # Lose the keyframe from a hand-pruned index
+        pruned = load_index(tmp, 'log')[1:]
+        with open(os.path.join(tmp, '.snapshots', 'log.json'), 'w') as f:
+            f.write(json.dumps(pruned))
+        try:
+            reconstruct(tmp, 'log', '20260103')
+            assert False, "expected ValueError"
+        except ValueError as e:
+            assert 'no full snapshot' in str(e)
+        original_config = simex.CONFIG_FILE
+        try:
+            simex.CONFIG_FILE = os.path.join(tmp, 'simexp.yaml')
+            with open(simex.CONFIG_FILE, 'w') as f:
+                f.write(f"BASE_PATH: {tmp}\n")
+            assert simex.archive_show_command('log', '20260103') is None
+        finally:
+            simex.CONFIG_FILE = original_config
+        ok, _ = save_snapshot("t", _note(5), tmp, os.path.join(tmp, '20260105'), 'log')
+        assert ok and load_index(tmp, 'log')[-1]['kind'] == 'full'
+        assert reconstruct(tmp, 'log', '20260105') == _format_document(_note(5))
+        print("✅ Missing keyframe: clear error, next snapshot starts a new keyframe")
+
+
+def main():
+    """Run all snapshot tests"""
+    test_diff_round_trip()
+    test_snapshots_over_days()
+    test_diff_mode_saves_space()
+    test_back_fill_and_missing_keyframe()
+    print("\n🎉 ALL SNAPSHOT TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Test Suite for Archive Writes
+
+Tests archiver's streaming writes:
+- save_as_markdown() output matches the original paragraph layout
+- Writes are atomic: a failure mid-document keeps the previous file
+- .md.gz archives round-trip through read_markdown()
+- Switching format replaces today's file instead of duplicating it
+
+♠️🌿🎸🧵 G.Music Assembly - Archive Writes
+"""
+
+import os
+import gzip
+import tempfile
+
+from simexp import archiver
+from simexp.archiver import (
+    save_as_markdown, MarkdownStreamWriter, read_markdown, find_markdown_path,
+    get_objects_dir, resolve_compression
+)
+
+
+def _legacy_format(content):
+    formatted_content = ""
+    for paragraph in content.split('\n\n'):
+        formatted_content += f"{paragraph}\n\n"
+    return formatted_content
+
+
+def test_layout_unchanged():
+    """Streaming paragraphs gives the same bytes as the old concatenation"""
+    print("\n" + "=" * 70)
+    print("TEST 1: Paragraph layout")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as base:
+        day = os.path.join(base, '20250101')
+        for i, content in enumerate(["", "one", "a\n\nb", "a\n\n", "\n\n\n\nx\ny\n\n\nz"]):
+            ok, path = save_as_markdown('T', content, base, day, f"s{i}")
+            assert ok
+            with open(path, encoding='utf-8') as f:
+                assert f.read() == _legacy_format(content), repr(content)
+    print("✅ Identical output for edge-case documents")
+
+
+def test_atomic_on_failure():
+    """A write interrupted mid-document leaves the old file and no temp files"""
+    print("\n" + "=" * 70)
+    print("TEST 2: Atomic replacement")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as base:
+        day = os.path.join(base, '20250101')
+        ok, path = save_as_markdown('T', "old content", base, day, 'aureon')
+        assert ok
+
+        try:
+            with MarkdownStreamWriter(day, 'aureon', base) as writer:
+                writer.write_line("new content")
+                raise KeyboardInterrupt
+        except KeyboardInterrupt:
+            pass
+
+        assert read_markdown(path) == "old content\n\n"
+        assert not [name for name in os.listdir(get_objects_dir(base)) if '.tmp.' in name]
+        assert not [name for name in os.listdir(day) if '.tmp.' in name]
+        print("✅ Previous file intact, temp file removed")
+
+
+def test_gzip_round_trip():
+    """Compressed archives are read back transparently"""
+    print("\n" + "=" * 70)
+    print("TEST 3: Compressed archives")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as base:
+        day = os.path.join(base, '20250101')
+        content = "# Title\n\n" + "\n\n".join(f"Paragraph {i} é" for i in range(2000))
+        ok, plain = save_as_markdown('T', content, base, day, 'aureon')
+        assert ok and plain.endswith('.md')
+
+        ok, packed = save_as_markdown('T', content, base, day, 'aureon', compression='gzip')
+        assert ok and packed.endswith('.md.gz')
+        assert not os.path.exists(plain)
+        assert find_markdown_path(day, 'aureon') == packed
+        assert os.path.getsize(packed) < len(content) / 5
+        with gzip.open(packed, 'rb') as f:
+            assert f.read().decode('utf-8') == _legacy_format(content)
+        assert read_markdown(packed) == _legacy_format(content)
+        print(f"✅ .md.gz is {os.path.getsize(packed):,} bytes for {len(content):,} characters")
+
+        with MarkdownStreamWriter(day, 'streamed', base, 'gzip') as writer:
+            writer.write_line("line é")
+        assert read_markdown(writer.file_path) == "line é\n\n"
+        print("✅ Streaming writer compresses too")
+
+        if archiver.zstandard is None:
+            assert resolve_compression('zstd') == 'gzip'
+            print("✅ zstd falls back to gzip without zstandard")
+        else:
+            ok, zst = save_as_markdown('T', content, base, day, 'aureon', compression='zstd')
+            assert ok and zst.endswith('.md.zst') and read_markdown(zst) == _legacy_format(content)
+            print("✅ .md.zst round-trips")
+
+
+def main():
+    """Run all archive write tests"""
+    test_layout_unchanged()
+    test_atomic_on_failure()
+    test_gzip_round_trip()
+    print("\n🎉 ALL ARCHIVE WRITE TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
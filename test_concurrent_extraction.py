@@ -0,0 +1,128 @@
+"""
+Test Suite for Concurrent Source Extraction
+
+Tests bounded-parallel fetching against a local HTTP server:
+- fetch_all_content() respects the per-host cap and runs hosts in parallel
+- run_extraction() overlaps sources and reports per-source timings
+
+♠️🌿🎸🧵 G.Music Assembly - Concurrent Extraction
+"""
+
+import os
+import time
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import yaml
+
+from simexp import simex
+from simexp.simfetcher import fetch_all_content
+
+DELAY = 0.3
+PAGE = (
+    "<html><head><title>Page {name}</title></head><body><div><div><div><div>"
+    "<h1>Heading {name}</h1><p>Paragraph for {name}</p>"
+    "</div></div></div></div></body></html>"
+)
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """Serves a small page after DELAY seconds, tracking concurrency"""
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        time.sleep(DELAY)
+        body = PAGE.format(name=self.path.strip('/')).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with cls.lock:
+            cls.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_server():
+    SlowHandler.active = 0
+    SlowHandler.max_active = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_fetch_all_content_per_host_cap():
+    """Six URLs on one host never exceed two concurrent requests"""
+    print("\n" + "=" * 70)
+    print("TEST 1: fetch_all_content() per-host cap")
+    print("=" * 70)
+
+    server = _start_server()
+    try:
+        base = f"http://127.0.0.1:{server.server_port}"
+        urls = [f"{base}/page{i}" for i in range(6)]
+
+        started = time.perf_counter()
+        content = fetch_all_content(urls, max_workers=8, per_host=2)
+        elapsed = time.perf_counter() - started
+
+        assert list(content) == urls
+        assert 'Heading page3' in content[urls[3]]
+        assert SlowHandler.max_active == 2, SlowHandler.max_active
+        assert elapsed < DELAY * 6 * 0.75, elapsed
+        print(f"✅ 6 pages in {elapsed:.2f}s with at most 2 in flight")
+    finally:
+        server.shutdown()
+
+
+def test_run_extraction_concurrent():
+    """Sources are extracted in parallel and timed individually"""
+    print("\n" + "=" * 70)
+    print("TEST 2: run_extraction() concurrency and timings")
+    print("=" * 70)
+
+    server = _start_server()
+    original_config = simex.CONFIG_FILE
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            simex.CONFIG_FILE = os.path.join(tmp, 'simexp.yaml')
+            with open(simex.CONFIG_FILE, 'w') as f:
+                yaml.safe_dump({'BASE_PATH': tmp, 'EXTRACT_PER_HOST': 4}, f)
+
+            base = f"http://127.0.0.1:{server.server_port}"
+            urls = [f"{base}/{name}" for name in ('aureon', 'nyro', 'jamai', 'synth')]
+
+            started = time.perf_counter()
+            results = simex.run_extraction(urls=urls)
+            elapsed = time.perf_counter() - started
+
+            assert [r['filename'] for _, r, _ in results] == ['aureon', 'nyro', 'jamai', 'synth']
+            assert all(r['success'] for _, r, _ in results)
+            assert all(r['fetch_seconds'] >= DELAY * 0.9 for _, r, _ in results)
+            with open(results[1][1]['path']) as f:
+                assert 'Heading nyro' in f.read()
+            assert elapsed < DELAY * 4 * 0.75, elapsed
+            print(f"✅ 4 sources archived in {elapsed:.2f}s (serial would be ≥{DELAY * 4:.1f}s)")
+    finally:
+        simex.CONFIG_FILE = original_config
+        server.shutdown()
+
+
+def main():
+    """Run all concurrent extraction tests"""
+    test_fetch_all_content_per_host_cap()
+    test_run_extraction_concurrent()
+    print("\n🎉 ALL CONCURRENT EXTRACTION TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
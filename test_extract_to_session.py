@@ -0,0 +1,140 @@
+"""
+Test Suite for Extract-to-Session
+
+Tests `simexp extract --to-session` selection and tracking:
+- append_session_actions() stores several files_added entries in one save
+- Only sources whose content the session note lacks are selected
+- Re-extracting unchanged content selects nothing; a changed page is picked up
+
+The browser write itself (handle_session_add_batch) needs Simplenote and
+is not exercised here.
+
+♠️🌿🎸🧵 G.Music Assembly - Extract-to-Session
+"""
+
+import os
+import tempfile
+import threading
+from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import yaml
+
+from simexp import simex
+from simexp.session_manager import (
+    initialize_four_directions_session,
+    append_session_actions,
+    SessionState,
+    get_active_session
+)
+
+PAGE = "<html><body><div><div><div><div><p>{text}</p></div></div></div></div></body></html>"
+
+
+class NoteHandler(BaseHTTPRequestHandler):
+    """Serves `texts[path]` in the Simplenote layout"""
+    texts = {}
+
+    def do_GET(self):
+        body = PAGE.format(text=type(self).texts.get(self.path, self.path)).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _track(entries):
+    """Record entries the way handle_session_add_batch() does after writing"""
+    append_session_actions('south', 'files_added', [
+        dict({'path': entry['path'], 'filename': os.path.basename(entry['path'])}, **entry['metadata'])
+        for entry in entries
+    ])
+
+
+def test_append_session_actions():
+    """Several actions are appended and counted in one save"""
+    print("\n" + "=" * 70)
+    print("TEST 1: append_session_actions()")
+    print("=" * 70)
+
+    original_cwd = os.getcwd()
+    for backend in ('json', 'sqlite'):
+        with tempfile.TemporaryDirectory() as tmp:
+            try:
+                os.chdir(tmp)
+                SessionState(backend=backend).save_session(initialize_four_directions_session({
+                    'session_id': f'batch-{backend}', 'created_at': datetime.now().isoformat()
+                }))
+                append_session_actions('south', 'files_added', [
+                    {'path': '/a.md', 'filename': 'a.md'},
+                    {'path': '/b.md', 'filename': 'b.md'},
+                    {'path': '/c.md', 'filename': 'c.md'},
+                ])
+                session = get_active_session()
+                assert [f['filename'] for f in session['south']['files_added']] == ['a.md', 'b.md', 'c.md']
+                assert all('timestamp' in f for f in session['south']['files_added'])
+                assert session['stats']['total_files'] == 3
+            finally:
+                os.chdir(original_cwd)
+        print(f"✅ 3 files tracked at once ({backend})")
+
+
+def test_new_and_changed_sources():
+    """Only sources with content the session has not seen are pushed"""
+    print("\n" + "=" * 70)
+    print("TEST 2: Selecting new/changed sources")
+    print("=" * 70)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), NoteHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f"http://127.0.0.1:{server.server_port}/note{i}" for i in range(3)]
+    NoteHandler.texts = {}
+
+    original_config = simex.CONFIG_FILE
+    original_cwd = os.getcwd()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            simex.CONFIG_FILE = os.path.join(tmp, 'simexp.yaml')
+            with open(simex.CONFIG_FILE, 'w') as f:
+                yaml.safe_dump({'BASE_PATH': tmp}, f)
+            SessionState(backend='json').save_session(initialize_four_directions_session({
+                'session_id': 'extract-push', 'created_at': datetime.now().isoformat()
+            }))
+
+            results = simex.run_extraction(urls=urls, force=True)
+            entries = simex._session_entries_for_results(results, get_active_session())
+            assert [entry['metadata']['source_url'] for entry in entries] == urls
+            assert all(entry['content'].startswith('/note') for entry in entries)
+            _track(entries)
+            print("✅ First extraction: every source is new")
+
+            results = simex.run_extraction(urls=urls, force=True)
+            assert simex._session_entries_for_results(results, get_active_session()) == []
+            print("✅ Unchanged content is not pushed again")
+
+            NoteHandler.texts = {'/note1': 'Edited note'}
+            results = simex.run_extraction(urls=urls, force=True)
+            entries = simex._session_entries_for_results(results, get_active_session())
+            assert [entry['metadata']['source_url'] for entry in entries] == [urls[1]]
+            assert 'Edited note' in entries[0]['content']
+            print("✅ Only the changed source is pushed")
+    finally:
+        os.chdir(original_cwd)
+        simex.CONFIG_FILE = original_config
+        server.shutdown()
+
+
+def main():
+    """Run all extract-to-session tests"""
+    test_append_session_actions()
+    test_new_and_changed_sources()
+    print("\n🎉 ALL EXTRACT-TO-SESSION TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
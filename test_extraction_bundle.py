@@ -0,0 +1,205 @@
+"""
+Test Suite for the Daily Extraction Bundle
+
+Tests bundle.py and run_extraction(bundle=...):
+- A JSON Lines bundle holds one row per source with hash, size and Markdown
+- Later runs merge into the day's bundle instead of replacing it
+- Sources answered with HTTP 304 keep their stored title
+- Streamed extraction fills in the title too
+- Arrow bundles are memory-mapped (skipped without pyarrow)
+- Without pyarrow, Arrow / Parquet requests fall back to JSON Lines
+
+♠️🌿🎸🧵 G.Music Assembly - Daily Bundle
+"""
+
+import os
+import hashlib
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import yaml
+
+from simexp import simex
+from simexp import bundle
+from simexp import simfetcher
+from simexp.archiver import read_markdown, read_manifest
+from simexp.bundle import resolve_bundle_format, load_bundle, find_bundle_path, BUNDLE_COLUMNS
+
+PAGE = "<html><head><title>T {path}</title></head><body><div><div><div><div><p>{text}</p></div></div></div></div></body></html>"
+
+
+class NoteHandler(BaseHTTPRequestHandler):
+    """Serves `texts[path]` (default: the path) in the Simplenote layout, with ETags"""
+    texts = {}
+
+    def do_GET(self):
+        body = PAGE.format(path=self.path, text=type(self).texts.get(self.path, f"Note at {self.path}")).encode('utf-8')
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _extract(urls, tmp, force=True, **kwargs):
+    """run_extraction() with BASE_PATH and the HTTP cache inside tmp"""
+    simex.CONFIG_FILE = os.path.join(tmp, 'simexp.yaml')
+    with open(simex.CONFIG_FILE, 'w') as f:
+        yaml.safe_dump({'BASE_PATH': tmp}, f)
+    original_cache = simfetcher.HTTP_CACHE_DIR
+    simfetcher.HTTP_CACHE_DIR = os.path.join(tmp, 'cache', 'http')
+    try:
+        return simex.run_extraction(urls=urls, force=force, **kwargs)
+    finally:
+        simfetcher.HTTP_CACHE_DIR = original_cache
+
+
+def test_jsonl_bundle():
+    """The bundle mirrors the archived files and merges across runs"""
+    print("\n" + "=" * 70)
+    print("TEST 1: JSON Lines bundle")
+    print("=" * 70)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), NoteHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f"http://127.0.0.1:{server.server_port}/note{i}" for i in range(4)]
+    NoteHandler.texts = {}
+
+    original_config = simex.CONFIG_FILE
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            results = _extract(urls[:3], tmp, bundle='jsonl')
+            daily_folder = os.path.dirname(results[0][1]['path'])
+            assert find_bundle_path(daily_folder).endswith('_bundle.jsonl')
+
+            rows = load_bundle(daily_folder)
+            manifest = read_manifest(daily_folder)
+            assert [row['url'] for row in rows] == urls[:3]
+            for (_, result, _), row in zip(results, rows):
+                assert set(row) == set(BUNDLE_COLUMNS)
+                markdown = read_markdown(result['path'])
+                assert row['markdown'] == markdown
+                assert row['content_hash'] == manifest[row['source']]['hash']
+                assert row['content_hash'] == hashlib.sha256(markdown.encode('utf-8')).hexdigest()
+                assert row['size_bytes'] == len(markdown.encode('utf-8'))
+                assert row['fetched_at'] and row['title'] == f"T {row['url'][-6:]}"
+            print("✅ One row per source with hash, size, fetch time and Markdown")
+
+            NoteHandler.texts = {'/note0': 'Edited'}
+            _extract([urls[0], urls[3]], tmp, bundle='jsonl')
+            rows = load_bundle(daily_folder)
+            assert [row['url'] for row in rows] == [urls[0], urls[1], urls[2], urls[3]]
+            assert 'Edited' in rows[0]['markdown']
+            print("✅ Second run merged: 1 row replaced, 1 added")
+
+            _extract([urls[1]], tmp)
+            assert len(load_bundle(daily_folder)) == 4
+            print("✅ No bundle written unless requested")
+    finally:
+        simex.CONFIG_FILE = original_config
+        server.shutdown()
+
+
+def test_unchanged_keeps_title():
+    """A second run answered with 304 leaves the stored rows intact"""
+    print("\n" + "=" * 70)
+    print("TEST 2: Unchanged sources on a second run")
+    print("=" * 70)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), NoteHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f"http://127.0.0.1:{server.server_port}/note{i}" for i in range(2)]
+    NoteHandler.texts = {}
+
+    original_config = simex.CONFIG_FILE
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            results = _extract(urls, tmp, force=False, bundle='jsonl')
+            daily_folder = os.path.dirname(results[0][1]['path'])
+            first = load_bundle(daily_folder)
+            assert all(row['title'] for row in first)
+
+            results = _extract(urls, tmp, force=False, bundle='jsonl')
+            assert all(result['unchanged'] and result['title'] is None for _, result, _ in results)
+            second = load_bundle(daily_folder)
+            assert [row['title'] for row in second] == [row['title'] for row in first]
+            assert [row['markdown'] for row in second] == [row['markdown'] for row in first]
+            print("✅ HTTP 304 sources keep their title and Markdown in the bundle")
+    finally:
+        simex.CONFIG_FILE = original_config
+        server.shutdown()
+
+
+def test_streamed_bundle():
+    """--stream --bundle rows carry the page title like non-streamed ones"""
+    print("\n" + "=" * 70)
+    print("TEST 3: Streamed extraction into a bundle")
+    print("=" * 70)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), NoteHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f"http://127.0.0.1:{server.server_port}/note{i}" for i in range(2)]
+    NoteHandler.texts = {}
+
+    original_config = simex.CONFIG_FILE
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            results = _extract(urls, tmp, stream=True, bundle='jsonl')
+            assert [result['title'] for _, result, _ in results] == ['T /note0', 'T /note1']
+            rows = load_bundle(os.path.dirname(results[0][1]['path']))
+            assert [row['title'] for row in rows] == ['T /note0', 'T /note1']
+            assert all('Note at /note' in row['markdown'] for row in rows)
+            print("✅ Streamed rows have the page title and Markdown")
+    finally:
+        simex.CONFIG_FILE = original_config
+        server.shutdown()
+
+
+def test_arrow_bundle():
+    """Arrow bundles load memory-mapped; without pyarrow they fall back"""
+    print("\n" + "=" * 70)
+    print("TEST 4: Arrow bundle")
+    print("=" * 70)
+
+    if bundle.pa is None:
+        assert resolve_bundle_format('arrow') == 'jsonl'
+        assert resolve_bundle_format('parquet') == 'jsonl'
+        assert resolve_bundle_format('auto') == 'jsonl'
+        assert resolve_bundle_format('none') is None and resolve_bundle_format(None) is None
+        print("⏭️  pyarrow not installed: Arrow / Parquet fall back to JSON Lines")
+        return
+
+    rows = [{'url': f'https://example.com/{i}', 'source': f's{i}', 'title': 't', 'content_hash': 'h',
+             'size_bytes': 3, 'fetched_at': '2025-01-01T00:00:00', 'markdown': 'abc'} for i in range(3)]
+    with tempfile.TemporaryDirectory() as tmp:
+        daily_folder = os.path.join(tmp, '20250101')
+        for bundle_format in ('arrow', 'parquet'):
+            bundle.write_bundle(daily_folder, rows, bundle_format)
+            assert load_bundle(daily_folder, bundle_format) == rows
+        table = bundle.open_bundle_table(bundle.get_bundle_path(daily_folder, 'arrow'))
+        assert table.num_rows == 3 and table.column('source').to_pylist() == ['s0', 's1', 's2']
+    print("✅ Arrow and Parquet bundles round-trip; Arrow opens memory-mapped")
+
+
+def main():
+    """Run all bundle tests"""
+    test_jsonl_bundle()
+    test_unchanged_keeps_title()
+    test_streamed_bundle()
+    test_arrow_bundle()
+    print("\n🎉 ALL BUNDLE TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
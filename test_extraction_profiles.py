@@ -0,0 +1,149 @@
+"""
+Test Suite for Per-Source Extraction Profiles
+
+Tests processor.ExtractionProfile and run_extraction() profile selection:
+- Custom content/title selectors, drop lists and tag mappings
+- Profile selectors may start at html / :root / head
+- Profiles are compiled once and served from the cache
+- Sources pick their profile by host; hit/miss stats are reported
+
+♠️🌿🎸🧵 G.Music Assembly - Extraction Profiles
+"""
+
+import os
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import yaml
+
+from simexp import simex
+from simexp.processor import (
+    ExtractionProfile, get_profile, process_content, profile_cache_stats, NO_CONTENT
+)
+
+BLOG_PAGE = """<html><head><title>Site name</title></head><body>
+<nav>Home | About</nav>
+<article><h1 class="post-title">Post title</h1><aside>Share!</aside>
+<h4>Details</h4><section>First section</section>
+<dl><dd>one</dd><dd>two</dd></dl><div class="ad">Buy now</div>
+<p>Closing <code>x</code></p></article></body></html>"""
+
+SIMPLENOTE_PAGE = """<html><head><title>Note</title></head><body>
+<div><div><div><div><p>Simplenote body</p></div></div></div></div></body></html>"""
+
+BLOG_SPEC = {
+    'hosts': ['localhost'],
+    'content_selector': 'article',
+    'title_selector': 'h1.post-title',
+    'drop': ['div.ad', 'h1.post-title'],
+    'markdown': {'h4': '####', 'section': 'p', 'dl': 'ul', 'dd': 'li', 'aside': 'drop'},
+}
+
+
+def test_profile_conversion():
+    """A profile changes selection, dropping and tag mapping"""
+    print("\n" + "=" * 70)
+    print("TEST 1: Profile-driven conversion")
+    print("=" * 70)
+
+    assert process_content(BLOG_PAGE)[1] == NO_CONTENT
+
+    title, content = process_content(BLOG_PAGE, profile=ExtractionProfile('blog', BLOG_SPEC))
+    assert title == 'Post title'
+    assert content == "#### Details\nFirst section\n- one\n- two\nClosing `x`", content
+    print("✅ Selectors, drop list and tag mapping applied")
+
+    # Profile selectors see the whole document, <html> and <head> included
+    page = BLOG_PAGE.replace('<head>', '<head><meta property="og:title" content="  OG title ">')
+    for selector in ('html > body > article', ':root > body article', 'article'):
+        spec = dict(BLOG_SPEC, content_selector=selector, title_selector='meta[property="og:title"]')
+        title, content = process_content(page.encode('utf-8'), 'utf-8', profile=ExtractionProfile('blog', spec))
+        assert title == 'OG title', (selector, title)
+        assert content.startswith('#### Details'), (selector, content)
+    spec = dict(BLOG_SPEC, title_selector='head > title')
+    assert process_content(page, profile=ExtractionProfile('blog', spec))[0] == 'Site name'
+    print("✅ html / :root / head selectors match; <meta> titles use their content")
+
+    for bad in ({'content_selector': 'div >> p'}, {'markdown': {'span': 'table'}}):
+        try:
+            ExtractionProfile('bad', bad)
+            assert False, bad
+        except ValueError:
+            pass
+    print("✅ Invalid profiles rejected")
+
+
+def test_profile_cache():
+    """Profiles compile once per spec and are reused"""
+    print("\n" + "=" * 70)
+    print("TEST 2: Compiled profile cache")
+    print("=" * 70)
+
+    compiled = profile_cache_stats['compiled']
+    first = get_profile('cache-test', dict(BLOG_SPEC))
+    assert get_profile('cache-test', dict(BLOG_SPEC)) is first
+    assert profile_cache_stats['compiled'] == compiled + 1
+
+    changed = get_profile('cache-test', dict(BLOG_SPEC, content_selector='body'))
+    assert changed is not first and profile_cache_stats['compiled'] == compiled + 2
+    print("✅ Reused until the spec changes")
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    """/blog serves BLOG_PAGE, anything else SIMPLENOTE_PAGE"""
+
+    def do_GET(self):
+        body = (BLOG_PAGE if self.path.startswith('/blog') else SIMPLENOTE_PAGE).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_run_extraction_profiles():
+    """Sources select profiles by host and stats count hits and misses"""
+    print("\n" + "=" * 70)
+    print("TEST 3: Profiles in run_extraction()")
+    print("=" * 70)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_port
+
+    original_config = simex.CONFIG_FILE
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            simex.CONFIG_FILE = os.path.join(tmp, 'simexp.yaml')
+            with open(simex.CONFIG_FILE, 'w') as f:
+                yaml.safe_dump({'BASE_PATH': tmp, 'EXTRACT_PROFILES': {'blog': BLOG_SPEC}}, f)
+
+            results = simex.run_extraction(urls=[
+                f"http://localhost:{port}/blog1",
+                f"http://localhost:{port}/blog2",
+                f"http://127.0.0.1:{port}/note",
+                f"http://127.0.0.1:{port}/blog3",
+            ], force=True)
+    finally:
+        simex.CONFIG_FILE = original_config
+        server.shutdown()
+
+    profiles = [(result['profile'], result['content_found']) for _, result, _ in results]
+    assert profiles == [('blog', True), ('blog', True), ('default', True), ('default', False)], profiles
+    print("✅ Host-matched sources use the blog profile; default misses counted")
+
+
+def main():
+    """Run all extraction profile tests"""
+    test_profile_conversion()
+    test_profile_cache()
+    test_run_extraction_profiles()
+    print("\n🎉 ALL EXTRACTION PROFILE TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Test Suite for Resumable Extraction
+
+Tests the daily-folder checkpoint and run_extraction(resume=True):
+- Finished sources are checkpointed with content hash and path
+- A resumed run only fetches what the interrupted run did not finish
+- A line cut short by the interruption is ignored
+- A fresh run over every recorded source starts a new checkpoint
+- A fresh run over a subset keeps the interrupted run resumable
+
+♠️🌿🎸🧵 G.Music Assembly - Resumable Extraction
+"""
+
+import os
+import json
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import yaml
+
+from simexp import simex
+from simexp.archiver import CHECKPOINT_FILE, read_manifest
+
+PAGE = "<html><body><div><div><div><div><p>Page {path}</p></div></div></div></div></body></html>"
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Paths in `broken` answer 404 (no retries); every hit is logged"""
+    broken = set()
+    hits = []
+
+    def do_GET(self):
+        cls = type(self)
+        cls.hits.append(self.path)
+        if self.path in cls.broken:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = PAGE.format(path=self.path).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_resume_skips_finished_sources():
+    """--resume fetches only the sources the first run did not finish"""
+    print("\n" + "=" * 70)
+    print("TEST 1: Checkpoint and resume")
+    print("=" * 70)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FlakyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f"http://127.0.0.1:{server.server_port}/page{i}" for i in range(6)]
+    FlakyHandler.broken = {'/page3', '/page4', '/page5'}
+    FlakyHandler.hits = []
+
+    original_config = simex.CONFIG_FILE
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            simex.CONFIG_FILE = os.path.join(tmp, 'simexp.yaml')
+            with open(simex.CONFIG_FILE, 'w') as f:
+                yaml.safe_dump({'BASE_PATH': tmp}, f)
+
+            first = simex.run_extraction(urls=urls, force=True)
+            assert sum(result['success'] for _, result, _ in first) == 3
+            daily_folder = os.path.dirname(first[0][1]['path'])
+            checkpoint_path = os.path.join(daily_folder, CHECKPOINT_FILE)
+
+            with open(checkpoint_path) as f:
+                entries = [json.loads(line) for line in f][1:]
+            manifest = read_manifest(daily_folder)
+            assert sorted(entry['filename'] for entry in entries) == ['page0', 'page1', 'page2']
+            assert all(entry['hash'] == manifest[entry['filename']]['hash'] for entry in entries)
+            print("✅ Finished sources checkpointed with hash and path")
+
+            with open(checkpoint_path, 'a') as f:
+                f.write('{"url": "http://127.0.0.1/page')  # Killed mid-write
+
+            FlakyHandler.broken = set()
+            FlakyHandler.hits = []
+            resumed = simex.run_extraction(urls=urls, force=True, resume=True)
+            assert sorted(FlakyHandler.hits) == ['/page3', '/page4', '/page5']
+            assert all(result['success'] for _, result, _ in resumed)
+            print("✅ Resume fetched only the 3 unfinished sources")
+
+            with open(checkpoint_path) as f:
+                lines = f.read().splitlines()
+            assert sum(1 for line in lines if line.startswith('{"url"') and line.endswith('}')) == 6
+            assert simex.run_extraction(urls=urls, force=True, resume=True) == []
+            print("✅ Nothing left after a complete run")
+
+            FlakyHandler.hits = []
+            simex.run_extraction(urls=urls, force=True)
+            with open(checkpoint_path) as f:
+                assert len(f.readlines()) == 7
+            assert len(FlakyHandler.hits) == 6
+            print("✅ A fresh run over the same sources starts a new checkpoint")
+    finally:
+        simex.CONFIG_FILE = original_config
+        server.shutdown()
+
+
+def test_subset_run_keeps_progress():
+    """A fresh run over some sources does not wipe an interrupted run's progress"""
+    print("\n" + "=" * 70)
+    print("TEST 2: Subset run, then resume")
+    print("=" * 70)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FlakyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f"http://127.0.0.1:{server.server_port}/page{i}" for i in range(6)]
+    FlakyHandler.broken = {'/page4', '/page5'}
+
+    original_config = simex.CONFIG_FILE
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            simex.CONFIG_FILE = os.path.join(tmp, 'simexp.yaml')
+            with open(simex.CONFIG_FILE, 'w') as f:
+                yaml.safe_dump({'BASE_PATH': tmp}, f)
+
+            simex.run_extraction(urls=urls, force=True)  # Interrupted: 4 of 6 done
+            FlakyHandler.broken = set()
+            FlakyHandler.hits = []
+            simex.run_extraction(urls=[urls[0], urls[4]], force=True)
+            assert sorted(FlakyHandler.hits) == ['/page0', '/page4']
+
+            FlakyHandler.hits = []
+            resumed = simex.run_extraction(urls=urls, force=True, resume=True)
+            assert FlakyHandler.hits == ['/page5']
+            assert [result['filename'] for _, result, _ in resumed] == ['page5']
+            print("✅ Resume after a subset run fetched only the 1 source still missing")
+    finally:
+        simex.CONFIG_FILE = original_config
+        server.shutdown()
+
+
+def main():
+    """Run all resume tests"""
+    test_resume_skips_finished_sources()
+    test_subset_run_keeps_progress()
+    print("\n🎉 ALL RESUME TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Test Suite for the Conditional-GET HTTP Cache
+
+Tests simfetcher's on-disk cache against a local server with ETags:
+- Validators are sent and a 304 is served from the cache
+- run_extraction() skips unchanged sources unless forced
+- Changed pages are re-processed
+
+♠️🌿🎸🧵 G.Music Assembly - HTTP Cache
+"""
+
+import os
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import yaml
+
+from simexp import simex, simfetcher
+from simexp.simfetcher import fetch_conditional
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """Serves `version` with a matching ETag and honours If-None-Match"""
+    version = 1
+    statuses = []
+
+    def do_GET(self):
+        cls = type(self)
+        etag = f'"v{cls.version}"'
+        if self.headers.get('If-None-Match') == etag:
+            cls.statuses.append(304)
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        body = (
+            "<html><head><title>Cached</title></head><body><div><div><div><div>"
+            f"<p>Version {cls.version}</p>"
+            "</div></div></div></div></body></html>"
+        ).encode('utf-8')
+        cls.statuses.append(200)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _with_cache(test):
+    """Run a test with a private cache dir, config and server"""
+    def wrapper():
+        ETagHandler.version = 1
+        ETagHandler.statuses = []
+        server = ThreadingHTTPServer(('127.0.0.1', 0), ETagHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        original_cache, original_config = simfetcher.HTTP_CACHE_DIR, simex.CONFIG_FILE
+        with tempfile.TemporaryDirectory() as tmp:
+            simfetcher.HTTP_CACHE_DIR = os.path.join(tmp, 'cache', 'http')
+            simex.CONFIG_FILE = os.path.join(tmp, 'simexp.yaml')
+            with open(simex.CONFIG_FILE, 'w') as f:
+                yaml.safe_dump({'BASE_PATH': tmp}, f)
+            try:
+                test(f"http://127.0.0.1:{server.server_port}/aureon")
+            finally:
+                simfetcher.HTTP_CACHE_DIR, simex.CONFIG_FILE = original_cache, original_config
+                server.shutdown()
+    wrapper.__name__ = test.__name__
+    wrapper.__doc__ = test.__doc__
+    return wrapper
+
+
+@_with_cache
+def test_fetch_conditional(url):
+    """Second fetch revalidates and is answered from the cache"""
+    print("\n" + "=" * 70)
+    print("TEST 1: fetch_conditional() revalidation")
+    print("=" * 70)
+
+    content, not_modified = fetch_conditional(url)
+    assert 'Version 1' in content and not not_modified
+
+    content, not_modified = fetch_conditional(url)
+    assert 'Version 1' in content and not_modified
+    assert ETagHandler.statuses == [200, 304]
+    print("✅ 200 then 304 served from cache")
+
+    content, not_modified = fetch_conditional(url, force=True)
+    assert not not_modified and ETagHandler.statuses[-1] == 200
+    print("✅ force=True downloads the full page")
+
+
+@_with_cache
+def test_run_extraction_skips_unchanged(url):
+    """Unchanged sources are not re-processed; changes and --force are"""
+    print("\n" + "=" * 70)
+    print("TEST 2: run_extraction() with the HTTP cache")
+    print("=" * 70)
+
+    first = simex.run_extraction(urls=[url])[0][1]
+    assert first['success'] and not first['unchanged']
+
+    second = simex.run_extraction(urls=[url])[0][1]
+    assert second['unchanged'] and second['path'] == first['path']
+    assert second['process_seconds'] == 0.0
+    print("✅ Unchanged source skipped")
+
+    forced = simex.run_extraction(urls=[url], force=True)[0][1]
+    assert forced['success'] and not forced['unchanged']
+    print("✅ --force re-processes")
+
+    ETagHandler.version = 2
+    changed = simex.run_extraction(urls=[url])[0][1]
+    assert not changed['unchanged']
+    with open(changed['path']) as f:
+        assert 'Version 2' in f.read()
+    print("✅ Changed page re-archived")
+
+
+def main():
+    """Run all HTTP cache tests"""
+    test_fetch_conditional()
+    test_run_extraction_skips_unchanged()
+    print("\n🎉 ALL HTTP CACHE TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Test Suite for the Shared HTTP Client
+
+Tests simfetcher's pooled session against a local HTTP server:
+- 5xx responses are retried with backoff
+- Sequential fetches reuse one keep-alive connection
+- A hung server hits the read timeout instead of stalling
+- Compression is negotiated
+- Pages without a charset header skip requests' charset detection
+
+♠️🌿🎸🧵 G.Music Assembly - HTTP Client
+"""
+
+import os
+import time
+import logging
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import requests
+import yaml
+
+from simexp import session_storage
+from simexp.processor import process_content
+from simexp import simfetcher
+from simexp.simfetcher import fetch_content, fetch_raw, http_get, reset_http_session, size_http_pool, run_concurrently
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Routes: /flaky (503 twice, then 200), /slow (hangs), /hold (0.2s), /latin (no charset header), else 200"""
+    protocol_version = 'HTTP/1.1'
+    lock = threading.Lock()
+    hits = {}
+    client_ports = set()
+    accept_encoding = None
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.hits[self.path] = cls.hits.get(self.path, 0) + 1
+            cls.client_ports.add(self.client_address[1])
+            cls.accept_encoding = self.headers.get('Accept-Encoding')
+            hits = cls.hits[self.path]
+
+        if self.path == '/slow':
+            time.sleep(2)
+        elif self.path.startswith('/hold'):
+            time.sleep(0.2)
+        status = 503 if self.path == '/flaky' and hits <= 2 else 200
+        body = f"<html><body>{self.path} ok</body></html>".encode('utf-8')
+        content_type = 'text/html; charset=utf-8'
+        if self.path == '/latin':
+            body = ('<html><head><meta charset="iso-8859-1"><title>Café</title></head>'
+                    '<body>Crème</body></html>').encode('latin-1')
+            content_type = 'text/html'
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _with_server(test):
+    """Run a test against a fresh server and a fast-retry HTTP config"""
+    def wrapper():
+        Handler.hits = {}
+        Handler.client_ports = set()
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        original_config = session_storage.CONFIG_FILE
+        with tempfile.TemporaryDirectory() as tmp:
+            session_storage.CONFIG_FILE = os.path.join(tmp, 'simexp.yaml')
+            with open(session_storage.CONFIG_FILE, 'w') as f:
+                yaml.safe_dump({'HTTP_READ_TIMEOUT': 0.5, 'HTTP_RETRIES': 3, 'HTTP_BACKOFF': 0.01}, f)
+            reset_http_session()
+            try:
+                test(f"http://127.0.0.1:{server.server_port}")
+            finally:
+                session_storage.CONFIG_FILE = original_config
+                reset_http_session()
+                server.shutdown()
+    wrapper.__name__ = test.__name__
+    wrapper.__doc__ = test.__doc__
+    return wrapper
+
+
+@_with_server
+def test_retry_on_5xx(base):
+    """Two 503s are retried transparently"""
+    print("\n" + "=" * 70)
+    print("TEST 1: Retry with backoff on 5xx")
+    print("=" * 70)
+
+    content = fetch_content(f"{base}/flaky")
+    assert content and '/flaky ok' in content
+    assert Handler.hits['/flaky'] == 3
+    print("✅ Succeeded on third attempt")
+
+
+@_with_server
+def test_keep_alive_reuse(base):
+    """Sequential fetches to one host share a pooled connection"""
+    print("\n" + "=" * 70)
+    print("TEST 2: Keep-alive connection reuse")
+    print("=" * 70)
+
+    for i in range(5):
+        assert fetch_content(f"{base}/page{i}")
+    assert len(Handler.client_ports) == 1, Handler.client_ports
+    assert 'gzip' in Handler.accept_encoding
+    print(f"✅ 5 requests over 1 connection (Accept-Encoding: {Handler.accept_encoding})")
+
+
+@_with_server
+def test_read_timeout(base):
+    """A hung server fails fast instead of blocking forever"""
+    print("\n" + "=" * 70)
+    print("TEST 3: Read timeout")
+    print("=" * 70)
+
+    started = time.perf_counter()
+    response = None
+    try:
+        response = http_get(f"{base}/slow", retry=False)
+    except Exception as e:
+        print(f"✅ Timed out: {type(e).__name__}")
+    assert response is None
+    assert time.perf_counter() - started < 1.5
+
+
+@_with_server
+def test_no_charset_detection(base):
+    """Undeclared charsets are resolved from <meta>, not by requests' detector"""
+    print("\n" + "=" * 70)
+    print("TEST 4: Byte-level decoding without charset detection")
+    print("=" * 70)
+
+    def no_detection(self):
+        raise AssertionError("apparent_encoding should not be used")
+
+    original = requests.models.Response.apparent_encoding
+    requests.models.Response.apparent_encoding = property(no_detection)
+    try:
+        body, charset, _ = fetch_raw(f"{base}/latin", force=True)
+        assert isinstance(body, bytes) and charset is None
+        assert process_content(body, charset)[0] == 'Café'
+        assert 'Crème' in fetch_content(f"{base}/latin")
+    finally:
+        requests.models.Response.apparent_encoding = original
+    print("✅ Raw bytes decoded via <meta charset>")
+
+
+@_with_server
+def test_pool_sized_for_concurrency(base):
+    """More workers than the default pool keep every connection alive"""
+    print("\n" + "=" * 70)
+    print("TEST 5: Connection pool sized from the concurrency")
+    print("=" * 70)
+
+    full_warnings = []
+
+    class PoolFull(logging.Handler):
+        def emit(self, record):
+            if 'pool is full' in record.getMessage():
+                full_warnings.append(record)
+
+    workers = 24
+    handler = PoolFull()
+    logger = logging.getLogger('urllib3.connectionpool')
+    logger.addHandler(handler)
+    original_size = simfetcher._http_pool_size
+    try:
+        size_http_pool(workers)
+        adapter = simfetcher.get_http_session().get_adapter(base)
+        assert adapter._pool_maxsize == workers
+        for wave in range(2):
+            urls = [f"{base}/hold{wave}-{i}" for i in range(workers)]
+            assert all(result for _, result, _ in run_concurrently(urls, fetch_content, workers))
+    finally:
+        logger.removeHandler(handler)
+        simfetcher._http_pool_size = original_size
+    assert full_warnings == []
+    assert len(Handler.client_ports) <= workers, len(Handler.client_ports)
+    print(f"✅ 2 waves of {workers} concurrent fetches over {len(Handler.client_ports)} kept-alive connections")
+
+
+def main():
+    """Run all HTTP client tests"""
+    test_retry_on_5xx()
+    test_keep_alive_reuse()
+    test_read_timeout()
+    test_no_charset_detection()
+    test_pool_sized_for_concurrency()
+    print("\n🎉 ALL HTTP CLIENT TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
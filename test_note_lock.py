@@ -0,0 +1,206 @@
+"""
+Test Suite for Per-Note Write Lock
+
+Tests cross-process serialization of note edits:
+- Waiters across processes are served in arrival (FIFO) order
+- Timeouts leave the queue clean
+- Tickets of dead processes are pruned
+- Queue depth / wait metrics for `session info`
+- Note URLs resolve to the owning session's lock key
+
+♠️🌿🎸🧵 G.Music Assembly - Note Write Serialization
+"""
+
+import os
+import json
+import time
+import asyncio
+import tempfile
+import multiprocessing
+
+from simexp import note_lock
+from simexp import session_manager
+from simexp import session_archive
+from simexp.note_lock import NoteLock, NoteLockTimeout, get_lock_stats, get_lock_dir, note_lock_key
+from simexp.session_manager import SessionState, initialize_four_directions_session, register_session_workspace
+
+
+def _worker(locks_dir, key, label, log_path, hold):
+    """Child process: take the lock, log entry/exit, hold briefly"""
+    note_lock.LOCKS_DIR = locks_dir
+    with NoteLock(key, operation=label, timeout=30):
+        with open(log_path, 'a') as f:
+            f.write(f"enter {label}\n")
+        time.sleep(hold)
+        with open(log_path, 'a') as f:
+            f.write(f"exit {label}\n")
+
+
+def _with_locks_dir(test):
+    """Run a test against a temporary ~/.simexp/locks"""
+    def wrapper():
+        original = note_lock.LOCKS_DIR
+        with tempfile.TemporaryDirectory() as tmp:
+            note_lock.LOCKS_DIR = os.path.join(tmp, 'locks')
+            try:
+                test(tmp)
+            finally:
+                note_lock.LOCKS_DIR = original
+    wrapper.__name__ = test.__name__
+    wrapper.__doc__ = test.__doc__
+    return wrapper
+
+
+@_with_locks_dir
+def test_fifo_across_processes(tmp):
+    """Processes that queue for one note run one at a time, in order"""
+    print("\n" + "=" * 70)
+    print("TEST 1: FIFO serialization across processes")
+    print("=" * 70)
+
+    log_path = os.path.join(tmp, 'log.txt')
+    ctx = multiprocessing.get_context('fork')
+    processes = []
+    for i in range(4):
+        p = ctx.Process(target=_worker, args=(note_lock.LOCKS_DIR, 'fifo-session', f'w{i}', log_path, 0.3))
+        p.start()
+        processes.append(p)
+        time.sleep(0.1)  # Stagger arrival so the expected order is known
+    for p in processes:
+        p.join(30)
+        assert p.exitcode == 0
+
+    with open(log_path) as f:
+        lines = f.read().split()
+    events = [' '.join(lines[i:i + 2]) for i in range(0, len(lines), 2)]
+    expected = []
+    for i in range(4):
+        expected += [f'enter w{i}', f'exit w{i}']
+    assert events == expected, events
+    print("✅ No overlapping edits; served in arrival order")
+
+    stats = get_lock_stats('fifo-session')
+    assert stats['acquisitions'] == 4
+    assert stats['queue_depth'] == 0 and stats['holder'] is None
+    assert stats['max_queue_depth'] >= 2
+    assert stats['max_wait_seconds'] > 0.3
+    print(f"✅ Metrics: max depth {stats['max_queue_depth']}, max wait {stats['max_wait_seconds']:.2f}s")
+
+
+@_with_locks_dir
+def test_timeout(tmp):
+    """A waiter gives up after the timeout and leaves no ticket behind"""
+    print("\n" + "=" * 70)
+    print("TEST 2: Lock timeout")
+    print("=" * 70)
+
+    with NoteLock('timeout-session', operation='holder'):
+        stats = get_lock_stats('timeout-session')
+        assert stats['holder']['operation'] == 'holder'
+        try:
+            with NoteLock('timeout-session', timeout=0.3):
+                assert False, "Lock should not be acquired"
+        except NoteLockTimeout as e:
+            print(f"✅ Timed out: {e}")
+        assert get_lock_stats('timeout-session')['queue_depth'] == 1
+
+    async def acquire_async():
+        async with NoteLock('timeout-session', operation='async') as lock:
+            return lock.wait_seconds
+
+    assert asyncio.run(acquire_async()) < 0.3
+    print("✅ Queue clean after timeout; async acquire is immediate")
+
+
+@_with_locks_dir
+def test_stale_ticket_pruned(tmp):
+    """A ticket left by a dead process does not block the queue"""
+    print("\n" + "=" * 70)
+    print("TEST 3: Stale ticket pruning")
+    print("=" * 70)
+
+    ctx = multiprocessing.get_context('fork')
+    dead = ctx.Process(target=time.sleep, args=(0,))
+    dead.start()
+    dead.join()
+
+    queue_dir = os.path.join(get_lock_dir('stale-session'), 'queue')
+    os.makedirs(queue_dir)
+    with open(os.path.join(queue_dir, f"{0:012d}"), 'w') as f:
+        json.dump({'pid': dead.pid, 'operation': 'crashed'}, f)
+
+    with NoteLock('stale-session', timeout=1) as lock:
+        assert lock.ahead == 0
+    assert os.listdir(queue_dir) == []
+    print("✅ Dead process ticket removed; lock acquired at once")
+
+
+def test_lock_dir_key():
+    """Note URLs map to safe, distinct directory names"""
+    print("\n" + "=" * 70)
+    print("TEST 4: Lock directory naming")
+    print("=" * 70)
+
+    a = get_lock_dir('https://app.simplenote.com/p/abc')
+    b = get_lock_dir('https://app.simplenote.com/p/abd')
+    assert a != b
+    assert '/' not in os.path.basename(a) and ':' not in os.path.basename(a)
+    assert os.path.basename(get_lock_dir('session-123')) == 'session-123'
+    print("✅ URLs sanitized and disambiguated; session IDs kept readable")
+
+
+def test_url_resolves_to_session_key():
+    """simexp write <url> takes the same lock as session commands on that note"""
+    print("\n" + "=" * 70)
+    print("TEST 5: One lock key per note")
+    print("=" * 70)
+
+    original = (session_manager.SESSION_REGISTRY_FILE, session_archive.ARCHIVE_DIR, os.getcwd())
+    with tempfile.TemporaryDirectory() as tmp:
+        session_manager.SESSION_REGISTRY_FILE = os.path.join(tmp, 'session_registry.json')
+        try:
+            published, adopted = os.path.join(tmp, 'published'), os.path.join(tmp, 'adopted')
+            for workspace in (published, adopted):
+                os.makedirs(workspace)
+                register_session_workspace(workspace)
+            session = initialize_four_directions_session({'session_id': 'session-pub', 'created_at': 'x'})
+            session['west']['public_url'] = 'https://app.simplenote.com/p/PubNote'
+            SessionState(workspace_dir=published).save_session(session)
+            SessionState(workspace_dir=adopted).save_session(initialize_four_directions_session({
+                'session_id': 'session-adopted', 'created_at': 'x',
+                'note_uuid': '0f0e0d0c-0b0a-0908-0706-050403020100',
+                'public_url': 'https://app.simplenote.com/p/Adopted'}))
+
+            os.chdir(tmp)  # No active session here: found through the registry
+            assert note_lock_key('https://app.simplenote.com/p/PubNote/') == 'session-pub'
+            assert note_lock_key('https://app.simplenote.com/p/Adopted?x=1') == 'session-adopted'
+            assert note_lock_key('https://app.simplenote.com/n/0f0e0d0c-0b0a-0908-0706-050403020100') == 'session-adopted'
+            os.chdir(published)
+            assert note_lock_key('https://app.simplenote.com/p/PubNote') == 'session-pub'
+            print("✅ Public URLs and note UUIDs resolve to the owning session ID")
+
+            assert note_lock_key('https://app.simplenote.com/p/Other#top') == 'https://app.simplenote.com/p/Other'
+            print("✅ Notes outside any session are keyed by their canonical URL")
+
+            session_archive.ARCHIVE_DIR = os.path.join(tmp, 'archive')
+            session_archive.archive_session(SessionState(workspace_dir=published))
+            os.chdir(tmp)
+            assert note_lock_key('https://app.simplenote.com/p/PubNote') == 'session-pub'
+            print("✅ Completed (archived) sessions keep their lock key")
+        finally:
+            session_manager.SESSION_REGISTRY_FILE, session_archive.ARCHIVE_DIR, cwd = original
+            os.chdir(cwd)
+
+
+def main():
+    """Run all note lock tests"""
+    test_fifo_across_processes()
+    test_timeout()
+    test_stale_ticket_pruned()
+    test_lock_dir_key()
+    test_url_resolves_to_session_key()
+    print("\n🎉 ALL NOTE LOCK TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Test Suite for the Process-Pool Parsing Stage
+
+Tests processor.ParsePool and run_extraction(parse_workers=N):
+- Worker processes return the same title and Markdown as process_content()
+- Extraction profiles reach the workers
+- In-flight pages never exceed the back-pressure limit
+- Pooled extraction archives the same files as in-thread extraction
+- `--workers` takes N or 'auto' and never swallows a URL
+
+♠️🌿🎸🧵 G.Music Assembly - Parallel Parsing
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import yaml
+
+from simexp import simex
+from simexp.processor import ParsePool, ExtractionProfile, process_content
+from bench_processor import synthetic_page
+
+
+def test_pool_matches_process_content():
+    """Bytes parsed in workers give the same result, profiles included"""
+    print("\n" + "=" * 70)
+    print("TEST 1: ParsePool parity and back-pressure")
+    print("=" * 70)
+
+    page = synthetic_page(50).encode('utf-8')
+    profile = ExtractionProfile('headings', {'content_selector': 'body', 'markdown': {'h3': 'h1'}})
+
+    with ParsePool(workers=2, max_pending=3) as pool:
+        assert pool.process(page, 'utf-8') == process_content(page, 'utf-8')
+        assert pool.process(page, 'utf-8', profile) == process_content(page, 'utf-8', profile)
+        print("✅ Same title and Markdown as in-thread parsing")
+
+        with ThreadPoolExecutor(max_workers=8) as threads:
+            results = list(threads.map(lambda _: pool.process(page, 'utf-8'), range(16)))
+        assert len(set(results)) == 1
+        assert 1 <= pool.peak_in_flight <= 3
+        print(f"✅ 16 pages from 8 threads, peak {pool.peak_in_flight}/3 in flight")
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    """Serves a synthetic ~20KB note for any path"""
+    body = synthetic_page(20).encode('utf-8')
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_run_extraction_with_workers():
+    """--workers archives byte-identical files"""
+    print("\n" + "=" * 70)
+    print("TEST 2: run_extraction(parse_workers=2)")
+    print("=" * 70)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f"http://127.0.0.1:{server.server_port}/note{i}" for i in range(6)]
+
+    original_config = simex.CONFIG_FILE
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            simex.CONFIG_FILE = os.path.join(tmp, 'simexp.yaml')
+            with open(simex.CONFIG_FILE, 'w') as f:
+                yaml.safe_dump({'BASE_PATH': tmp}, f)
+
+            threaded = simex.run_extraction(urls=urls, force=True)
+            contents = []
+            for _, result, _ in threaded:
+                with open(result['path']) as f:
+                    contents.append(f.read())
+
+            pooled = simex.run_extraction(urls=urls, force=True, parse_workers=2)
+            for (_, result, _), expected in zip(pooled, contents):
+                assert result['success']
+                with open(result['path']) as f:
+                    assert f.read() == expected
+    finally:
+        simex.CONFIG_FILE = original_config
+        server.shutdown()
+    print("✅ Pooled extraction matches in-thread extraction")
+
+
+def test_workers_argument():
+    """`simexp extract --workers <url>` is rejected instead of eating the URL"""
+    print("\n" + "=" * 70)
+    print("TEST 3: --workers argument")
+    print("=" * 70)
+
+    assert simex._parse_workers_arg('auto') == 'auto'
+    assert simex._parse_workers_arg('4') == 4
+
+    original_argv = sys.argv
+    try:
+        for value in ('https://example.com/note', '0', '-2'):
+            sys.argv = ['simexp', 'extract', '--workers', value]
+            try:
+                simex.main()
+            except SystemExit as e:
+                assert e.code == 2, e.code
+            else:
+                raise AssertionError(f"--workers {value} was accepted")
+    finally:
+        sys.argv = original_argv
+    print("✅ N and 'auto' accepted; URLs and non-positive counts rejected")
+
+
+def main():
+    """Run all parse pool tests"""
+    test_pool_matches_process_content()
+    test_run_extraction_with_workers()
+    test_workers_argument()
+    print("\n🎉 ALL PARSE POOL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
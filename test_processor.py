@@ -0,0 +1,149 @@
+"""
+Test Suite for HTML Processing
+
+Tests processor.process_content():
+- One targeted parse per document (title + body only)
+- Title and content extraction from the shared tree
+- Single-pass Markdown emitter: nested lists, inline code, no duplicates
+- Byte-level decoding without statistical charset detection
+
+♠️🌿🎸🧵 G.Music Assembly - Content Processing
+"""
+
+from simexp import processor
+from simexp.processor import process_content, parse_html, extract_title, clean_html, sniff_encoding, decode_html
+
+PAGE = """<html><head><title> My Page </title><style>x{}</style>
+<link rel="stylesheet" href="a.css"><meta name="x" content="y"></head>
+<body><div><div><div><div>
+<h1>Top</h1><p>Para one</p><ul><li>a</li><li>b</li></ul><blockquote>q</blockquote>
+<h2>Sub</h2><script>bad()</script>
+</div></div></div></div><div>other</div></body></html>"""
+
+
+def test_single_targeted_parse():
+    """process_content() parses once and only keeps title and body"""
+    print("\n" + "=" * 70)
+    print("TEST 1: Single targeted parse")
+    print("=" * 70)
+
+    calls = []
+    original = processor.parse_html
+
+    def counting_parse(html_content, encoding=None):
+        calls.append(1)
+        return original(html_content, encoding)
+
+    processor.parse_html = counting_parse
+    try:
+        title, content = process_content(PAGE)
+    finally:
+        processor.parse_html = original
+
+    assert len(calls) == 1
+    assert title == 'My Page'
+    assert content.startswith('# Top')
+    assert 'bad()' not in content and 'other' not in content
+    print(f"✅ One parse with {processor.HTML_PARSER}")
+
+    soup = parse_html(PAGE)
+    assert soup.find('meta') is None and soup.find('link') is None and soup.find('style') is None
+    assert soup.title is not None and soup.body is not None
+    print("✅ Head content other than <title> is never materialized")
+
+
+def test_title_fallbacks():
+    """Missing or empty titles fall back to 'Untitled'"""
+    print("\n" + "=" * 70)
+    print("TEST 2: Title fallbacks")
+    print("=" * 70)
+
+    assert extract_title("<html><body><p>x</p></body></html>") == 'Untitled'
+    assert extract_title("<html><head><title></title></head><body></body></html>") == 'Untitled'
+    assert process_content("<html><body><p>none</p></body></html>") == ('Untitled', 'No content found.')
+    print("✅ Untitled pages handled")
+
+
+def _wrap(body):
+    return f"<html><body><div><div><div><div>{body}</div></div></div></div></body></html>"
+
+
+def test_nested_lists_emitted_once():
+    """Nested lists are indented and every item appears exactly once"""
+    print("\n" + "=" * 70)
+    print("TEST 3: Nested lists without duplication")
+    print("=" * 70)
+
+    html = _wrap(
+        "<h1>Plan</h1><p>Intro <code>cfg</code> here</p>"
+        "<ul><li>one<ul><li><p>one.a</p><p>more</p></li><li>one.b<ol><li>deep</li></ol></li></ul></li>"
+        "<li>two</li></ul>"
+        "<blockquote><p>line 1</p><p>line 2</p></blockquote><h2>End</h2>"
+    )
+    expected = "\n".join([
+        "# Plan",
+        "Intro `cfg` here",
+        "- one",
+        "  - one.a",
+        "    more",
+        "  - one.b",
+        "    - deep",
+        "- two",
+        "> line 1",
+        "> line 2",
+        "",
+        "## End",
+    ])
+    assert clean_html(html) == expected, clean_html(html)
+    print("✅ Each item emitted once, nesting indented, inline code kept in place")
+
+
+def test_output_grows_linearly():
+    """Doubling repeated content doubles the Markdown, no more"""
+    print("\n" + "=" * 70)
+    print("TEST 4: Output size grows linearly")
+    print("=" * 70)
+
+    section = "<h2>S</h2><ul><li>a<ul><li>b<ul><li>c</li></ul></li></ul></li></ul><p>text</p>"
+    small = clean_html(_wrap(section * 50))
+    large = clean_html(_wrap(section * 100))
+    assert len(large) <= 2 * len(small) + 2
+    assert large.count('- c') == 100
+    print(f"✅ {len(small)} → {len(large)} chars for 2x input")
+
+
+def test_byte_level_decoding():
+    """Bytes are decoded from header / meta / UTF-8 validity, in that order"""
+    print("\n" + "=" * 70)
+    print("TEST 5: Byte-level decoding")
+    print("=" * 70)
+
+    latin = ('<html><head><meta charset="iso-8859-1"><title>Café</title></head>'
+             '<body><div><div><div><div><p>Crème brûlée</p></div></div></div></div></body></html>').encode('latin-1')
+    assert sniff_encoding(latin) == 'iso8859-1'
+    assert process_content(latin) == ('Café', 'Crème brûlée')
+    print("✅ <meta charset> honoured when the server sends none")
+
+    plain = latin.replace(b'<meta charset="iso-8859-1">', b'')
+    assert sniff_encoding(plain, 'latin-1') == 'iso8859-1'
+    assert process_content(plain, 'latin-1')[0] == 'Café'
+    assert sniff_encoding('<p>Café</p>'.encode('utf-8')) == 'utf-8'
+    print("✅ Header charset and UTF-8 validity")
+
+    assert sniff_encoding(plain) is None
+    assert 'Caf' in decode_html(plain)
+    print("✅ Detection only runs for undeclared, non-UTF-8 bytes")
+
+
+def main():
+    """Run all processor tests"""
+    test_single_targeted_parse()
+    test_title_fallbacks()
+    test_nested_lists_emitted_once()
+    test_output_grows_linearly()
+    test_byte_level_decoding()
+    print("\n🎉 ALL PROCESSOR TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
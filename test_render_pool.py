@@ -0,0 +1,141 @@
+"""
+Test Suite for Browser-Rendered Extraction
+
+Tests render_pool.RenderPool and run_extraction(render=True):
+- A browser that cannot start fails the rendered sources cleanly, once
+- Script-built pages are empty when fetched but extractable when rendered
+- Renders never exceed the page cap, pages are recycled, images are blocked
+
+The rendering tests need Chromium (`playwright install chromium`) and are
+skipped without it.
+
+♠️🌿🎸🧵 G.Music Assembly - Rendered Extraction
+"""
+
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import yaml
+
+from simexp import simex
+from simexp.render_pool import RenderPool
+
+SCRIPTED_PAGE = b"""<html><body><div><div><div><div id="note"></div></div></div></div>
+<img src="/pixel.png">
+<script>
+document.getElementById('note').innerHTML = '<p>Rendered by script</p>';
+</script></body></html>"""
+
+
+class ScriptedHandler(BaseHTTPRequestHandler):
+    """Serves a page whose content only exists after its script runs"""
+    hits = []
+
+    def do_GET(self):
+        type(self).hits.append(self.path)
+        body = SCRIPTED_PAGE if not self.path.endswith('.png') else b''
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _with_config(tmp):
+    simex.CONFIG_FILE = os.path.join(tmp, 'simexp.yaml')
+    with open(simex.CONFIG_FILE, 'w') as f:
+        yaml.safe_dump({'BASE_PATH': tmp, 'EXTRACT_RENDER_CDP': 'http://127.0.0.1:9'}, f)
+
+
+def test_unavailable_browser():
+    """Rendered sources fail with a clear error when no browser is reachable"""
+    print("\n" + "=" * 70)
+    print("TEST 1: Browser unavailable")
+    print("=" * 70)
+
+    pool = RenderPool(cdp_url='http://127.0.0.1:9')
+    for _ in range(2):
+        try:
+            pool.render('http://127.0.0.1:9/')
+            assert False, "render succeeded without a browser"
+        except RuntimeError as e:
+            assert str(e).startswith('Could not start browser')
+    assert not pool.started
+    pool.close()
+    print("✅ Launch failure reported once and remembered")
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ScriptedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f"http://127.0.0.1:{server.server_port}/note{i}" for i in range(3)]
+    original_config = simex.CONFIG_FILE
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            _with_config(tmp)
+            ScriptedHandler.hits = []
+            results = simex.run_extraction(urls=urls, force=True, render=True)
+            assert all(not result['success'] for _, result, _ in results)
+            assert all(result['error'].startswith('Render failed') for _, result, _ in results)
+            assert ScriptedHandler.hits == []
+    finally:
+        simex.CONFIG_FILE = original_config
+        server.shutdown()
+    print("✅ Rendered sources fail cleanly without static fallback")
+
+
+def test_rendered_extraction():
+    """Rendering recovers script-built content within the page cap"""
+    print("\n" + "=" * 70)
+    print("TEST 2: Rendering with warm pages")
+    print("=" * 70)
+
+    pool = RenderPool(pages=2, max_uses=2)
+    try:
+        pool.render('about:blank')
+    except RuntimeError as e:
+        print(f"⏭️  Skipped: {e}")
+        return
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ScriptedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    original_config = simex.CONFIG_FILE
+    try:
+        with pool:
+            ScriptedHandler.hits = []
+            with ThreadPoolExecutor(max_workers=6) as threads:
+                pages = list(threads.map(lambda i: pool.render(f"{base}/page{i}")[0], range(6)))
+            assert all(b'Rendered by script' in page for page in pages)
+            assert pool.peak_in_flight <= 2 and pool.recycled >= 3
+            assert not any(hit.endswith('.png') for hit in ScriptedHandler.hits)
+            print(f"✅ 6 renders, peak {pool.peak_in_flight}/2, {pool.recycled} recycled, images blocked")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            simex.CONFIG_FILE = os.path.join(tmp, 'simexp.yaml')
+            with open(simex.CONFIG_FILE, 'w') as f:
+                yaml.safe_dump({'BASE_PATH': tmp}, f)
+            static = simex.run_extraction(urls=[f"{base}/static"], force=True)
+            assert static[0][1]['content_found'] is False
+            rendered = simex.run_extraction(urls=[f"{base}/rendered"], force=True, render=True)
+            with open(rendered[0][1]['path']) as f:
+                assert 'Rendered by script' in f.read()
+        print("✅ Empty when fetched, extracted when rendered")
+    finally:
+        simex.CONFIG_FILE = original_config
+        server.shutdown()
+
+
+def main():
+    """Run all render pool tests"""
+    test_unavailable_browser()
+    test_rendered_extraction()
+    print("\n🎉 ALL RENDER POOL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
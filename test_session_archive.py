@@ -0,0 +1,107 @@
+"""
+Test Suite for Session Archival
+
+Tests cold archival of completed sessions:
+- archive_session() leaves a small stub and a compressed archive
+- rehydrate_session() restores the full history
+- update_session_data() transparently rehydrates archived sessions
+
+♠️🌿🎸🧵 G.Music Assembly - Session Archival
+"""
+
+import os
+import tempfile
+from datetime import datetime
+
+from simexp import session_archive
+from simexp.session_archive import archive_session, rehydrate_session, is_archived, read_archive
+from simexp.session_manager import (
+    initialize_four_directions_session,
+    update_session_data,
+    SessionState,
+    get_active_session
+)
+
+
+def _completed_session():
+    session = initialize_four_directions_session({
+        'session_id': 'archive-test-123',
+        'search_key': 'archive-test-123',
+        'created_at': datetime.now().isoformat(),
+        'ai_assistant': 'claude'
+    })
+    session['south']['content_written'] = [
+        {'timestamp': datetime.now().isoformat(), 'content_length': i} for i in range(500)
+    ]
+    session['north']['completed'] = True
+    session['north']['completed_at'] = datetime.now().isoformat()
+    return session
+
+
+def test_archive_and_rehydrate():
+    """Archiving leaves a stub; rehydrating restores the history"""
+    print("\n" + "=" * 70)
+    print("TEST 1: archive_session() / rehydrate_session()")
+    print("=" * 70)
+
+    original_archive_dir = session_archive.ARCHIVE_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        session_archive.ARCHIVE_DIR = os.path.join(tmp, 'archive')
+        state = SessionState(workspace_dir=os.path.join(tmp, 'workspace'), backend='json')
+        session = _completed_session()
+        state.save_session(session)
+        full_size = os.path.getsize(state.state_file)
+
+        stub = archive_session(state)
+        assert is_archived(state.load_session())
+        assert stub['session_id'] == 'archive-test-123'
+        assert 'south' not in stub
+        assert os.path.getsize(state.state_file) < full_size / 10
+        assert read_archive(stub['archived']['path']) == session
+        print(f"✅ Stub is {os.path.getsize(state.state_file)} bytes (was {full_size})")
+
+        restored = rehydrate_session(state)
+        assert restored == session
+        assert state.load_session() == session
+        print("✅ Rehydrated session matches original")
+
+    session_archive.ARCHIVE_DIR = original_archive_dir
+
+
+def test_update_rehydrates_archived_session():
+    """Tracking new actions on an archived session restores it first"""
+    print("\n" + "=" * 70)
+    print("TEST 2: update_session_data() on an archived session")
+    print("=" * 70)
+
+    original_cwd = os.getcwd()
+    original_archive_dir = session_archive.ARCHIVE_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            session_archive.ARCHIVE_DIR = os.path.join(tmp, 'archive')
+            os.chdir(tmp)
+            state = SessionState(backend='json')
+            state.save_session(_completed_session())
+            archive_session(state)
+
+            update_session_data('north', 'observed_patterns', {'pattern': 'Late insight'})
+
+            session = get_active_session()
+            assert not is_archived(session)
+            assert len(session['south']['content_written']) == 500
+            assert session['north']['observed_patterns'][-1]['pattern'] == 'Late insight'
+            print("✅ History restored and new pattern recorded")
+        finally:
+            os.chdir(original_cwd)
+            session_archive.ARCHIVE_DIR = original_archive_dir
+
+
+def main():
+    """Run all archive tests"""
+    test_archive_and_rehydrate()
+    test_update_rehydrates_archived_session()
+    print("\n🎉 ALL SESSION ARCHIVE TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
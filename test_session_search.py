@@ -0,0 +1,175 @@
+"""
+Test Suite for Cross-Session Search
+
+Tests session_index.py and its hooks in the tracking functions:
+- Reflections, patterns, wisdom, writes and seeds are indexed as they are tracked
+- Kind, session and date filters; free-text fallback for non-FTS5 queries
+- --reindex picks up older workspaces and archived sessions, keeps write text
+- Thousands of entries are searched in milliseconds
+
+♠️🌿🎸🧵 G.Music Assembly - Session Search
+"""
+
+import os
+import time
+import tempfile
+from datetime import datetime
+
+from simexp import simex
+from simexp import session_index
+from simexp import session_manager
+from simexp import session_archive
+from simexp.session_manager import (
+    initialize_four_directions_session,
+    update_session_data,
+    register_session_workspace,
+    SessionState
+)
+from simexp.session_archive import archive_session
+from simexp.session_index import search_sessions, reindex_sessions, close_connections
+
+
+class _Isolated:
+    """Index, registry and archive directory inside a temporary directory"""
+
+    def __init__(self, tmp):
+        self.tmp = tmp
+        self.saved = (session_index.SESSION_INDEX_DB, session_manager.SESSION_REGISTRY_FILE,
+                      session_archive.ARCHIVE_DIR, os.getcwd())
+
+    def __enter__(self):
+        session_index.SESSION_INDEX_DB = os.path.join(self.tmp, 'session_index.db')
+        session_manager.SESSION_REGISTRY_FILE = os.path.join(self.tmp, 'session_registry.json')
+        session_archive.ARCHIVE_DIR = os.path.join(self.tmp, 'archive')
+        return self
+
+    def __exit__(self, *exc):
+        close_connections()
+        (session_index.SESSION_INDEX_DB, session_manager.SESSION_REGISTRY_FILE,
+         session_archive.ARCHIVE_DIR, cwd) = self.saved
+        os.chdir(cwd)
+
+
+def _start(workspace, session_id, backend='json'):
+    os.makedirs(workspace, exist_ok=True)
+    os.chdir(workspace)
+    SessionState(backend=backend).save_session(initialize_four_directions_session({
+        'session_id': session_id, 'created_at': datetime.now().isoformat()
+    }))
+
+
+def test_tracking_feeds_index():
+    """Tracked insights and writes are searchable immediately"""
+    print("\n" + "=" * 70)
+    print("TEST 1: Indexing from the tracking functions")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp, _Isolated(tmp):
+        _start(os.path.join(tmp, 'alpha'), 'session-alpha')
+        simex._track_north_reflection("Why was the deploy slow?", "The cache was cold after every restart.")
+        simex._track_north_pattern("Retries without backoff amplify outages")
+        simex._track_content_write(30, 'append', False, content="Deployed the warm cache to staging.")
+
+        _start(os.path.join(tmp, 'beta'), 'session-beta', backend='sqlite')
+        simex._track_north_wisdom("Warm the cache before switching traffic")
+        simex.session_complete_command(seeds="Measure cache hit rate after deploy")
+
+        hits = search_sessions('cache')
+        assert {(hit['session_id'], hit['kind']) for hit in hits} == {
+            ('session-alpha', 'reflection'), ('session-alpha', 'write'),
+            ('session-beta', 'wisdom'), ('session-beta', 'seed')}
+        assert all('[cache]' in hit['snippet'] for hit in hits)
+        assert {hit['workspace'] for hit in hits} == {os.path.join(tmp, 'alpha'), os.path.join(tmp, 'beta')}
+        print(f"✅ 4 entries across 2 sessions (json + sqlite) for 'cache'")
+
+        assert [hit['kind'] for hit in search_sessions('deploy', kind='reflection')] == ['reflection']
+        assert [hit['text'] for hit in search_sessions('cache', session_id='session-beta', kind='seed')] == [
+            "Measure cache hit rate after deploy"]
+        assert search_sessions('cache', since='2999-01-01') == []
+        assert search_sessions('"without backoff"')[0]['kind'] == 'pattern'
+        assert search_sessions('retry')[0]['kind'] == 'pattern'  # porter stemming
+        assert search_sessions('re-tries (backoff') == [] and search_sessions('') == []
+        print("✅ Kind, session, date, phrase and stemmed queries; free-text fallback")
+
+        # The session history is unchanged: write text stays out of session.json
+        os.chdir(os.path.join(tmp, 'alpha'))
+        written = session_manager.get_active_session()['south']['content_written']
+        assert len(written) == 1 and 'content' not in written[0]
+        print("✅ Write text only lives in the index")
+
+
+def test_reindex():
+    """--reindex indexes registered workspaces and archives, once"""
+    print("\n" + "=" * 70)
+    print("TEST 2: Reindexing older sessions")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp, _Isolated(tmp):
+        # Sessions tracked before the index existed
+        for name in ('old-one', 'old-two'):
+            workspace = os.path.join(tmp, name)
+            _start(workspace, name)
+            update_session_data('north', 'extracted_wisdom', {'wisdom': f"Lighthouse lesson from {name}"})
+            update_session_data('north', 'reflection_notes', {'prompt': 'Lighthouse?', 'reflection': 'Keep it lit'})
+            register_session_workspace(workspace)
+        archive_session(SessionState(workspace_dir=os.path.join(tmp, 'old-two')))
+
+        # An archive whose workspace was never registered
+        _start(os.path.join(tmp, 'gone'), 'gone')
+        update_session_data('north', 'observed_patterns', {'pattern': 'Lighthouse keepers log everything'})
+        archive_session(SessionState())
+
+        simex._track_content_write(9, 'append', False, content="Lighthouse notes written live")
+        assert len(search_sessions('lighthouse')) == 1
+
+        assert reindex_sessions() == 5
+        hits = search_sessions('lighthouse')
+        assert sorted(hit['session_id'] for hit in hits) == ['gone', 'gone', 'old-one', 'old-one', 'old-two', 'old-two']
+        assert {hit['kind'] for hit in hits if hit['session_id'] == 'gone'} == {'pattern', 'write'}
+        print("✅ Registered workspaces (active + archived) and orphan archives indexed")
+
+        assert reindex_sessions() == 0
+        assert len(search_sessions('lighthouse')) == 6
+        print("✅ A second pass adds nothing; live write text is kept")
+
+
+def test_query_speed():
+    """Thousands of entries answer in milliseconds"""
+    print("\n" + "=" * 70)
+    print("TEST 3: Query latency over 200 sessions x 25 entries")
+    print("=" * 70)
+
+    words = "alpha beta gamma delta epsilon zeta eta theta iota kappa lambda".split()
+    with tempfile.TemporaryDirectory() as tmp, _Isolated(tmp):
+        for n in range(200):
+            session = initialize_four_directions_session({'session_id': f's{n}', 'created_at': 'x'})
+            for i in range(25):
+                text = ' '.join(words[(n + i + j) % len(words)] for j in range(20))
+                if n == 150 and i == 7:
+                    text += " the needle in the haystack"
+                session['north']['extracted_wisdom'].append({'timestamp': f'2025-01-01T00:00:{i:02d}', 'wisdom': text})
+            session_index.index_session(session, f'/work/{n}')
+
+        started = time.perf_counter()
+        hits = search_sessions('"needle in the haystack"')
+        elapsed = time.perf_counter() - started
+        assert len(hits) == 1 and hits[0]['session_id'] == 's150'
+        assert elapsed < 0.05, elapsed
+
+        started = time.perf_counter()
+        assert len(search_sessions('gamma', kind='wisdom', limit=5)) == 5
+        filtered = time.perf_counter() - started
+        assert filtered < 0.05, filtered
+        print(f"✅ Phrase query {elapsed * 1000:.1f} ms, filtered query {filtered * 1000:.1f} ms over 5,000 entries")
+
+
+def main():
+    """Run all session search tests"""
+    test_tracking_feeds_index()
+    test_reindex()
+    test_query_speed()
+    print("\n🎉 ALL SESSION SEARCH TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
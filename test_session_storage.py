@@ -0,0 +1,229 @@
+"""
+Test Suite for Session Storage Backends
+
+Tests JSON and SQLite session storage:
+- Round-trip of the Four Directions structure
+- Indexed action appends and time-range queries (SQLite)
+- update_session_data() on a SQLite-backed session
+- JSON import/export between backends
+- Compact JSON format (orjson when installed) alongside legacy pretty files
+- One SQLite connection per tracked action; schema created once
+- Unreadable session files never hide a parent workspace's session
+
+♠️🌿🎸🧵 G.Music Assembly - Session State Storage
+"""
+
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+from simexp.session_storage import JSONSessionStorage, SQLiteSessionStorage, FORMAT_KEY
+from simexp.session_manager import (
+    initialize_four_directions_session,
+    update_session_data,
+    SessionState,
+    get_active_session
+)
+
+
+def _sample_session(session_id='storage-test-123'):
+    session = initialize_four_directions_session({
+        'session_id': session_id,
+        'search_key': session_id,
+        'created_at': datetime.now().isoformat(),
+        'ai_assistant': 'claude'
+    })
+    session['east']['vision_statement'] = "Store sessions efficiently"
+    session['south']['content_written'] = [
+        {'timestamp': (datetime.now() - timedelta(hours=3)).isoformat(), 'content_length': 10},
+        {'timestamp': datetime.now().isoformat(), 'content_length': 20},
+    ]
+    session['north']['observed_patterns'] = [
+        {'timestamp': datetime.now().isoformat(), 'pattern': 'Appends dominate writes'}
+    ]
+    return session
+
+
+def test_sqlite_round_trip():
+    """SQLite backend returns exactly what was saved"""
+    print("\n" + "=" * 70)
+    print("TEST 1: SQLite round trip")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        session = _sample_session()
+
+        state = SessionState(workspace_dir=tmp, backend='sqlite')
+        state.save_session(session)
+        assert state.state_file.endswith('session.db')
+        print(f"✅ Saved session to {state.state_file}")
+
+        # Backend is detected from the existing file
+        reopened = SessionState(workspace_dir=tmp)
+        assert reopened.backend == 'sqlite'
+        assert reopened.load_session() == session
+        print("✅ Loaded session matches saved data")
+
+        reopened.clear_session()
+        assert not reopened.exists()
+        assert reopened.load_session() is None
+        print("✅ Session cleared")
+
+
+def test_sqlite_query_actions():
+    """Time-range queries only return matching actions"""
+    print("\n" + "=" * 70)
+    print("TEST 2: SQLite query_actions()")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        state = SessionState(workspace_dir=tmp, backend='sqlite')
+        state.save_session(_sample_session())
+
+        since = (datetime.now() - timedelta(hours=1)).isoformat()
+        recent = state.query_actions('south', 'content_written', since=since)
+        assert len(recent) == 1 and recent[0]['content_length'] == 20
+        print("✅ Writes in the last hour: 1")
+
+        state.append_action('north', 'observed_patterns', {
+            'timestamp': datetime.now().isoformat(),
+            'pattern': 'Second pattern'
+        })
+        patterns = state.query_actions('north', 'observed_patterns')
+        assert [p['pattern'] for p in patterns] == ['Appends dominate writes', 'Second pattern']
+        assert state.query_actions('north', 'observed_patterns', limit=1)[0]['pattern'] == 'Second pattern'
+        print("✅ Appended pattern returned in order")
+
+
+def test_update_session_data_sqlite():
+    """update_session_data() appends rows and refreshes stats"""
+    print("\n" + "=" * 70)
+    print("TEST 3: update_session_data() with SQLite storage")
+    print("=" * 70)
+
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            os.chdir(tmp)
+            state = SessionState(backend='sqlite')
+            state.save_session(_sample_session())
+
+            update_session_data('south', 'files_added', {'path': '/a.md', 'filename': 'a.md'})
+            update_session_data('south', 'collaborations', {'collaborator_email': 'a@example.com'})
+            update_session_data('south', 'collaborations', {'collaborator_email': 'a@example.com'})
+
+            session = get_active_session()
+            assert len(session['south']['files_added']) == 1
+            assert session['stats']['total_files'] == 1
+            assert session['stats']['total_writes'] == 2
+            assert session['stats']['total_collaborators'] == 1
+            assert session['stats']['completion_percentage'] == 50
+            print("✅ Rows appended and stats recalculated")
+
+            calls = {'connect': 0, 'schema': 0}
+            original_connect, original_schema = SQLiteSessionStorage._connect, SQLiteSessionStorage._create_schema
+
+            def counting_connect(self):
+                calls['connect'] += 1
+                return original_connect(self)
+
+            def counting_schema(self, conn):
+                calls['schema'] += 1
+                return original_schema(self, conn)
+
+            SQLiteSessionStorage._connect, SQLiteSessionStorage._create_schema = counting_connect, counting_schema
+            try:
+                update_session_data('south', 'files_added', {'path': '/b.md', 'filename': 'b.md'})
+            finally:
+                SQLiteSessionStorage._connect, SQLiteSessionStorage._create_schema = original_connect, original_schema
+            assert calls == {'connect': 2, 'schema': 0}, calls  # Locate the session, then one transaction
+            assert get_active_session()['stats']['total_files'] == 2
+            print("✅ One connection per update; schema not re-created")
+        finally:
+            os.chdir(original_cwd)
+
+
+def test_json_import_export():
+    """Sessions move between backends through JSON"""
+    print("\n" + "=" * 70)
+    print("TEST 4: JSON import/export")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        session = _sample_session()
+        json_state = SessionState(workspace_dir=os.path.join(tmp, 'a'), backend='json')
+        json_state.save_session(session)
+
+        export_path = os.path.join(tmp, 'export.json')
+        json_state.export_json(export_path)
+
+        sqlite_state = SessionState(workspace_dir=os.path.join(tmp, 'b'), backend='sqlite')
+        sqlite_state.import_json(export_path)
+        assert sqlite_state.load_session() == session
+        print("✅ JSON export imported into SQLite unchanged")
+
+
+def test_compact_json_format():
+    """Compact files carry a format marker; pretty files still load"""
+    print("\n" + "=" * 70)
+    print("TEST 5: Compact JSON format")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        session = _sample_session()
+
+        pretty = JSONSessionStorage(tmp, json_format='pretty')
+        pretty.save(session)
+        with open(pretty.path) as f:
+            assert FORMAT_KEY not in f.read()
+        pretty_size = os.path.getsize(pretty.path)
+
+        # A compact reader loads the legacy pretty file unchanged
+        compact = JSONSessionStorage(tmp, json_format='compact')
+        assert compact.load() == session
+        print("✅ Legacy pretty session.json loads in compact mode")
+
+        compact.save(session)
+        with open(compact.path) as f:
+            assert f'"{FORMAT_KEY}":"compact"' in f.read()
+        assert os.path.getsize(compact.path) < pretty_size
+        assert compact.load() == session
+        assert pretty.load() == session
+        print("✅ Compact session.json round-trips and is smaller")
+
+
+def test_unreadable_session_skipped():
+    """A corrupt session file falls through to the parent workspace"""
+    print("\n" + "=" * 70)
+    print("TEST 6: Unreadable session files are skipped")
+    print("=" * 70)
+
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            SessionState(workspace_dir=tmp).save_session(_sample_session('parent-session'))
+            for backend, name in (('json', 'session.json'), ('sqlite', 'session.db')):
+                child = os.path.join(tmp, f'child-{backend}')
+                os.makedirs(os.path.join(child, '.simexp'))
+                with open(os.path.join(child, '.simexp', name), 'w') as f:
+                    f.write('{"session_id": "broken"')
+                os.chdir(child)
+                assert get_active_session()['session_id'] == 'parent-session', backend
+            print("✅ Broken session.json / session.db skipped; parent session found")
+        finally:
+            os.chdir(original_cwd)
+
+
+def main():
+    """Run all storage tests"""
+    test_sqlite_round_trip()
+    test_sqlite_query_actions()
+    test_update_session_data_sqlite()
+    test_json_import_export()
+    test_compact_json_format()
+    test_unreadable_session_skipped()
+    print("\n🎉 ALL SESSION STORAGE TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
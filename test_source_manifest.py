@@ -0,0 +1,161 @@
+"""
+Test Suite for the Source Manifest Scheduler
+
+Tests source_manifest and `simexp extract --due`:
+- Intervals, priorities and host rates are parsed from the manifest
+- Only sources past their interval are due, by priority, with failure backoff
+- HostLimiter spaces requests to rate-limited hosts
+- run_extraction(due=True) skips sources fetched recently
+
+♠️🌿🎸🧵 G.Music Assembly - Source Scheduling
+"""
+
+import os
+import time
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import yaml
+
+from simexp import simex
+from simexp.simfetcher import HostLimiter
+from simexp.source_manifest import parse_interval, load_manifest, SourceState, due_sources
+
+PAGE = b"<html><body><div><div><div><div><p>Scheduled</p></div></div></div></div></body></html>"
+
+
+def test_manifest_and_due_sources():
+    """Due sources are selected by interval and ordered by priority"""
+    print("\n" + "=" * 70)
+    print("TEST 1: Manifest parsing and due selection")
+    print("=" * 70)
+
+    assert parse_interval('30m') == 1800 and parse_interval('1d') == 86400 and parse_interval(90) == 90
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'sources.yaml')
+        with open(path, 'w') as f:
+            yaml.safe_dump({
+                'defaults': {'interval': '1h'},
+                'hosts': {'Example.com': {'rate': 2}},
+                'sources': [
+                    {'url': 'https://example.com/a', 'filename': 'a'},
+                    {'url': 'https://example.com/b', 'filename': 'b', 'priority': 5},
+                    {'url': 'https://example.com/c', 'filename': 'c', 'interval': '10m'},
+                    {'url': 'https://example.com/d', 'filename': 'd'},
+                ],
+            }, f)
+        manifest = load_manifest(path)
+        assert manifest['host_rates'] == {'example.com': 2.0}
+        assert [s['interval'] for s in manifest['sources']] == [3600, 3600, 600, 3600]
+        print("✅ Defaults, per-source intervals and host rates")
+
+        now = datetime(2025, 1, 1, 12, 0)
+        state = SourceState(os.path.join(tmp, 'sources.db'))
+        state.record([{'url': 'https://example.com/a', 'success': True},
+                      {'url': 'https://example.com/c', 'success': True}], when=now - timedelta(minutes=30))
+        state.record([{'url': 'https://example.com/d', 'success': False, 'error': 'boom'}],
+                     when=now - timedelta(minutes=1))
+
+        due = due_sources(manifest['sources'], state.load(), now=now)
+        assert [s['filename'] for s in due] == ['b', 'c'], due
+        assert [s['filename'] for s in due_sources(manifest['sources'], state.load(), now=now, limit=1)] == ['b']
+        print("✅ Recent successes and failures in backoff are skipped; priority first")
+
+        later = now + timedelta(minutes=10)
+        assert 'd' in [s['filename'] for s in due_sources(manifest['sources'], state.load(), now=later)]
+        assert state.load()['https://example.com/d']['last_error'] == 'boom'
+        print("✅ Failed sources retried after the backoff")
+
+
+def test_host_rate_limit():
+    """Requests to a rate-limited host are spaced out"""
+    print("\n" + "=" * 70)
+    print("TEST 2: Per-host rate limit")
+    print("=" * 70)
+
+    limiter = HostLimiter(per_host=4, rates={'slow.example': 10})
+    starts = []
+
+    def hit(url):
+        with limiter(url):
+            starts.append((url, time.monotonic()))
+
+    threads = [threading.Thread(target=hit, args=(url,))
+               for url in ['http://slow.example/1', 'http://slow.example/2', 'http://slow.example/3',
+                           'http://slow.example/4', 'http://fast.example/1', 'http://fast.example/2']]
+    began = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    slow = sorted(t for url, t in starts if 'slow' in url)
+    fast = [t for url, t in starts if 'fast' in url]
+    assert slow[-1] - slow[0] >= 0.28
+    assert max(fast) - began < 0.1
+    print(f"✅ 4 requests at 10/s spread over {slow[-1] - slow[0]:.2f}s; other hosts unaffected")
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_run_extraction_due():
+    """--due fetches new sources once, then nothing until the interval passes"""
+    print("\n" + "=" * 70)
+    print("TEST 3: run_extraction(due=True)")
+    print("=" * 70)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    original_config = simex.CONFIG_FILE
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            simex.CONFIG_FILE = os.path.join(tmp, 'simexp.yaml')
+            with open(simex.CONFIG_FILE, 'w') as f:
+                yaml.safe_dump({'BASE_PATH': tmp}, f)
+            with open(os.path.join(tmp, 'sources.yaml'), 'w') as f:
+                yaml.safe_dump({'sources': [
+                    {'url': f"{base}/hourly", 'interval': '1h'},
+                    {'url': f"{base}/often", 'interval': 1, 'priority': 9},
+                ]}, f)
+
+            first = simex.run_extraction(due=True, force=True)
+            assert [result['filename'] for _, result, _ in first] == ['often', 'hourly']
+            assert all(result['success'] for _, result, _ in first)
+
+            time.sleep(1.1)
+            second = simex.run_extraction(due=True, force=True)
+            assert [result['filename'] for _, result, _ in second] == ['often']
+            assert PageHandler.hits == 3
+    finally:
+        simex.CONFIG_FILE = original_config
+        server.shutdown()
+    print("✅ Only sources past their interval were fetched")
+
+
+def main():
+    """Run all source manifest tests"""
+    test_manifest_and_due_sources()
+    test_host_rate_limit()
+    test_run_extraction_due()
+    print("\n🎉 ALL SOURCE MANIFEST TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Test Suite for CLI Startup Time
+
+Guards the lazy imports that keep local-only commands fast:
+- Importing simexp loads no Playwright, BeautifulSoup, requests, pyperclip or PyYAML
+- `session url`, `session info`, `session list` and `session search` stay light
+- `python -X importtime -c "import simexp"` stays under IMPORT_BUDGET_MS
+
+The MCP server shells out to the CLI for every tool call, so startup time
+is paid on each one.
+
+♠️🌿🎸🧵 G.Music Assembly - CLI Startup
+"""
+
+import os
+import re
+import sys
+import json
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+HEAVY_MODULES = ('playwright', 'bs4', 'requests', 'urllib3', 'pyperclip', 'yaml', 'lxml', 'pyarrow')
+IMPORT_BUDGET_MS = 100
+LOCAL_COMMANDS = (['session', 'url'], ['session', 'info'], ['session', 'list'], ['session', 'search', 'notes'])
+
+PROBE = """
+import sys, json
+heavy = json.loads(sys.argv[2])
+sys.argv = ['simexp'] + json.loads(sys.argv[1])
+from simexp.simex import main
+try:
+    main()
+except SystemExit:
+    pass
+print('LOADED=' + json.dumps([m for m in heavy if m in sys.modules]))
+"""
+
+
+def _env(home=None):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)  # Measure with cached bytecode, as installed
+    if home:
+        env['HOME'] = home
+    return env
+
+
+def _loaded_heavy(args, cwd, home):
+    result = subprocess.run([sys.executable, '-c', PROBE, json.dumps(args), json.dumps(HEAVY_MODULES)],
+                            cwd=cwd, env=_env(home), capture_output=True, text=True, timeout=60)
+    match = re.search(r'^LOADED=(.*)$', result.stdout, re.M)
+    assert match, result.stdout + result.stderr
+    return json.loads(match.group(1))
+
+
+def test_import_is_light():
+    """Importing the CLI loads none of the heavy dependencies"""
+    print("\n" + "=" * 70)
+    print("TEST 1: Heavy dependencies are not imported with simexp")
+    print("=" * 70)
+
+    code = f"import sys, simexp; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=_env(),
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == '[]', result.stdout
+    print("✅ import simexp loads no Playwright, bs4, requests, pyperclip or yaml")
+
+
+def test_local_commands_are_light():
+    """Commands that only read local session files stay light"""
+    print("\n" + "=" * 70)
+    print("TEST 2: Local-only commands")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        home, workspace = os.path.join(tmp, 'home'), os.path.join(tmp, 'work')
+        os.makedirs(home)
+        os.makedirs(os.path.join(workspace, '.simexp'))
+        with open(os.path.join(workspace, '.simexp', 'session.json'), 'w') as f:
+            json.dump({'session_id': 'startup', 'search_key': 'startup', 'created_at': '2025-01-01T00:00:00',
+                       'note_url': 'https://app.simplenote.com/p/startup'}, f)
+
+        for args in LOCAL_COMMANDS:
+            assert _loaded_heavy(args, workspace, home) == [], args
+            print(f"✅ simexp {' '.join(args)}: no heavy imports")
+
+
+def test_import_time_budget():
+    """python -X importtime reports simexp under the budget"""
+    print("\n" + "=" * 70)
+    print(f"TEST 3: Import time under {IMPORT_BUDGET_MS} ms")
+    print("=" * 70)
+
+    timings = []
+    for _ in range(4):  # First run writes the bytecode cache
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import simexp'], cwd=ROOT,
+                                env=_env(), capture_output=True, text=True, timeout=60)
+        assert result.returncode == 0, result.stderr
+        match = re.search(r'^import time:\s+\d+ \|\s+(\d+) \| simexp$', result.stderr, re.M)
+        assert match, result.stderr[-2000:]
+        timings.append(int(match.group(1)) / 1000)
+
+    best = min(timings[1:])
+    assert best < IMPORT_BUDGET_MS, f"import simexp took {best:.1f} ms (budget {IMPORT_BUDGET_MS} ms)"
+    print(f"✅ import simexp: {best:.1f} ms (runs: {', '.join(f'{t:.0f}' for t in timings[1:])} ms)")
+
+
+def main():
+    """Run all startup tests"""
+    test_import_is_light()
+    test_local_commands_are_light()
+    test_import_time_budget()
+    print("\n🎉 ALL STARTUP TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Test Suite for Streaming Extraction
+
+Tests bounded-memory extraction of large pages:
+- MarkdownStreamParser matches clean_html() on chunked input
+- Streaming run_extraction() writes the same file as the normal path
+- The size cap truncates oversized pages
+- Peak memory stays well below the page size
+
+♠️🌿🎸🧵 G.Music Assembly - Streaming Extraction
+"""
+
+import os
+import tempfile
+import threading
+import tracemalloc
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import yaml
+
+from simexp import simex
+from simexp.processor import clean_html, MarkdownStreamParser
+from bench_processor import synthetic_page
+
+PAGES = {}
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    """Serves PAGES[path] (pre-encoded bytes) in 64KB writes"""
+
+    def do_GET(self):
+        body = PAGES[self.path]
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        for i in range(0, len(body), 65536):
+            self.wfile.write(body[i:i + 65536])
+
+    def log_message(self, *args):
+        pass
+
+
+def _stream_convert(html, chunk_size):
+    lines = []
+    parser = MarkdownStreamParser(lines.append)
+    for i in range(0, len(html), chunk_size):
+        parser.feed(html[i:i + chunk_size])
+    parser.close()
+    return '\n'.join(lines).strip(), parser.title
+
+
+def test_stream_parser_matches_clean_html():
+    """Chunked streaming conversion equals the tree-based conversion"""
+    print("\n" + "=" * 70)
+    print("TEST 1: Streaming parser parity")
+    print("=" * 70)
+
+    page = (
+        "<html><head><title> Stream </title></head><body><div><div><div><div>"
+        "<h1>Top</h1><p>Para <code>c</code> &amp; more</p>"
+        "<ul><li>a<ul><li>a1</li><li><p>a2</p><p>more</p></li></ul></li><li>b</li></ul>"
+        "<blockquote><p>q</p><p>r</p></blockquote><h2>Sub</h2><script>bad()</script>"
+        "<p>after<br>break</p></div></div></div></div><div>other</div></body></html>"
+    )
+    for html in (page, synthetic_page(200)):
+        for chunk_size in (7, 4096):
+            markdown, _ = _stream_convert(html, chunk_size)
+            assert markdown == clean_html(html)
+    assert _stream_convert(page, 5)[1] == 'Stream'
+    print("✅ Identical Markdown for 7-byte and 4KB chunks")
+
+
+def test_streaming_run_extraction():
+    """Streaming mode writes the same file, honours the cap, bounds memory"""
+    print("\n" + "=" * 70)
+    print("TEST 2: Streaming run_extraction()")
+    print("=" * 70)
+
+    big = synthetic_page(1000)
+    PAGES['/normal'] = PAGES['/streamed'] = big.encode('utf-8')
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    original_config = simex.CONFIG_FILE
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            simex.CONFIG_FILE = os.path.join(tmp, 'simexp.yaml')
+            with open(simex.CONFIG_FILE, 'w') as f:
+                yaml.safe_dump({'BASE_PATH': tmp}, f)
+
+            normal = simex.run_extraction(urls=[f"{base}/normal"], force=True)[0][1]
+
+            tracemalloc.start()
+            streamed = simex.run_extraction(urls=[f"{base}/streamed"], stream=True)[0][1]
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            assert streamed['success'] and not streamed['truncated']
+            with open(normal['path']) as a, open(streamed['path']) as b:
+                assert a.read() == b.read()
+            print("✅ Streamed file identical to the normal extraction")
+
+            assert peak < len(big) / 2, f"peak {peak} vs page {len(big)}"
+            print(f"✅ Peak memory {peak / 1024:.0f} KB for a {len(big) / 1024:.0f} KB page")
+
+            capped = simex.run_extraction(urls=[f"{base}/streamed"], stream=True, max_bytes=100 * 1024)[0][1]
+            assert capped['success'] and capped['truncated']
+            assert os.path.getsize(capped['path']) < os.path.getsize(normal['path']) / 10
+            print("✅ Size cap truncates oversized pages")
+    finally:
+        simex.CONFIG_FILE = original_config
+        server.shutdown()
+
+
+def main():
+    """Run all streaming extraction tests"""
+    test_stream_parser_matches_clean_html()
+    test_streaming_run_extraction()
+    print("\n🎉 ALL STREAMING EXTRACTION TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()